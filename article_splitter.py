@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Découpage des codes juridiques en articles, en une seule passe
+
+Une unique expression régulière précompilée repère tous les jetons de
+frontière du texte : en-têtes d'articles (`Article 12`, `Art. 5-1`,
+`Article premier`) et intitulés de structure (LIVRE, TITRE, CHAPITRE,
+SECTION). Le contenu d'un article s'étend jusqu'au jeton suivant, ce qui
+évite la construction paresseuse `(.*?)(?=...)` coûteuse sur les longues pages.
+Chaque article est émis avec son chemin structurel (livre, titre, chapitre…).
+"""
+
+import bisect
+import re
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Niveaux de la hiérarchie, du plus englobant au plus fin
+NIVEAUX = ('LIVRE', 'TITRE', 'CHAPITRE', 'SECTION', 'PARAGRAPHE')
+
+# Mots-clés de frontière ; un libellé de structure s'arrête devant eux.
+# Factorisés par initiale : ce test est répété à chaque caractère du libellé
+_MOTS_CLES = r"(?:A(?:RTICLE|rticle|RT\.|rt\.)|LIVRE|TITRE|CHAPITRE|SECTION|PARAGRAPHE)"
+
+# Préfiltre : une alternative de littéraux est balayée bien plus vite que le
+# motif complet, qui n'est ensuite essayé qu'aux positions candidates
+_CANDIDATE_PATTERN = re.compile(
+    r"Article|ARTICLE|Art\.|ART\.|LIVRE|Livre|TITRE|Titre|CHAPITRE|Chapitre"
+    r"|SECTION|Section|PARAGRAPHE|Paragraphe"
+)
+
+BOUNDARY_PATTERN = re.compile(
+    r"(?:"
+    # En-tête d'article ; une référence (« l'article 12 du présent code »,
+    # « Article 3, alinéa 2 ») n'est pas une frontière
+    r"(?P<article>(?:Article|ARTICLE)\s+|(?:Art|ART)\.\s*)"
+    # Préfixe éventuel de partie législative / réglementaire (« ARTICLE L 2 », « Art. R. 12 »)
+    r"(?P<numero>(?:[LRD]\.?\s*)?(?:\d+|premier|PREMIER|1er)(?:[.\-]\d+)*"
+    r"(?:\s+(?:bis|ter|quater|quinquies|sexies|BIS|TER|QUATER))?)"
+    r"(?!\w|\s*,|\s+[a-zà-ÿ])"
+    r"|"
+    # Intitulé de structure : niveau, rang puis libellé en capitales
+    r"(?P<niveau>LIVRE|Livre|TITRE|Titre|CHAPITRE|Chapitre|SECTION|Section|PARAGRAPHE|Paragraphe)"
+    r"\s+(?P<rang>PREMI(?:ER|ERE|ÈRE)|[Pp]remi(?:er|ère|ere)|[A-ZÀ-Ýa-zà-ÿ]+(?:IEME|IÈME|ième|ieme)"
+    r"|UNIQUE|[Uu]nique|[IVXLC]+|\d+)(?!\w)"
+    r"(?P<libelle>(?:(?!\s*" + _MOTS_CLES + r")[^a-zà-ÿ](?![a-zà-ÿ])){0,200})"
+    r")"
+)
+
+# Caractères qui, collés devant un jeton, en font un mot (« l'Article 3 »)
+_LETTRES = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz’'"
+    + "".join(chr(c) for c in range(ord("À"), ord("ÿ") + 1) if c not in (ord("×"), ord("÷")))
+)
+
+
+def iter_boundaries(text: str, pos: int = 0):
+    """Produire les jetons de frontière de `text` à partir de `pos`, dans l'ordre"""
+    fin = pos
+    for candidat in _CANDIDATE_PATTERN.finditer(text, pos):
+        debut = candidat.start()
+        if debut < fin:
+            continue
+        # Un jeton collé à un mot (« l'Article 3 ») n'est pas une frontière
+        if debut > 0 and text[debut - 1] in _LETTRES:
+            continue
+        match = BOUNDARY_PATTERN.match(text, debut)
+        if match:
+            fin = match.end()
+            yield match
+
+
+# Repli historique : sections numérotées « 1. Intitulé »
+NUMBERED_SECTION_PATTERN = re.compile(r"(\d+\.\s*[A-Z][^.]*\.?)(.*?)(?=(\d+\.\s*[A-Z]|$))", re.S)
+
+_PONCTUATION_INITIALE = re.compile(r"^[\s.:–\-]+")
+_ESPACES = re.compile(r"\s+")
+
+# Longueur au-delà de laquelle un jeton ne peut plus être prolongé par la suite du texte
+_MARGE = 300
+
+
+def _intitule(match) -> str:
+    """Construire l'intitulé normalisé d'un jeton de structure"""
+    libelle = _ESPACES.sub(" ", match.group('libelle')).strip(" :.-–")
+    intitule = f"{match.group('niveau').upper()} {match.group('rang').upper()}"
+    return f"{intitule} : {libelle}" if libelle else intitule
+
+
+def _nettoyer_contenu(text: str) -> str:
+    return _PONCTUATION_INITIALE.sub("", text).strip()
+
+
+class ArticleSplitter:
+    """
+    Découpeur incrémental : le texte est fourni par morceaux via `feed`.
+
+    Seul l'article en cours (non encore terminé par un jeton suivant) est
+    conservé entre deux appels ; les articles clos sont renvoyés aussitôt.
+    Chaque morceau peut porter une `page` : un article est émis avec celle
+    du morceau où commence son en-tête.
+    """
+
+    def __init__(self):
+        # Intitulés englobants sous forme de couples (niveau, intitulé)
+        self._chemin: List[Tuple[int, str]] = []
+        self.chemin: Tuple[str, ...] = ()
+        self.position = 0
+        self._buffer = ""
+        self._reprise = 0
+        self._courant = None
+        # Début de chaque morceau dans le tampon et page correspondante
+        self._debuts: List[int] = []
+        self._pages: List[Any] = []
+
+    def _emettre(self, contenu: str):
+        numero, chemin, page = self._courant
+        self.position += 1
+        return {
+            'numero': numero,
+            'contenu': _nettoyer_contenu(contenu),
+            'chemin': chemin,
+            'position': self.position,
+            'page': page,
+        }
+
+    def _page(self, pos: int):
+        i = bisect.bisect_right(self._debuts, pos) - 1
+        return self._pages[i] if i >= 0 else None
+
+    def _appliquer_intitule(self, match):
+        # Un intitulé remplace ceux de même niveau ou de niveau inférieur
+        niveau = NIVEAUX.index(match.group('niveau').upper())
+        self._chemin = [entree for entree in self._chemin if entree[0] < niveau]
+        self._chemin.append((niveau, _intitule(match)))
+        self.chemin = tuple(intitule for _niveau, intitule in self._chemin)
+
+    def feed(self, text: str, final: bool = False, page: Any = None) -> List[Dict[str, Any]]:
+        """Ajouter du texte ; renvoie les articles terminés par ce morceau"""
+        if text:
+            self._debuts.append(len(self._buffer))
+            self._pages.append(page)
+        self._buffer += text
+        articles = []
+        debut = 0
+        # Les jetons proches de la fin peuvent dépendre du morceau suivant
+        limite = len(self._buffer) if final else len(self._buffer) - _MARGE
+
+        for match in iter_boundaries(self._buffer, self._reprise):
+            if match.end() > limite:
+                break
+            if self._courant is not None:
+                articles.append(self._emettre(self._buffer[debut:match.start()]))
+                self._courant = None
+            if match.group('article'):
+                numero = f"{match.group('article').strip()} {match.group('numero')}"
+                self._courant = (numero, self.chemin, self._page(match.start()))
+            else:
+                self._appliquer_intitule(match)
+            debut = match.end()
+
+        if final:
+            if self._courant is not None:
+                articles.append(self._emettre(self._buffer[debut:]))
+                self._courant = None
+            self._buffer = ""
+            self._reprise = 0
+            self._debuts, self._pages = [], []
+        else:
+            # Ne conserver que l'article en cours ; la prochaine recherche
+            # reprend juste avant la zone non encore validée
+            self._buffer = self._buffer[debut:]
+            self._reprise = max(0, len(self._buffer) - 2 * _MARGE)
+            premier = max(0, bisect.bisect_right(self._debuts, debut) - 1)
+            self._debuts = [max(0, d - debut) for d in self._debuts[premier:]]
+            self._pages = self._pages[premier:]
+        return articles
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Terminer le découpage et renvoyer le dernier article"""
+        return self.feed("", final=True)
+
+
+def iter_intitules(text: str) -> Iterator[Tuple[int, str]]:
+    """Produire les intitulés de structure de `text` sous forme (niveau, intitulé)"""
+    for match in iter_boundaries(text):
+        if match.group('niveau'):
+            yield NIVEAUX.index(match.group('niveau').upper()), _intitule(match)
+
+
+def iter_articles(morceaux) -> Iterator[Dict[str, Any]]:
+    """Découper un flux de morceaux de texte (pages) en articles"""
+    splitter = ArticleSplitter()
+    for morceau in morceaux:
+        yield from splitter.feed(morceau)
+    yield from splitter.close()
+
+
+def decouper_articles(text: str) -> List[Dict[str, Any]]:
+    """
+    Découper un texte complet en articles.
+
+    Chaque article est un dictionnaire contenant `numero`, `contenu`,
+    `chemin` (tuple des intitulés englobants) et `position` (à partir de 1).
+    Si aucun en-tête d'article n'est trouvé, le texte est découpé selon ses
+    sections numérotées.
+    """
+    articles = list(iter_articles([text]))
+    if articles:
+        return articles
+
+    return [
+        {'numero': numero.strip(), 'contenu': contenu.strip(), 'chemin': (), 'position': i, 'page': None}
+        for i, (numero, contenu, _suivant) in enumerate(NUMBERED_SECTION_PATTERN.findall(text), 1)
+    ]
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Magasin binaire compact des articles, lu par projection mémoire (mmap)
+
+Les champs répétés d'un article à l'autre (catégorie, préfixe du titre,
+langue, dates...) sont stockés une seule fois dans une table de chaînes ;
+les champs propres à chaque article (identifiant, fin du titre, contenu,
+résumé, mots-clés, clé de recherche) sont concaténés en UTF-8 dans un bloc
+unique. Le lecteur projette le fichier en mémoire en lecture seule et
+décode un article à la demande : plusieurs processus d'un serveur
+partagent ainsi les mêmes pages.
+
+Structure du fichier (petit-boutiste) :
+    en-tête      : MAGIC, version, nombre d'articles, nombre de chaînes,
+                   position de chaque section
+    chaînes      : décalages (u32 × n+1) puis octets UTF-8
+    enregistrements : un RECORD de taille fixe par article
+    champs       : décalages dans le bloc (u32 × 6·articles+1)
+    identifiants : positions des articles triées par identifiant (u32)
+    bloc         : champs variables en UTF-8
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from array import array
+from typing import Any, Dict, Iterator, List, Optional
+
+MAGIC = b"YOONART\x00"
+VERSION = 2
+
+# magic, version, articles, chaînes, puis positions des sections
+HEADER = struct.Struct("<8sIII6Q")
+
+# texte_juridique_id, position_ordre, views_count, is_published, puis index
+# dans la table de chaînes : catégorie, préfixe du titre, langue,
+# published_by, created_at, updated_at
+RECORD = struct.Struct("<iiIB3x6I")
+
+# Champs variables de chaque article, dans l'ordre du bloc
+BLOB_FIELDS = ('id', 'title', 'content', 'summary', 'tags', 'search_key')
+_TAG_SEPARATOR = "\x1f"
+_TITLE_SEPARATOR = " - "
+
+# Index de chaîne signifiant « absent » (None, ou titre sans préfixe)
+NONE = 0xFFFFFFFF
+
+DEFAULT_STORE_PATH = "public/legal_articles.bin"
+
+
+class ArticleStoreWriter:
+    """
+    Écrivain du magasin, alimenté article par article.
+
+    Le contenu des articles est écrit au fil de l'eau dans un fichier
+    temporaire ; seuls les enregistrements de taille fixe et la table des
+    chaînes restent en mémoire jusqu'à `close`.
+    """
+
+    def __init__(self, output_path: str = DEFAULT_STORE_PATH):
+        self.output_path = output_path
+        self.count = 0
+        self._strings: Dict[str, int] = {}
+        self._records = bytearray()
+        self._fields = array('I', [0])
+        self._ids: List[str] = []
+        self._blob = tempfile.TemporaryFile()
+        self._blob_size = 0
+
+    def _string(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE
+        return self._strings.setdefault(value, len(self._strings))
+
+    def write(self, article: Dict[str, Any]):
+        title = article.get('title', '')
+        prefix, separator, suffix = title.partition(_TITLE_SEPARATOR)
+        if not separator:
+            prefix, suffix = None, title
+
+        texte_id = article.get('texte_juridique_id')
+        self._records += RECORD.pack(
+            -1 if texte_id is None else int(texte_id),
+            int(article.get('position_ordre') or 0),
+            int(article.get('views_count', 0)),
+            1 if article.get('is_published', True) else 0,
+            self._string(article.get('category', '')),
+            self._string(prefix),
+            self._string(article.get('language', 'fr')),
+            self._string(article.get('published_by')),
+            self._string(article.get('created_at', '')),
+            self._string(article.get('updated_at', '')),
+        )
+
+        values = (
+            str(article['id']),
+            suffix,
+            article.get('content', ''),
+            article.get('summary', ''),
+            _TAG_SEPARATOR.join(article.get('tags') or []),
+            article.get('search_key', ''),
+        )
+        for value in values:
+            data = value.encode('utf-8')
+            self._blob.write(data)
+            self._blob_size += len(data)
+            self._fields.append(self._blob_size)
+
+        self._ids.append(values[0])
+        self.count += 1
+
+    def close(self) -> str:
+        """Assembler le fichier final ; renvoie son chemin"""
+        strings = [s.encode('utf-8') for s in self._strings]
+        string_offsets = array('I', [0])
+        for data in strings:
+            string_offsets.append(string_offsets[-1] + len(data))
+
+        ids = array('I', sorted(range(self.count), key=self._ids.__getitem__))
+
+        sections = [
+            string_offsets.tobytes() + b''.join(strings),
+            bytes(self._records),
+            self._fields.tobytes(),
+            ids.tobytes(),
+        ]
+        positions = []
+        position = HEADER.size
+        for section in sections:
+            positions.append(position)
+            position += len(section)
+        # Section des chaînes : début des octets UTF-8 après les décalages
+        positions.insert(1, positions[0] + len(string_offsets) * string_offsets.itemsize)
+        positions.append(position)  # bloc
+
+        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+        with open(self.output_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.count, len(strings), *positions))
+            for section in sections:
+                f.write(section)
+            self._blob.seek(0)
+            shutil.copyfileobj(self._blob, f)
+        self._blob.close()
+
+        return self.output_path
+
+
+def save_article_store(articles, output_path: str = DEFAULT_STORE_PATH) -> str:
+    """Écrire le magasin d'une suite d'articles"""
+    writer = ArticleStoreWriter(output_path)
+    for article in articles:
+        writer.write(article)
+    return writer.close()
+
+
+class ArticleStore:
+    """
+    Lecteur du magasin : accès direct par position ou par identifiant.
+
+    Le fichier est projeté en lecture seule ; aucun article n'est décodé
+    avant d'être demandé.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self._count, self._nstrings, self._string_offsets,
+         self._string_data, self._records, self._fields, self._ids, self._blob) = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} n'est pas un magasin d'articles (version {VERSION})")
+        self._string_cache: Dict[int, str] = {}
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _u32(self, base: int, index: int) -> int:
+        return struct.unpack_from("<I", self._mmap, base + 4 * index)[0]
+
+    def _string(self, index: int) -> Optional[str]:
+        if index == NONE:
+            return None
+        value = self._string_cache.get(index)
+        if value is None:
+            start = self._u32(self._string_offsets, index)
+            end = self._u32(self._string_offsets, index + 1)
+            value = self._mmap[self._string_data + start:self._string_data + end].decode('utf-8')
+            self._string_cache[index] = value
+        return value
+
+    def _field(self, position: int, field: int) -> str:
+        i = position * len(BLOB_FIELDS) + field
+        start, end = struct.unpack_from("<II", self._mmap, self._fields + 4 * i)
+        return self._mmap[self._blob + start:self._blob + end].decode('utf-8')
+
+    def article(self, position: int) -> Dict[str, Any]:
+        """Article à la position donnée (à partir de 0, dans l'ordre d'écriture)"""
+        if not 0 <= position < self._count:
+            raise IndexError(position)
+        (texte_id, position_ordre, views_count, is_published, category, prefix,
+         language, published_by, created_at, updated_at) = RECORD.unpack_from(
+            self._mmap, self._records + position * RECORD.size)
+
+        article_id, suffix, content, summary, tags, search_key = (
+            self._field(position, field) for field in range(len(BLOB_FIELDS)))
+        prefix = self._string(prefix)
+
+        return {
+            'id': article_id,
+            'title': suffix if prefix is None else f"{prefix}{_TITLE_SEPARATOR}{suffix}",
+            'category': self._string(category),
+            'content': content,
+            'summary': summary,
+            'language': self._string(language),
+            'tags': tags.split(_TAG_SEPARATOR) if tags else [],
+            'published_by': self._string(published_by),
+            'is_published': bool(is_published),
+            'views_count': views_count,
+            'created_at': self._string(created_at),
+            'updated_at': self._string(updated_at),
+            'texte_juridique_id': None if texte_id < 0 else texte_id,
+            'position_ordre': position_ordre,
+            'search_key': search_key,
+        }
+
+    def position(self, article_id: str) -> Optional[int]:
+        """Position d'un article d'après son identifiant (recherche dichotomique)"""
+        article_id = str(article_id)
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            position = self._u32(self._ids, middle)
+            current = self._field(position, 0)
+            if current < article_id:
+                low = middle + 1
+            elif current > article_id:
+                high = middle
+            else:
+                return position
+        return None
+
+    def get(self, article_id: str) -> Optional[Dict[str, Any]]:
+        """Article d'après son identifiant, ou None"""
+        position = self.position(article_id)
+        return None if position is None else self.article(position)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for position in range(self._count):
+            yield self.article(position)
+
+
+def main():
+    """Afficher le résumé d'un magasin et, éventuellement, un article"""
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_STORE_PATH
+    with ArticleStore(path) as store:
+        print(f"📦 {path} : {len(store)} articles, {os.path.getsize(path) / 1024:.0f} Ko")
+        if len(sys.argv) > 2:
+            article = store.get(sys.argv[2])
+            if article is None:
+                print(f"❌ Article {sys.argv[2]} introuvable")
+            else:
+                print(f"   {article['title']}")
+                print(f"   {article['content'][:200]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai des étapes d'extraction sur le corpus du dépôt
+
+Chaque étape est mesurée dans un processus séparé, sur senegal_juridique.sql
+et les PDF de inset/ :
+    sql_tokenize   découpage en jetons du dump
+    sql_rows       lecture des lignes de la table articles
+    pdf_text       extraction et nettoyage du texte des pages PDF (sans cache)
+    article_split  découpage en articles du texte des PDF
+    clean          conversion des lignes en articles de l'application
+    serialize      écriture JSON et TypeScript
+    index_build    index inversé et statistiques BM25
+    db_insert      insertion par lots des articles du dump avec loiv2, dans
+                   une base SQLite en mémoire (stockage.py)
+
+Pour chaque étape : durée (meilleure de N exécutions), pic de mémoire
+résidente (processus et sous-processus) et débits (articles/s, Mo/s ;
+les « articles » sont des jetons pour sql_tokenize et des pages pour
+pdf_text). Les résultats sont écrits en JSON ; comparés à une référence
+enregistrée, ils font échouer le banc (code de sortie 1) si une étape
+ralentit ou consomme plus de mémoire au-delà du seuil.
+
+La référence bench_baseline.json est versionnée ; avec --verifier, une
+référence absente ou incomplète fait aussi échouer le banc (code 2).
+
+Exemples :
+    python3 bench_extraction.py --verifier
+    python3 bench_extraction.py --enregistrer-reference
+    python3 bench_extraction.py --stage article_split --stage clean
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+SQL_PATH = "senegal_juridique.sql"
+INSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "inset")
+
+DEFAULT_RESULTS_PATH = "bench_results.json"
+DEFAULT_BASELINE_PATH = "bench_baseline.json"
+
+# Dépassement toléré par rapport à la référence (0.25 = +25 %)
+DEFAULT_SEUIL = 0.25
+
+# En dessous de cette durée, l'écart relatif n'est que du bruit
+DUREE_MIN_COMPARAISON = 0.05
+
+REPETITIONS = 3
+
+MEGA = 1024 * 1024
+
+
+def _charger_loiv2():
+    """Importer inset/loiv2.py (dépendances PDF et MySQL chargées à la demande)"""
+    if INSET_DIR not in sys.path:
+        sys.path.insert(0, INSET_DIR)
+    import loiv2
+    return loiv2
+
+
+def _pdfs() -> List[str]:
+    return [
+        os.path.join(INSET_DIR, nom)
+        for nom in sorted(os.listdir(INSET_DIR))
+        if nom.lower().endswith(".pdf")
+    ]
+
+
+# ================================
+# Étapes : une préparation non mesurée, puis une fonction mesurée qui
+# renvoie (articles, octets traités)
+# ================================
+def _lignes_articles():
+    from sql_dump_reader import iter_table_records
+    return list(iter_table_records(SQL_PATH, 'articles'))
+
+
+def _articles():
+    from extract_legal_data_final import construire_article, extract_text_mapping
+    text_mapping = extract_text_mapping()
+    return [construire_article(row, text_mapping) for row in _lignes_articles()]
+
+
+def preparer_sql_tokenize():
+    return None
+
+
+def mesurer_sql_tokenize(_donnees):
+    from sql_dump_reader import iter_tokens
+    with open(SQL_PATH, 'r', encoding='utf-8') as f:
+        jetons = sum(1 for _ in iter_tokens(f))
+    return jetons, os.path.getsize(SQL_PATH)
+
+
+def preparer_sql_rows():
+    return None
+
+
+def mesurer_sql_rows(_donnees):
+    from sql_dump_reader import iter_table_records
+    lignes = sum(1 for _ in iter_table_records(SQL_PATH, 'articles'))
+    return lignes, os.path.getsize(SQL_PATH)
+
+
+def preparer_pdf_text():
+    _charger_loiv2()
+    return _pdfs()
+
+
+def mesurer_pdf_text(pdfs):
+    from PyPDF2 import PdfReader
+    loiv2 = _charger_loiv2()
+    pages = 0
+    for path in pdfs:
+        for page in PdfReader(path).pages:
+            loiv2.clean_text(page.extract_text())
+            pages += 1
+    return pages, sum(os.path.getsize(path) for path in pdfs)
+
+
+def preparer_article_split():
+    """Texte complet de chaque PDF, lu depuis le cache des pages"""
+    from PyPDF2 import PdfReader
+    loiv2 = _charger_loiv2()
+    cache = loiv2.PageTextCache()
+    textes = []
+    for path in _pdfs():
+        sha256 = loiv2.sha256_fichier(path)
+        pages = []
+        for index, page in enumerate(PdfReader(path).pages):
+            text = cache.get(sha256, index)
+            if text is None:
+                text = loiv2.clean_text(page.extract_text())
+                cache.put(sha256, index, text)
+            if text:
+                pages.append(text + "\n")
+        textes.append("".join(pages))
+    return textes
+
+
+def mesurer_article_split(textes):
+    from article_splitter import decouper_articles
+    articles = sum(len(decouper_articles(texte)) for texte in textes)
+    return articles, sum(len(texte.encode('utf-8')) for texte in textes)
+
+
+def preparer_clean():
+    return _lignes_articles()
+
+
+def mesurer_clean(lignes):
+    from extract_legal_data_final import construire_article, extract_text_mapping
+    text_mapping = extract_text_mapping()
+    octets = 0
+    for row in lignes:
+        construire_article(row, text_mapping)
+        octets += len((row['contenu_article'] or '').encode('utf-8'))
+    return len(lignes), octets
+
+
+def preparer_serialize():
+    return _articles()
+
+
+def mesurer_serialize(articles):
+    from legal_writers import write_json_articles, write_typescript_articles
+    with tempfile.TemporaryDirectory() as dossier:
+        json_path = os.path.join(dossier, "articles.json")
+        ts_path = os.path.join(dossier, "articles.ts")
+        write_json_articles(articles, json_path)
+        write_typescript_articles(articles, ts_path, header="Banc d'essai")
+        octets = os.path.getsize(json_path) + os.path.getsize(ts_path)
+    return len(articles), octets
+
+
+def preparer_index_build():
+    return _articles()
+
+
+def mesurer_index_build(articles):
+    from legal_ranking import calculer_statistiques_bm25
+    from search_index import construire_index_inverse
+    index = construire_index_inverse(articles)
+    index['bm25'] = calculer_statistiques_bm25(index)
+    return len(articles), sum(len(article.get('search_key', '').encode('utf-8')) for article in articles)
+
+
+def preparer_db_insert():
+    """Lignes (numero, titre, contenu) du dump, regroupées par texte"""
+    _charger_loiv2()
+    textes: Dict[Any, List[tuple]] = {}
+    for row in _lignes_articles():
+        textes.setdefault(row['texte_juridique_id'], []).append(
+            (row['numero_article'], row['titre_article'], row['contenu_article'] or '')
+        )
+    return list(textes.values())
+
+
+def mesurer_db_insert(textes):
+    loiv2 = _charger_loiv2()
+    from stockage import StockageSQLite
+    stockage = StockageSQLite(":memory:")
+    db = stockage.connecter()
+    cursor = db.cursor()
+    stockage.creer_tables(cursor)
+    articles = octets = 0
+    for numero_texte, lignes in enumerate(textes, 1):
+        pdf = dict(loiv2.PDFS[0], titre=f"Texte {numero_texte}")
+        reprise = loiv2.PointDeReprise(None, pdf, "0" * 64)
+        loiv2.inserer_texte(db, cursor, pdf, reprise)
+        articles += loiv2.inserer_articles(db, cursor, reprise, ((0, ligne) for ligne in lignes))
+        loiv2.terminer_import(db, cursor, reprise, pdf, {"pages": 0, "sha256": reprise.sha256})
+        octets += sum(len(contenu.encode('utf-8')) for _numero, _titre, contenu in lignes)
+    db.close()
+    return articles, octets
+
+
+STAGES = {
+    'sql_tokenize': (preparer_sql_tokenize, mesurer_sql_tokenize),
+    'sql_rows': (preparer_sql_rows, mesurer_sql_rows),
+    'pdf_text': (preparer_pdf_text, mesurer_pdf_text),
+    'article_split': (preparer_article_split, mesurer_article_split),
+    'clean': (preparer_clean, mesurer_clean),
+    'serialize': (preparer_serialize, mesurer_serialize),
+    'index_build': (preparer_index_build, mesurer_index_build),
+    'db_insert': (preparer_db_insert, mesurer_db_insert),
+}
+
+
+# ================================
+# Mesure (processus enfant)
+# ================================
+def _reinitialiser_pic_memoire() -> bool:
+    """Remettre à zéro VmHWM (Linux ≥ 4.0) pour exclure la préparation du pic"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def _pic_memoire_mo(reinitialise: bool) -> float:
+    """Pic de mémoire résidente du processus et de ses sous-processus"""
+    enfants = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    if reinitialise:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return max(int(line.split()[1]) / 1024, enfants)
+    return max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, enfants)
+
+
+def executer_etape(nom: str, repetitions: int = REPETITIONS) -> Dict[str, Any]:
+    """Mesurer une étape dans le processus courant"""
+    preparer, mesurer = STAGES[nom]
+    donnees = preparer()
+    reinitialise = _reinitialiser_pic_memoire()
+
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        articles, octets = mesurer(donnees)
+        durees.append(time.perf_counter() - debut)
+
+    duree = min(durees)
+    return {
+        'wall_s': round(duree, 4),
+        'peak_rss_mb': round(_pic_memoire_mo(reinitialise), 1),
+        'articles': articles,
+        'bytes': octets,
+        'articles_per_s': round(articles / duree, 1) if duree else None,
+        'mb_per_s': round(octets / MEGA / duree, 2) if duree else None,
+        'repetitions': repetitions,
+    }
+
+
+def mesurer_dans_processus(nom: str, repetitions: int) -> Dict[str, Any]:
+    """Mesurer une étape dans un nouveau processus (pic mémoire isolé)"""
+    resultat = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--enfant", nom, "--repetitions", str(repetitions)],
+        capture_output=True, text=True,
+    )
+    if resultat.returncode != 0:
+        raise RuntimeError(f"étape {nom} en échec :\n{resultat.stderr.strip()}")
+    return json.loads(resultat.stdout.strip().splitlines()[-1])
+
+
+# ================================
+# Comparaison à la référence
+# ================================
+def comparer(resultats: Dict[str, Any], reference: Dict[str, Any], seuil: float) -> List[str]:
+    """Régressions par rapport à la référence, sous forme de messages"""
+    regressions = []
+    for nom, mesure in resultats['stages'].items():
+        base = reference.get('stages', {}).get(nom)
+        if not base:
+            continue
+        if mesure['wall_s'] >= DUREE_MIN_COMPARAISON and mesure['wall_s'] > base['wall_s'] * (1 + seuil):
+            regressions.append(f"{nom} : {mesure['wall_s']:.3f}s contre {base['wall_s']:.3f}s "
+                               f"(+{100 * (mesure['wall_s'] / base['wall_s'] - 1):.0f} %)")
+        if mesure['peak_rss_mb'] > base['peak_rss_mb'] * (1 + seuil):
+            regressions.append(f"{nom} : {mesure['peak_rss_mb']:.0f} Mo contre {base['peak_rss_mb']:.0f} Mo de mémoire")
+        if mesure['articles'] != base['articles']:
+            print(f"⚠️ {nom} : {mesure['articles']} articles contre {base['articles']} dans la référence")
+    return regressions
+
+
+def charger_json(path: str) -> Optional[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def enregistrer_json(donnees: Dict[str, Any], path: str) -> str:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(donnees, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai des étapes d'extraction")
+    parser.add_argument("--stage", dest="stages", action="append", choices=list(STAGES),
+                        help="Étape à mesurer, répétable (défaut : toutes)")
+    parser.add_argument("--repetitions", type=int, default=REPETITIONS,
+                        help="Exécutions par étape, la meilleure durée est retenue")
+    parser.add_argument("--output", default=DEFAULT_RESULTS_PATH,
+                        help="Fichier JSON des résultats")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH,
+                        help="Fichier JSON de référence")
+    parser.add_argument("--seuil", type=float, default=DEFAULT_SEUIL,
+                        help="Dépassement toléré par rapport à la référence (0.25 = +25 %%)")
+    parser.add_argument("--enregistrer-reference", action="store_true",
+                        help="Enregistrer les résultats comme nouvelle référence")
+    parser.add_argument("--verifier", action="store_true",
+                        help="Contrôle de non-régression : échouer si la référence est absente "
+                             "ou ne couvre pas une étape mesurée")
+    parser.add_argument("--enfant", choices=list(STAGES), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.repetitions < 1:
+        parser.error("--repetitions doit être supérieur ou égal à 1")
+    if args.verifier and args.enregistrer_reference:
+        parser.error("--verifier et --enregistrer-reference sont incompatibles")
+    return args
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+
+    if args.enfant:
+        print(json.dumps(executer_etape(args.enfant, args.repetitions)))
+        return 0
+
+    resultats = {
+        'metadata': {
+            'date': time.strftime("%Y-%m-%dT%H:%M:%S"),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'repetitions': args.repetitions,
+        },
+        'stages': {},
+    }
+
+    print(f"{'étape':<15} {'durée':>9} {'mémoire':>9} {'articles':>9} {'art./s':>10} {'Mo/s':>8}")
+    for nom in args.stages or STAGES:
+        mesure = mesurer_dans_processus(nom, args.repetitions)
+        resultats['stages'][nom] = mesure
+        print(f"{nom:<15} {mesure['wall_s']:>8.3f}s {mesure['peak_rss_mb']:>6.0f} Mo "
+              f"{mesure['articles']:>9} {mesure['articles_per_s'] or 0:>10.0f} {mesure['mb_per_s'] or 0:>8.2f}")
+
+    print(f"📁 Résultats : {enregistrer_json(resultats, args.output)}")
+
+    if args.enregistrer_reference:
+        print(f"📌 Référence : {enregistrer_json(resultats, args.baseline)}")
+        return 0
+
+    reference = charger_json(args.baseline)
+    if reference is None:
+        if args.verifier:
+            print(f"❌ Référence {args.baseline} introuvable : contrôle impossible")
+            return 2
+        print(f"ℹ️ Pas de référence ({args.baseline}) : lancer avec --enregistrer-reference")
+        return 0
+
+    absentes = [nom for nom in resultats['stages'] if nom not in reference.get('stages', {})]
+    if absentes:
+        if args.verifier:
+            print(f"❌ Étapes absentes de la référence {args.baseline} : {', '.join(absentes)}")
+            return 2
+        print(f"ℹ️ Étapes sans référence : {', '.join(absentes)}")
+
+    regressions = comparer(resultats, reference, args.seuil)
+    if regressions:
+        print(f"❌ {len(regressions)} régression(s) au-delà de {args.seuil:.0%} :")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+    print(f"✅ Aucune régression au-delà de {args.seuil:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
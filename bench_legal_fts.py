@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Compare la latence de la recherche FTS5 (legal_fts) à la recherche par
+sous-chaîne actuelle de l'application, sur une base exportée par
+`python3 yoon_extract.py --sink sqlite`.
+"""
+
+import sqlite3
+import statistics
+import sys
+import time
+
+from legal_fts import DEFAULT_SQLITE_PATH, charger_articles, rechercher_fts, rechercher_sous_chaine
+
+REPETITIONS = 20
+
+REQUETES = [
+    "licenciement abusif",
+    "régime matrimonial",
+    "contrat de travail",
+    "pension alimentaire",
+    "bail commercial",
+    "vol",
+    "impôt sur le revenu",
+    "prescription",
+]
+
+
+def chronometrer(fonction, *arguments):
+    """Médiane des durées (en ms) et résultat du dernier appel"""
+    durees = []
+    for _ in range(REPETITIONS):
+        started = time.perf_counter()
+        resultat = fonction(*arguments)
+        durees.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durees), resultat
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SQLITE_PATH
+    db = sqlite3.connect(path)
+    articles = charger_articles(db)
+
+    print(f"📚 {len(articles)} articles, médiane sur {REPETITIONS} exécutions")
+    print(f"{'requête':<24} {'sous-chaîne':>14} {'FTS5':>14} {'gain':>8}")
+
+    total_scan = total_fts = 0.0
+    for requete in REQUETES:
+        duree_scan, trouves = chronometrer(rechercher_sous_chaine, articles, requete)
+        duree_fts, classes = chronometrer(rechercher_fts, db, requete)
+        total_scan += duree_scan
+        total_fts += duree_fts
+        print(f"{requete:<24} {duree_scan:>7.2f} ms {len(trouves):>4} "
+              f"{duree_fts:>7.2f} ms {len(classes):>4} {duree_scan / duree_fts:>7.1f}x")
+
+    print(f"\n⏱️ Total : sous-chaîne {total_scan:.1f} ms, FTS5 {total_fts:.1f} ms "
+          f"({total_scan / total_fts:.1f}x)")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
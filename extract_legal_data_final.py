@@ -5,10 +5,18 @@ depuis la vraie base de données senegal_juridique.sql
 """
 
 import re
-import json
 import os
 from typing import List, Dict, Any
 
+from search_index import construire_index_inverse, save_index
+from legal_hierarchy import construire_index_hierarchique, save_hierarchy
+from legal_shards import save_shards
+from legal_writers import write_typescript_articles
+from legal_ranking import calculer_statistiques_bm25, verifier_requetes_reference
+from legal_synonyms import compiler_expansions, lire_mots_cles
+from normalisation import cle_recherche
+from sql_dump_reader import iter_table_records
+
 def clean_text(text: str) -> str:
     """Nettoyer le texte"""
     if not text or text == 'NULL':
@@ -17,10 +25,7 @@ def clean_text(text: str) -> str:
     # Nettoyer d'abord
     text = text.strip()
     
-    # Échapper les caractères problématique pour TypeScript
-    text = text.replace('\\', '\\\\')
-    text = text.replace("'", "\\'")
-    text = text.replace('"', '\\"')
+    # L'échappement pour TypeScript est fait à l'écriture (legal_writers)
     text = text.replace('\n', ' ')
     text = text.replace('\r', ' ')
     text = re.sub(r'\s+', ' ', text)
@@ -60,81 +65,77 @@ def extract_text_mapping():
     
     return text_mapping
 
+def construire_article(row: Dict[str, Any], text_mapping: Dict[int, Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Construire un article de l'application à partir d'une ligne de la table articles.
+
+    La ligne peut fournir directement les informations de son texte sous la
+    clé `texte` (name, category) ; sinon elles sont lues dans text_mapping.
+    """
+    article_id = str(row['id'])
+    texte_juridique_id = row['texte_juridique_id']
+    if texte_juridique_id is not None:
+        texte_juridique_id = int(texte_juridique_id)
+    numero_article = clean_text(row['numero_article'])
+    titre_article = clean_text(row['titre_article'])
+    contenu_article = clean_text(row['contenu_article'])
+    position_ordre = int(row['position_ordre'])
+    
+    # Obtenir les informations du texte juridique
+    text_info = row.get('texte') or text_mapping.get(texte_juridique_id, {
+        'name': f'Texte {texte_juridique_id}',
+        'category': 'droit_civil'
+    })
+    
+    # Construire le titre final
+    if titre_article and titre_article != numero_article:
+        final_title = f"{text_info['name']} - {titre_article}"
+    else:
+        final_title = f"{text_info['name']} - {numero_article}"
+    
+    summary = f"Article {numero_article} du {text_info['name']}"
+    tags = [text_info['category'].replace('_', ' '), numero_article.replace('Article ', '')]
+    
+    return {
+        'id': article_id,
+        'title': final_title,
+        'category': text_info['category'],
+        'content': contenu_article,
+        'summary': summary,
+        'language': 'fr',
+        'tags': tags,
+        'published_by': None,
+        'is_published': True,
+        'views_count': 0,
+        'created_at': '2024-01-01T00:00:00Z',
+        'updated_at': '2024-01-01T00:00:00Z',
+        'texte_juridique_id': texte_juridique_id,
+        'position_ordre': position_ordre,
+        # Clé normalisée calculée une fois ici, utilisée par la recherche
+        'search_key': cle_recherche(' '.join([final_title, summary, contenu_article] + tags))
+    }
+
 def extract_all_articles():
     """Extraire tous les articles individuels de la base"""
     
     sql_file_path = "senegal_juridique.sql"
     
-    print("📖 Lecture du fichier SQL avec structure réelle...")
-    
-    with open(sql_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    print("📖 Lecture incrémentale du fichier SQL avec structure réelle...")
     
     # Obtenir le mapping des textes juridiques
     text_mapping = extract_text_mapping()
     
-    # Pattern pour extraire les INSERT statements
-    insert_pattern = r'INSERT INTO `articles` \(.*?\) VALUES\s*\((.*?)\);'
-    
     articles = []
     
-    # Trouver tous les INSERT statements
-    insert_matches = re.findall(insert_pattern, content, re.DOTALL)
-    
-    print(f"🔍 {len(insert_matches)} articles trouvés dans la base")
+    # Format: (id, texte_juridique_id, numero_article, titre_article, contenu_article, position_ordre)
+    for row in iter_table_records(sql_file_path, 'articles'):
+        try:
+            articles.append(construire_article(row, text_mapping))
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"⚠️ Erreur lors du parsing d'un article: {e}")
+            continue
     
-    for match in insert_matches:
-        # Parser chaque ligne d'article
-        # Format: (id, texte_juridique_id, numero_article, titre_article, contenu_article, position_ordre)
-        
-        # Utiliser une regex plus robuste pour parser les valeurs
-        values_pattern = r'\((\d+),\s*(\d+),\s*\'([^\']*)\',\s*\'?([^\']*?)\'?,\s*\'([^\']*)\',\s*(\d+)\)'
-        value_matches = re.findall(values_pattern, match, re.DOTALL)
-        
-        for value_match in value_matches:
-            try:
-                article_id = value_match[0]
-                texte_juridique_id = int(value_match[1])
-                numero_article = clean_text(value_match[2])
-                titre_article = clean_text(value_match[3])
-                contenu_article = clean_text(value_match[4])
-                position_ordre = int(value_match[5])
-                
-                # Obtenir les informations du texte juridique
-                text_info = text_mapping.get(texte_juridique_id, {
-                    'name': f'Texte {texte_juridique_id}',
-                    'category': 'droit_civil'
-                })
-                
-                # Construire le titre final
-                if titre_article and titre_article != numero_article:
-                    final_title = f"{text_info['name']} - {titre_article}"
-                else:
-                    final_title = f"{text_info['name']} - {numero_article}"
-                
-                # Créer l'article
-                article = {
-                    'id': article_id,
-                    'title': final_title,
-                    'category': text_info['category'],
-                    'content': contenu_article,
-                    'summary': f"Article {numero_article} du {text_info['name']}",
-                    'language': 'fr',
-                    'tags': [text_info['category'].replace('_', ' '), numero_article.replace('Article ', '')],
-                    'published_by': None,
-                    'is_published': True,
-                    'views_count': 0,
-                    'created_at': '2024-01-01T00:00:00Z',
-                    'updated_at': '2024-01-01T00:00:00Z',
-                    'texte_juridique_id': texte_juridique_id,
-                    'position_ordre': position_ordre
-                }
-                
-                articles.append(article)
-                
-            except (ValueError, IndexError) as e:
-                print(f"⚠️ Erreur lors du parsing d'un article: {e}")
-                continue
+    print(f"🔍 {len(articles)} articles trouvés dans la base")
     
     # Trier par texte juridique puis par position
     articles.sort(key=lambda x: (x['texte_juridique_id'], x['position_ordre']))
@@ -146,72 +147,19 @@ def save_articles_to_typescript(articles: List[Dict[str, Any]]) -> str:
     
     print(f"💾 Sauvegarde de {len(articles)} articles en TypeScript...")
     
-    # Créer le dossier src/data s'il n'existe pas
-    os.makedirs("src/data", exist_ok=True)
-    
     output_path = "src/data/legalArticles.ts"
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        # En-tête
-        f.write('''// Articles juridiques individuels extraits de senegal_juridique.sql
-// Généré automatiquement le 2024-01-01
-
-export interface LegalContent {
-  id: string;
-  title: string;
-  category: string;
-  content: string;
-  summary?: string;
-  language: string;
-  tags?: string[];
-  published_by?: string | null;
-  is_published: boolean;
-  views_count: number;
-  created_at: string;
-  updated_at: string;
-}
-
-export const LEGAL_ARTICLES: LegalContent[] = [
-''')
-        
-        # Ajouter chaque article avec échappement correct
-        for i, article in enumerate(articles):
-            # Échapper correctement tous les caractères spéciaux
-            title = article['title'].replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
-            summary = article['summary'].replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
-            content = article['content'].replace('\\', '\\\\').replace('`', '\\`').replace('${', '\\${')
-            
-            f.write(f'''  {{
-    id: '{article['id']}',
-    title: `{title}`,
-    category: '{article['category']}',
-    content: `{content}`,
-    summary: `{summary}`,
-    language: '{article['language']}',
-    tags: {json.dumps(article['tags'])},
-    published_by: null,
-    is_published: {str(article['is_published']).lower()},
-    views_count: {article['views_count']},
-    created_at: '{article['created_at']}',
-    updated_at: '{article['updated_at']}'
-  }}''')
-            
-            # Ajouter une virgule sauf pour le dernier élément
-            if i < len(articles) - 1:
-                f.write(',')
-            
-            f.write('\n')
-        
-        # Métadonnées
-        f.write(f'''];
-
-export const LEGAL_ARTICLES_METADATA = {{
-  total_articles: {len(articles)},
-  extracted_at: "2024-01-01T00:00:00Z",
-  source: "senegal_juridique.sql",
-  version: "Final - Base de données réelle"
-}};
-''')
+    # Écriture en flux, chaque champ étant échappé une seule fois
+    write_typescript_articles(
+        articles,
+        output_path,
+        header="Articles juridiques individuels extraits de senegal_juridique.sql\nGénéré automatiquement le 2024-01-01",
+        metadata={
+            'extracted_at': "2024-01-01T00:00:00Z",
+            'source': "senegal_juridique.sql",
+            'version': "Final - Base de données réelle",
+        },
+    )
     
     return output_path
 
@@ -250,8 +198,37 @@ def main():
     # Sauvegarder
     output_file = save_articles_to_typescript(articles)
     
+    # Un fragment par texte juridique, chargé à la demande par l'application
+    manifest_file = save_shards(articles, version="Final - Base de données réelle")
+    
+    # Index inversé généré en même temps que les articles, avec les
+    # statistiques BM25 précalculées pour le classement et la table d'expansion
+    print("🗂️ Construction de l'index de recherche...")
+    index = construire_index_inverse(articles)
+    index['bm25'] = calculer_statistiques_bm25(index)
+    
+    # Synonymes des mots-clés juridiques, pondérés par leur fréquence d'utilisation
+    mots_cles = lire_mots_cles()
+    index['expansions'] = compiler_expansions(mots_cles['mots_cles_juridiques'], mots_cles['mots_cles_synonymes'])
+    index_file = save_index(index)
+    
+    # Index hiérarchique séparé, construit sur les articles déjà extraits
+    # (triés par texte puis position) : ses nœuds renvoient aux articles
+    # par texte_juridique_id et position_ordre, présents dans les fragments
+    print("🌳 Construction de l'index hiérarchique...")
+    hierarchy_file = save_hierarchy(construire_index_hierarchique(
+        (article['texte_juridique_id'], article['position_ordre'], article['content'])
+        for article in articles
+    ))
+    
     print(f"\n🎉 Extraction terminée !")
     print(f"📁 Fichier généré : {output_file}")
+    print(f"🧩 Fragments par code : {manifest_file}")
+    print(f"🗂️ Index de recherche : {index_file}")
+    print(f"🌳 Index hiérarchique : {hierarchy_file}")
+
+    print(f"\n🔎 Requêtes de référence du classement :")
+    verifier_requetes_reference(index, index['bm25'])
     
     # Afficher quelques exemples
     print(f"\n📄 Exemples d'articles extraits :")
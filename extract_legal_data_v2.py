@@ -2,6 +2,11 @@
 """
 Script d'extraction automatique avancé des articles juridiques
 depuis le fichier senegal_juridique.sql vers un format JSON
+
+Script historique, conservé tel quel : il lit le dump en entier et le
+parcourt par expressions régulières. Les extractions courantes passent par
+sql_dump_reader (extract_legal_data_final.py, extract_legal_data_v3.py,
+yoon_extract.py).
 """
 
 import re
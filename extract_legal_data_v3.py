@@ -5,10 +5,15 @@ depuis le fichier senegal_juridique.sql avec séparation correcte
 """
 
 import re
-import json
 import os
 from typing import List, Dict, Any
 
+from legal_shards import save_shards
+from legal_writers import write_typescript_articles
+from legal_dedup import Deduplicateur
+from normalisation import cle_recherche
+from sql_dump_reader import iter_table_records
+
 def clean_legal_text(text: str) -> str:
     """Nettoyer le texte juridique des caractères unwanted"""
     # Supprimer les sauts de ligne excessifs
@@ -17,96 +22,27 @@ def clean_legal_text(text: str) -> str:
     text = re.sub(r'\s+', ' ', text)
     # Nettoyer les caractères d'échappement
     text = text.replace('\\n', ' ').replace('\\r', ' ')
-    # Nettoyer les guillemets
-    text = text.replace("'", "\\'").replace('"', '\\"')
+    # Les guillemets sont échappés à l'écriture (legal_writers)
     return text.strip()
 
-def extract_individual_articles():
+def extract_individual_articles(sql_file_path: str = "senegal_juridique.sql"):
     """Extraire les articles individuels de manière intelligente"""
     
-    sql_file_path = "senegal_juridique.sql"
-    
-    print("📖 Lecture et parsing intelligent du fichier SQL...")
-    
-    with open(sql_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    print("📖 Lecture en flux des lignes de la table articles...")
     
     articles = []
     
-    print("🔍 Extraction par codes juridiques spécifiques...")
-    
-    # Définir les codes avec leurs patterns spécifiques
-    legal_codes = [
-        {
-            'name': 'Constitution du Sénégal',
-            'category': 'constitution',
-            'pattern': r'PRÉAMBULE.*?(?=(?=LIVRE|TITRE|\Z))',
-            'summary': 'Constitution de la République du Sénégal'
-        },
-        {
-            'name': 'Code pénal du Sénégal',
-            'category': 'loi_penale', 
-            'pattern': r'LIVRE I\s*-\s*DES INFRACTIONS.*?(?=(?=LIVRE II|TITRE CONSTITUTION|\Z))',
-            'summary': 'Code pénal définissant les infractions et leurs sanctions'
-        },
-        {
-            'name': 'Code de procédure pénale',
-            'category': 'procedure_penale',
-            'pattern': r'LIVRE I.*?ENQUÊTE.*?(?=(?=LIVRE II|CODE|\Z))',
-            'summary': 'Code de procédure pénale pour les affaires pénales'
-        },
-        {
-            'name': 'Code des Obligations Civiles et Commerciales',
-            'category': 'droit_civil',
-            'pattern': r'LIVRE I\s*-\s*DES PERSONNES.*?(?=(?=LIVRE II|TITRE|\Z))',
-            'summary': 'Code civil définissant les droits et obligations'
-        },
-        {
-            'name': 'Code de procédure civile',
-            'category': 'procedure_civile',
-            'pattern': r'LIVRE I\s*-\s*DES JURIDICTIONS.*?(?=(?=LIVRE II|CODE|\Z))',
-            'summary': 'Code de procédure civile'
-        },
-        {
-            'name': 'Code de la Famille du Sénégal',
-            'category': 'code_famille',
-            'pattern': r'LIVRE I\s*-\s*DU MARIAGE.*?(?=(?=LIVRE II|CODE|\Z))',
-            'summary': 'Code de la famille sénégalaise'
-        },
-        {
-            'name': 'Code du Travail du Sénégal',
-            'category': 'droit_travail',
-            'pattern': r'TITRE I\s*-\s*DU CONTRAT.*?(?=(?=TITRE II|CODE|\Z))',
-            'summary': 'Code du travail et relations professionnelles'
-        }
-    ]
-    
-    # Extraction par codes juridiques
-    for i, code in enumerate(legal_codes):
-        matches = re.findall(code['pattern'], content, re.DOTALL | re.IGNORECASE)
-        
-        for j, match in enumerate(matches):
-            article = {
-                'id': f'{code["category"]}_{i+1}_{j+1}',
-                'title': f'{code["name"]} - Partie {j+1}',
-                'category': code['category'],
-                'content': clean_legal_text(match),
-                'summary': code['summary'],
-                'language': 'fr',
-                'tags': [code['category'].replace('_', ' '), 'section', f'partie {j+1}'],
-                'published_by': None,
-                'is_published': True,
-                'views_count': 0,
-                'created_at': '2024-01-01T00:00:00Z',
-                'updated_at': '2024-01-01T00:00:00Z'
-            }
-            articles.append(article)
-    
     print(f"🔍 Extraction d'articles individuels...")
     
-    # Extraction d'articles individuels numérotés
-    article_pattern = r'Art\.\s*(\d+)\.?\s*[-.]?\s*(.+?)(?=\n\n|\nArt\.\s*\d+|\nTITRE|\nLIVRE|\Z)'
-    article_matches = re.findall(article_pattern, content, re.DOTALL)
+    # Extraction d'articles individuels numérotés, ligne par ligne : appliquée
+    # au fichier SQL brut, l'expression capturait des fragments de requêtes
+    # INSERT et chaque article autant de fois qu'il apparaissait
+    article_pattern = re.compile(r'Art\.\s*(\d+)\.?\s*[-.]?\s*(.+?)(?=\n\n|\nArt\.\s*\d+|\nTITRE|\nLIVRE|\Z)', re.DOTALL)
+    article_matches = [
+        match
+        for row in iter_table_records(sql_file_path, 'articles')
+        for match in article_pattern.findall(row['contenu_article'] or '')
+    ]
     
     print(f"   {len(article_matches)} articles individuels trouvés")
     
@@ -153,6 +89,8 @@ def extract_individual_articles():
                 'created_at': '2024-01-01T00:00:00Z',
                 'updated_at': '2024-01-01T00:00:00Z'
             }
+            article['search_key'] = cle_recherche(' '.join(
+                [article['title'], article['summary'], article['content']] + article['tags']))
             articles.append(article)
     
     return articles
@@ -198,79 +136,18 @@ def categorize_and_organize_articles(articles: List[Dict[str, Any]]) -> List[Dic
 def save_improved_articles(articles: List[Dict[str, Any]]) -> str:
     """Sauvegarder les articles améliorés en TypeScript"""
     
-    output_data = {
-        "metadata": {
-            "total_articles": len(articles),
-            "extracted_at": "2024-01-01T00:00:00Z",
-            "source": "senegal_juridique.sql",
-            "version": "3.0 - Amélioré",
-            "extraction_method": "individual_articles_smart_extraction"
-        },
-        "articles": articles
-    }
-    
-    # Créer le contenu TypeScript
-    ts_content = '''// Articles juridiques individuels extraits de senegal_juridique.sql
-// Généré avec extraction intelligente le 2024-01-01
-
-export interface LegalContent {
-  id: string;
-  title: string;
-  category: string;
-  content: string;
-  summary?: string;
-  language: string;
-  tags?: string[];
-  published_by?: string | null;
-  is_published: boolean;
-  views_count: number;
-  created_at: string;
-  updated_at: string;
-}
-
-export const LEGAL_ARTICLES: LegalContent[] = [
-'''
-    
-    # Ajouter chaque article
-    for i, article in enumerate(articles):
-        ts_content += f'''  {{
-    id: '{article.get('id', '')}',
-    title: '{article.get('title', '')}',
-    category: '{article.get('category', 'droit_civil')}',
-    content: `{article.get('content', '')}`,
-    summary: '{article.get('summary', '')}',
-    language: '{article.get('language', 'fr')}',
-    tags: {json.dumps(article.get('tags', []))},
-    published_by: {f"'{article.get('published_by')}'" if article.get('published_by') else 'null'},
-    is_published: {str(article.get('is_published', True)).lower()},
-    views_count: {article.get('views_count', 0)},
-    created_at: '{article.get('created_at', '2024-01-01T00:00:00Z')}',
-    updated_at: '{article.get('updated_at', '2024-01-01T00:00:00Z')}'
-  }}'''
-        
-        # Ajouter une virgule sauf pour le dernier élément
-        if i < len(articles) - 1:
-            ts_content += ','
-        
-        ts_content += '\n'
-    
-    ts_content += '''];
-
-export const LEGAL_ARTICLES_METADATA = {
-  total_articles: ''' + str(len(articles)) + ''',
-  extracted_at: "2024-01-01T00:00:00Z",
-  source: "senegal_juridique.sql",
-  version: "3.0 - Amélioré"
-};
-'''
-    
-    # Créer le dossier src/data s'il n'existe pas
-    os.makedirs("src/data", exist_ok=True)
-    
-    # Écrire le fichier TypeScript
+    # Écriture en flux : chaque article est échappé puis écrit directement
     output_path = "src/data/legalArticles.ts"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(ts_content)
+    write_typescript_articles(
+        articles,
+        output_path,
+        header="Articles juridiques individuels extraits de senegal_juridique.sql\nGénéré avec extraction intelligente le 2024-01-01",
+        metadata={
+            'extracted_at': "2024-01-01T00:00:00Z",
+            'source': "senegal_juridique.sql",
+            'version': "3.0 - Amélioré",
+        },
+    )
     
     return output_path
 
@@ -287,6 +164,12 @@ def main():
     
     print(f"📊 {len(articles)} articles individuels extraits")
     
+    # Doublons exacts et quasi-doublons écartés avant toute sérialisation
+    print("🧹 Dédoublonnage...")
+    deduplicateur = Deduplicateur()
+    articles = list(deduplicateur.filtrer(articles))
+    print(f"   {deduplicateur.resume()}")
+    
     # Catégoriser et organiser
     print("📂 Catégorisation et organisation...")
     articles = categorize_and_organize_articles(articles)
@@ -294,6 +177,9 @@ def main():
     # Sauvegarder
     output_file = save_improved_articles(articles)
     
+    # Un fragment par catégorie, chargé à la demande par l'application
+    manifest_file = save_shards(articles, version="3.0 - Amélioré")
+    
     # Statistiques finales
     categories = {}
     for article in articles:
@@ -302,6 +188,7 @@ def main():
     
     print(f"🎉 Extraction terminée avec succès !")
     print(f"📁 Fichier généré : {output_file}")
+    print(f"🧩 Fragments par catégorie : {manifest_file}")
     print(f"📊 Articles individuels par catégorie :")
     for cat, count in categories.items():
         print(f"   - {cat}: {count} articles")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Compare le découpeur d'articles en une passe (article_splitter) à
+l'ancienne cascade de motifs de loiv2.extraire_articles, sur les PDF du
+répertoire courant. Le texte des pages est lu depuis le cache des pages.
+"""
+
+import re
+import time
+
+from loiv2 import PDFS, check_file_exists, clean_text
+from page_cache import PageTextCache, sha256_fichier
+from PyPDF2 import PdfReader
+from article_splitter import decouper_articles
+
+REPETITIONS = 3
+
+
+def extraire_articles_historique(full_text):
+    """Ancienne implémentation : motifs recompilés, premier motif fructueux retenu"""
+    patterns = [
+        re.compile(r"(Article\s+\d+(?:[.\-]\d+)*)(.*?)(?=(Article\s+\d+|$))", re.S | re.IGNORECASE),
+        re.compile(r"(Art\.\s+\d+(?:[.\-]\d+)*)(.*?)(?=(Art\.\s+\d+|Article\s+\d+|$))", re.S | re.IGNORECASE),
+        re.compile(r"(\d+\.\s*[A-Z][^.]*\.?)(.*?)(?=(\d+\.\s*[A-Z]|$))", re.S)
+    ]
+
+    articles = []
+    for pattern in patterns:
+        matches = pattern.findall(full_text)
+        if matches:
+            articles = matches
+            break
+
+    return articles
+
+
+def texte_complet(pdf, cache):
+    """Reconstitue le texte du document comme loiv2, via le cache des pages"""
+    sha256 = sha256_fichier(pdf["path"])
+    reader = PdfReader(pdf["path"])
+    pages = []
+    for index, page in enumerate(reader.pages):
+        text = cache.get(sha256, index)
+        if text is None:
+            text = clean_text(page.extract_text())
+            cache.put(sha256, index, text)
+        if text:
+            pages.append(text + "\n")
+    return pages
+
+
+def chronometrer(fonction, argument):
+    meilleur = None
+    for _ in range(REPETITIONS):
+        started = time.perf_counter()
+        resultat = fonction(argument)
+        elapsed = time.perf_counter() - started
+        meilleur = elapsed if meilleur is None else min(meilleur, elapsed)
+    return meilleur, resultat
+
+
+def main():
+    cache = PageTextCache()
+    total_ancien = total_nouveau = 0.0
+
+    print(f"{'Document':45} {'ancien':>10} {'nouveau':>10} {'gain':>7} {'art. avant':>10} {'après':>7}")
+    for pdf in PDFS:
+        if not check_file_exists(pdf["path"]):
+            continue
+        full_text = "".join(texte_complet(pdf, cache))
+
+        ancien, articles_anciens = chronometrer(extraire_articles_historique, full_text)
+        nouveau, articles_nouveaux = chronometrer(decouper_articles, full_text)
+        total_ancien += ancien
+        total_nouveau += nouveau
+
+        print(f"{pdf['path'][:45]:45} {ancien * 1000:8.1f}ms {nouveau * 1000:8.1f}ms "
+              f"{ancien / nouveau:6.1f}x {len(articles_anciens):10} {len(articles_nouveaux):7}")
+
+    if total_nouveau:
+        print(f"{'Total':45} {total_ancien * 1000:8.1f}ms {total_nouveau * 1000:8.1f}ms "
+              f"{total_ancien / total_nouveau:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Agrégation par lots des fréquences de mots-clés recherchés.
+
+Remplace le déclencheur UpdateMotsClesFrequence : au lieu d'un INSERT ...
+ON DUPLICATE KEY UPDATE par mot, exécuté dans la transaction de chaque
+recherche, ce traitement relit périodiquement les nouvelles lignes de
+historique_recherches (repère date_recherche, id), compte les mots en
+mémoire et applique les compteurs en un seul upsert multi-lignes. Le
+journal des recherches devient un simple ajout.
+
+Le repère est enregistré dans la même transaction que les compteurs :
+une ligne d'historique n'est jamais comptée deux fois.
+
+Mise en place : exécuter frequence_mots_cles.sql (suppression du
+déclencheur, table des repères, index sur date_recherche).
+"""
+
+import argparse
+import logging
+import time
+from collections import Counter
+
+from loiv2 import connect_to_database
+
+logger = logging.getLogger(__name__)
+
+NOM_TRAITEMENT = "frequence_mots_cles"
+
+# Lignes d'historique lues par transaction
+DEFAULT_BATCH_SIZE = 10000
+
+# Les lignes plus récentes que ce délai ne sont pas encore lues : une
+# transaction concurrente peut encore insérer une date légèrement antérieure
+DEFAULT_LAG_SECONDS = 5
+
+# Longueur maximale de mots_cles_juridiques.terme
+LONGUEUR_TERME_MAX = 200
+
+CREATE_WATERMARK_TABLE = """
+CREATE TABLE IF NOT EXISTS traitements_reperes (
+  nom varchar(100) NOT NULL PRIMARY KEY,
+  derniere_date timestamp NULL DEFAULT NULL,
+  dernier_id bigint(20) NOT NULL DEFAULT 0,
+  date_execution timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+UPSERT_FREQUENCES = """
+INSERT INTO mots_cles_juridiques (terme, frequence_utilisation, categorie)
+VALUES (%s, %s, 'Recherche')
+ON DUPLICATE KEY UPDATE frequence_utilisation = frequence_utilisation + VALUES(frequence_utilisation)
+"""
+
+
+def mots_recherche(termes_recherche):
+    """
+    Découpe une recherche comme le faisait le déclencheur : séparation sur
+    les espaces, mots de plus de 2 octets (LENGTH MySQL) uniquement.
+    """
+    for mot in (termes_recherche or "").split(" "):
+        mot = mot.strip()
+        if len(mot.encode("utf-8")) > 2 and len(mot) <= LONGUEUR_TERME_MAX:
+            yield mot
+
+
+def lire_repere(cursor):
+    """Renvoie le repère (date, id) de la dernière ligne d'historique traitée"""
+    cursor.execute(
+        "SELECT derniere_date, dernier_id FROM traitements_reperes WHERE nom = %s FOR UPDATE",
+        (NOM_TRAITEMENT,)
+    )
+    row = cursor.fetchone()
+    return (row[0], row[1]) if row else (None, 0)
+
+
+def enregistrer_repere(cursor, date_recherche, historique_id):
+    cursor.execute(
+        """
+        INSERT INTO traitements_reperes (nom, derniere_date, dernier_id)
+        VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE derniere_date = VALUES(derniere_date), dernier_id = VALUES(dernier_id)
+        """,
+        (NOM_TRAITEMENT, date_recherche, historique_id)
+    )
+
+
+def lire_historique(cursor, repere, batch_size, lag_seconds):
+    """Lit le lot suivant de recherches postérieures au repère, dans l'ordre (date, id)"""
+    derniere_date, dernier_id = repere
+    limite = "date_recherche <= NOW() - INTERVAL %s SECOND"
+    if derniere_date is None:
+        cursor.execute(
+            f"SELECT id, termes_recherche, date_recherche FROM historique_recherches "
+            f"WHERE {limite} ORDER BY date_recherche, id LIMIT %s",
+            (lag_seconds, batch_size)
+        )
+    else:
+        cursor.execute(
+            f"SELECT id, termes_recherche, date_recherche FROM historique_recherches "
+            f"WHERE (date_recherche > %s OR (date_recherche = %s AND id > %s)) AND {limite} "
+            f"ORDER BY date_recherche, id LIMIT %s",
+            (derniere_date, derniere_date, dernier_id, lag_seconds, batch_size)
+        )
+    return cursor.fetchall()
+
+
+def appliquer_frequences(cursor, compteurs, batch_size):
+    """Applique les compteurs en upserts multi-lignes, dans un ordre stable"""
+    lignes = sorted(compteurs.items())
+    for debut in range(0, len(lignes), batch_size):
+        cursor.executemany(UPSERT_FREQUENCES, lignes[debut:debut + batch_size])
+
+
+def traiter_lot(db, cursor, batch_size=DEFAULT_BATCH_SIZE, lag_seconds=DEFAULT_LAG_SECONDS):
+    """
+    Traite un lot d'historique dans une transaction.
+
+    Renvoie le nombre de recherches lues et de mots distincts mis à jour.
+    """
+    db.start_transaction()
+    try:
+        repere = lire_repere(cursor)
+        lignes = lire_historique(cursor, repere, batch_size, lag_seconds)
+        if not lignes:
+            db.rollback()
+            return 0, 0
+
+        compteurs = Counter()
+        for _id, termes_recherche, _date in lignes:
+            compteurs.update(mots_recherche(termes_recherche))
+
+        appliquer_frequences(cursor, compteurs, batch_size)
+        dernier_id, _termes, derniere_date = lignes[-1]
+        enregistrer_repere(cursor, derniere_date, dernier_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return len(lignes), len(compteurs)
+
+
+def agreger_frequences(batch_size=DEFAULT_BATCH_SIZE, lag_seconds=DEFAULT_LAG_SECONDS):
+    """Traite tout l'historique en attente ; renvoie le nombre de recherches lues"""
+    db = connect_to_database()
+    cursor = db.cursor()
+    total = 0
+    try:
+        cursor.execute(CREATE_WATERMARK_TABLE)
+        while True:
+            recherches, mots = traiter_lot(db, cursor, batch_size, lag_seconds)
+            if not recherches:
+                break
+            total += recherches
+            logger.info(f"📈 {recherches} recherches agrégées, {mots} mots-clés mis à jour")
+            if recherches < batch_size:
+                break
+    finally:
+        cursor.close()
+        db.close()
+    return total
+
+
+def parse_arguments():
+    """Analyse les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Agrégation des fréquences de mots-clés recherchés")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="Nombre de recherches lues par transaction"
+    )
+    parser.add_argument(
+        "--lag", type=int, default=DEFAULT_LAG_SECONDS,
+        help="Âge minimal (secondes) d'une recherche pour être agrégée"
+    )
+    parser.add_argument(
+        "--interval", type=int, default=0,
+        help="Relancer l'agrégation toutes les N secondes (0 = une seule exécution)"
+    )
+    args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size doit être supérieur ou égal à 1")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    try:
+        while True:
+            debut = time.time()
+            total = agreger_frequences(args.batch_size, args.lag)
+            logger.info(f"✅ {total} recherches traitées en {time.time() - debut:.2f}s")
+            if not args.interval:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        logger.info("Agrégation interrompue par l'utilisateur")
+    except Exception as e:
+        logger.error(f"Échec de l'agrégation: {e}")
+        exit(1)
@@ -0,0 +1,24 @@
+-- Passage du déclencheur UpdateMotsClesFrequence à l'agrégation par lots
+-- (frequence_mots_cles.py). À exécuter une fois sur senegal_juridique.
+
+-- Les recherches ne mettent plus à jour mots_cles_juridiques à l'insertion
+DROP TRIGGER IF EXISTS `UpdateMotsClesFrequence`;
+
+-- Parcours de l'historique dans l'ordre du repère (date_recherche, id)
+ALTER TABLE `historique_recherches`
+  ADD KEY `idx_date_recherche` (`date_recherche`, `id`);
+
+CREATE TABLE IF NOT EXISTS `traitements_reperes` (
+  `nom` varchar(100) NOT NULL PRIMARY KEY,
+  `derniere_date` timestamp NULL DEFAULT NULL,
+  `dernier_id` bigint(20) NOT NULL DEFAULT 0,
+  `date_execution` timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp()
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Les recherches déjà comptées par le déclencheur ne doivent pas l'être à nouveau
+INSERT INTO `traitements_reperes` (`nom`, `derniere_date`, `dernier_id`)
+SELECT 'frequence_mots_cles', h.`date_recherche`, h.`id`
+FROM `historique_recherches` h
+ORDER BY h.`date_recherche` DESC, h.`id` DESC
+LIMIT 1
+ON DUPLICATE KEY UPDATE `derniere_date` = VALUES(`derniere_date`), `dernier_id` = VALUES(`dernier_id`);
@@ -1,9 +1,23 @@
 import re
-import mysql.connector
 from PyPDF2 import PdfReader
 import logging
 from datetime import datetime
 import os
+import time
+import argparse
+import contextlib
+import itertools
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import sys
+
+from page_cache import PageTextCache, sha256_fichier, DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES
+from stockage import ERREURS_BASE, STOCKAGES, DEFAULT_SQLITE_PATH, StockageMySQL, creer_stockage
+
+# Les modules d'extraction partagés se trouvent à la racine du dépôt
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from article_splitter import ArticleSplitter, decouper_articles
 
 # ================================
 # Configuration and Logging
@@ -23,6 +37,9 @@ DB_CONFIG = {
     "use_unicode": True
 }
 
+# Nombre d'articles envoyés par requête INSERT multi-lignes
+DEFAULT_BATCH_SIZE = 500
+
 # ================================
 # Liste des PDF à importer
 # ================================
@@ -119,37 +136,30 @@ def check_file_exists(file_path):
         return False
     return True
 
-def connect_to_database():
-    """Établit la connexion à la base de données avec gestion d'erreurs"""
+def connect_to_database(allow_local_infile=False, stockage=None):
+    """
+    Établit la connexion à la base de données avec gestion d'erreurs.
+
+    `stockage` vaut par défaut la base MySQL de DB_CONFIG (voir stockage.py).
+    `allow_local_infile` autorise LOAD DATA LOCAL INFILE (chargement en
+    masse) ; le serveur doit aussi avoir local_infile activé.
+    """
+    stockage = stockage or StockageMySQL(DB_CONFIG)
     try:
-        db = mysql.connector.connect(**DB_CONFIG)
-        logger.info("Connexion à la base de données établie")
+        db = stockage.connecter(allow_local_infile=allow_local_infile)
+        logger.info(f"Connexion à la base de données établie ({stockage})")
         return db
-    except mysql.connector.Error as err:
+    except ERREURS_BASE as err:
         logger.error(f"Erreur de connexion à la base de données: {err}")
         raise
 
 def extraire_articles(full_text):
     """
-    Fonction améliorée d'extraction des articles avec plusieurs patterns
+    Découpe le texte en articles (voir article_splitter.decouper_articles).
+
+    Renvoie des dictionnaires numero / contenu / chemin / position.
     """
-    patterns = [
-        # Pattern principal: Article + numéro + contenu
-        re.compile(r"(Article\s+\d+(?:[.\-]\d+)*)(.*?)(?=(Article\s+\d+|$))", re.S | re.IGNORECASE),
-        # Pattern alternatif: Art. + numéro
-        re.compile(r"(Art\.\s+\d+(?:[.\-]\d+)*)(.*?)(?=(Art\.\s+\d+|Article\s+\d+|$))", re.S | re.IGNORECASE),
-        # Pattern pour sections numérotées
-        re.compile(r"(\d+\.\s*[A-Z][^.]*\.?)(.*?)(?=(\d+\.\s*[A-Z]|$))", re.S)
-    ]
-    
-    articles = []
-    for pattern in patterns:
-        matches = pattern.findall(full_text)
-        if matches:
-            articles = matches
-            break
-    
-    return articles
+    return decouper_articles(full_text)
 
 def clean_text(text):
     """Nettoie le texte des caractères indésirables"""
@@ -161,151 +171,790 @@ def clean_text(text):
     text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', text)
     return text.strip()
 
+# Séparateurs entre numéro et titre ; un tiret entre deux chiffres
+# fait partie du numéro (« Art. 5-1 »)
+TITLE_SEPARATOR = re.compile(r"\s*(?:–|:|\.\s*-|(?<!\d)-|-(?!\d))\s*")
+
 def extract_article_info(numero_complet):
     """Extrait le numéro d'article et le titre éventuel"""
     numero = numero_complet.strip()
     titre_article = None
     
-    # Recherche de séparateurs pour le titre
-    separators = ['–', '-', ':', '.-', '. -']
-    for sep in separators:
-        if sep in numero:
-            parts = numero.split(sep, 1)
-            numero = parts[0].strip()
-            titre_article = parts[1].strip() if len(parts) > 1 else None
-            break
+    # Recherche d'un séparateur pour le titre
+    parts = TITLE_SEPARATOR.split(numero, 1)
+    if len(parts) > 1:
+        numero = parts[0].strip()
+        titre_article = parts[1].strip() or None
     
     return numero, titre_article
 
+# ================================
+# Extraction (exécutée dans les processus de travail)
+# ================================
+def lire_pages(path, sha256, cache=None, debut=0, fin=None, reader=None):
+    """
+    Produit les couples (index, texte nettoyé) des pages [debut, fin) d'un PDF.
+
+    Les pages sont lues une à une : le texte complet du document n'est
+    jamais assemblé en mémoire.
+    """
+    reader = reader or PdfReader(path)
+    fin = len(reader.pages) if fin is None else min(fin, len(reader.pages))
+    for index in range(debut, fin):
+        text = cache.get(sha256, index) if cache else None
+        if text is None:
+            try:
+                text = clean_text(reader.pages[index].extract_text())
+            except Exception as e:
+                logger.warning(f"Erreur lors de la lecture de la page {index + 1} de {path}: {e}")
+                continue
+            if cache:
+                cache.put(sha256, index, text)
+        yield index, text
+
+def ligne_article(article):
+    """Convertit un article du découpeur en ligne (numero, titre_article, contenu), ou None"""
+    contenu = clean_text(article["contenu"])
+    
+    # Ignorer les articles trop courts (probablement des erreurs d'extraction)
+    if len(contenu) < 10:
+        return None
+    
+    numero, titre_article = extract_article_info(article["numero"])
+    return numero, titre_article, contenu
+
+def iter_lignes_articles(pages, fins_de_page=False):
+    """
+    Découpe en flux les pages (index, texte) d'un document et produit les
+    couples (page de début, ligne d'article) dès que les articles sont clos.
+    Avec `fins_de_page`, un couple (index, None) suit chaque page lue :
+    tous les articles clos sur cette page ont alors été produits.
+
+    Seul l'article en cours est conservé d'une page à l'autre. Tant
+    qu'aucun article n'a été trouvé, les pages sont gardées pour le repli
+    sur les sections numérotées (decouper_articles), dont les articles sont
+    rattachés à la première page lue.
+    """
+    splitter = ArticleSplitter()
+    debut_sans_article = []
+    premiere_page = None
+    trouve = False
+    
+    def lignes(articles):
+        for article in articles:
+            ligne = ligne_article(article)
+            if ligne is not None:
+                page = article["page"]
+                yield (premiere_page if page is None else page), ligne
+    
+    for index, text in pages:
+        if not text:
+            continue
+        if premiere_page is None:
+            premiere_page = index
+        if not trouve:
+            debut_sans_article.append(text + "\n")
+        articles = splitter.feed(text + "\n", page=index)
+        if articles:
+            trouve = True
+            debut_sans_article = []
+        yield from lignes(articles)
+        if fins_de_page:
+            yield index, None
+    
+    articles = splitter.close()
+    if articles or trouve:
+        yield from lignes(articles)
+    elif debut_sans_article:
+        yield from lignes(decouper_articles("".join(debut_sans_article)))
+
+def extraire_document(pdf, cache_dir=DEFAULT_CACHE_DIR, cache_max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Lit un PDF, nettoie son texte et le découpe en articles.
+
+    Ne touche pas à la base de données : cette fonction peut être exécutée
+    dans un processus séparé. Le texte nettoyé de chaque page est mis en
+    cache (cache_dir=None pour le désactiver).
+
+    Renvoie None si aucun texte n'a pu être extrait, sinon un dictionnaire
+    contenant les lignes d'articles prêtes à insérer (tuples numero,
+    titre_article, contenu), la page où commence chacune, le nombre de
+    pages et l'empreinte du PDF.
+    """
+    reader = PdfReader(pdf["path"])
+    cache = PageTextCache(cache_dir, cache_max_bytes) if cache_dir else None
+    sha256 = sha256_fichier(pdf["path"])
+    resultat = resultat_document(lire_pages(pdf["path"], sha256, cache, reader=reader), len(reader.pages), sha256)
+    
+    if cache:
+        logger.info(f"🗂️ {pdf['path']}: {cache.hits} pages lues depuis le cache, {cache.misses} extraites")
+    return resultat
+
+def resultat_document(pages, nombre_pages, sha256):
+    """Découpe les pages (index, texte) d'un document ; None si aucun texte"""
+    texte_trouve = False
+    
+    def pages_lues():
+        nonlocal texte_trouve
+        for index, text in pages:
+            texte_trouve = texte_trouve or bool(text.strip())
+            yield index, text
+    
+    lignes_paginees = list(iter_lignes_articles(pages_lues()))
+    if not texte_trouve:
+        return None
+    return {
+        "lignes": [ligne for _page, ligne in lignes_paginees],
+        # Page où commence chaque article, pour le point de reprise
+        "debuts": [page for page, _ligne in lignes_paginees],
+        "pages": nombre_pages,
+        "sha256": sha256,
+    }
+
+# ================================
+# Extraction parallèle par plages de pages
+# ================================
+# Pages extraites par tâche : assez pour amortir l'ouverture du PDF dans le
+# processus de travail, assez peu pour répartir un gros code sur tous les cœurs
+DEFAULT_PAGES_PAR_PLAGE = 32
+
+def plages_de_pages(nombre_pages, pages_par_plage=DEFAULT_PAGES_PAR_PLAGE):
+    """Découpe [0, nombre_pages) en intervalles (debut, fin) consécutifs"""
+    return [(debut, min(debut + pages_par_plage, nombre_pages))
+            for debut in range(0, nombre_pages, pages_par_plage)]
+
+def extraire_plage(path, sha256, debut, fin, cache_dir=DEFAULT_CACHE_DIR, cache_max_bytes=DEFAULT_MAX_BYTES,
+                   taille_cache=None):
+    """
+    Extrait le texte nettoyé des pages [debut, fin) d'un PDF (exécuté dans
+    un processus de travail, qui ouvre son propre PdfReader).
+
+    `taille_cache` est la taille du cache mesurée par le processus principal.
+    """
+    cache = PageTextCache(cache_dir, cache_max_bytes, taille_cache) if cache_dir else None
+    return list(lire_pages(path, sha256, cache, debut, fin))
+
+# ================================
+# Écriture en base (processus principal uniquement)
+# ================================
+INSERT_ARTICLE = """
+    INSERT INTO articles 
+    (texte_juridique_id, numero_article, titre_article, contenu_article, position_ordre)
+    VALUES (%s, %s, %s, %s, %s)
+    """
+
+class Chronometre:
+    """Cumule la durée des écritures en base, hors extraction des PDF"""
+    
+    def __init__(self):
+        self.secondes = 0.0
+    
+    @contextlib.contextmanager
+    def mesurer(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.secondes += time.perf_counter() - started
+
+def inserer_texte(db, cursor, pdf, reprise=None):
+    """
+    Insère la ligne textes_juridiques d'un document ; renvoie son identifiant.
+
+    Le point de reprise éventuel est créé dans la même transaction : un
+    texte sans articles complets a toujours son point de reprise.
+    """
+    insert_texte = """
+    INSERT INTO textes_juridiques 
+    (titre, contenu, type_texte, date_promulgation, numero_officiel, 
+     domaine_juridique, mots_cles, statut, autorite_emettrice)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """
+    
+    values = (
+        pdf["titre"],
+        f"Texte intégral de {pdf['titre']} (détails dans la table articles).",
+        pdf["type"],
+        pdf["date"],
+        pdf["numero"],
+        pdf["domaine"],
+        pdf["mots_cles"],
+        "ACTIVE",
+        pdf["autorite"]
+    )
+    
+    cursor.execute(insert_texte, values)
+    texte_id = cursor.lastrowid
+    if reprise is not None:
+        reprise.texte_id = texte_id
+        reprise.enregistrer(cursor)
+    db.commit()
+    logger.info(f"✅ {pdf['titre']} inséré avec ID {texte_id}")
+    return texte_id
+
+def inserer_articles(db, cursor, reprise, lignes, batch_size=DEFAULT_BATCH_SIZE, chrono=None):
+    """
+    Insère par lots les couples (page de début, ligne d'article) d'un texte,
+    au fil de l'itérable `lignes` ; renvoie le nombre d'articles insérés.
+
+    Un lot est validé, avec le point de reprise de son dernier article,
+    dès qu'il atteint `batch_size` articles ou qu'une fin de page (ligne
+    None, voir iter_lignes_articles) est reçue. Seul le temps des lots est
+    compté dans `chrono`.
+    """
+    chrono = chrono or Chronometre()
+    articles_inserted = 0
+    batch = []
+    
+    for page, ligne in lignes:
+        if ligne is not None:
+            numero, titre_article, contenu = ligne
+            position = reprise.avancer(page)
+            batch.append((reprise.texte_id, numero, titre_article, contenu, position))
+        if batch and (ligne is None or len(batch) >= batch_size):
+            with chrono.mesurer():
+                articles_inserted += inserer_lot(db, cursor, INSERT_ARTICLE, batch, reprise.enregistrer)
+            batch = []
+    
+    if batch:
+        with chrono.mesurer():
+            articles_inserted += inserer_lot(db, cursor, INSERT_ARTICLE, batch, reprise.enregistrer)
+    return articles_inserted
+
+def terminer_import(db, cursor, reprise, pdf, resultat):
+    """Remplace le point de reprise d'un document importé par son manifeste ; renvoie son nombre d'articles"""
+    cursor.execute("SELECT COUNT(*) FROM articles WHERE texte_juridique_id = %s", (reprise.texte_id,))
+    nombre_articles = cursor.fetchone()[0]
+    reprise.supprimer(cursor)
+    enregistrer_manifeste(db, cursor, reprise.texte_id, pdf, resultat, nombre_articles)
+    return nombre_articles
+
+def inserer_document(db, cursor, pdf, resultat, batch_size=DEFAULT_BATCH_SIZE):
+    """Insère le texte juridique puis ses articles ; renvoie le nombre d'articles insérés"""
+    lignes = resultat["lignes"]
+    reprise = PointDeReprise(None, pdf, resultat["sha256"])
+    inserer_texte(db, cursor, pdf, reprise)
+    
+    logger.info(f"📖 {len(lignes)} articles trouvés pour {pdf['titre']}")
+    
+    articles_inserted = inserer_articles(db, cursor, reprise, zip(resultat["debuts"], lignes), batch_size)
+    terminer_import(db, cursor, reprise, pdf, resultat)
+    logger.info(f"✅ {articles_inserted} articles insérés pour {pdf['titre']}")
+    return articles_inserted
+
+def ignorer_articles_valides(lignes, reprise):
+    """Écarte, à la reprise, les articles de la page de reprise déjà validés"""
+    a_ignorer = reprise.articles_page
+    for page, ligne in lignes:
+        if a_ignorer and ligne is not None and page == reprise.page:
+            a_ignorer -= 1
+            continue
+        yield page, ligne
+
+def importer_document_en_flux(db, cursor, pdf, batch_size=DEFAULT_BATCH_SIZE,
+                              cache_dir=DEFAULT_CACHE_DIR, cache_max_bytes=DEFAULT_MAX_BYTES,
+                              reprise=None, chrono=None):
+    """
+    Importe un document page par page : les articles clos sur une page
+    sont validés en base à la fin de cette page (par lots d'au plus
+    `batch_size`), sans attendre la fin de l'extraction.
+
+    Pour un nouveau document, la ligne textes_juridiques est insérée à la
+    fermeture du premier article ; un document sans article n'est pas
+    inséré. Avec un point de reprise, l'extraction reprend à la page où
+    commence le dernier article validé et les articles déjà validés de
+    cette page sont écartés. Seules les écritures en base sont comptées
+    dans `chrono`. Renvoie le nombre d'articles insérés.
+    """
+    chrono = chrono or Chronometre()
+    reader = PdfReader(pdf["path"])
+    cache = PageTextCache(cache_dir, cache_max_bytes) if cache_dir else None
+    sha256 = sha256_fichier(pdf["path"])
+    
+    if reprise is not None:
+        if reprise.sha256 != sha256:
+            raise ValueError(f"{pdf['path']} a changé depuis l'import interrompu, reprise impossible")
+        logger.info(f"⏯️ Reprise de {pdf['titre']} à la page {reprise.page + 1} "
+                    f"(article {reprise.position})")
+        pages = lire_pages(pdf["path"], sha256, cache, debut=reprise.page, reader=reader)
+        lignes = ignorer_articles_valides(iter_lignes_articles(pages, fins_de_page=True), reprise)
+    else:
+        pages = lire_pages(pdf["path"], sha256, cache, reader=reader)
+        lignes = iter_lignes_articles(pages, fins_de_page=True)
+        premiere = next((couple for couple in lignes if couple[1] is not None), None)
+        if premiere is None:
+            logger.warning(f"Aucun article extrait de {pdf['titre']}")
+            return 0
+        reprise = PointDeReprise(None, pdf, sha256)
+        with chrono.mesurer():
+            inserer_texte(db, cursor, pdf, reprise)
+        lignes = itertools.chain([premiere], lignes)
+    
+    articles_inserted = inserer_articles(db, cursor, reprise, lignes, batch_size, chrono)
+    with chrono.mesurer():
+        terminer_import(db, cursor, reprise, pdf, {"pages": len(reader.pages), "sha256": sha256})
+    if cache:
+        logger.info(f"🗂️ {pdf['path']}: {cache.hits} pages lues depuis le cache, {cache.misses} extraites")
+    logger.info(f"✅ {articles_inserted} articles insérés pour {pdf['titre']}")
+    return articles_inserted
+
+def mettre_a_jour_document(db, cursor, texte_id, pdf, resultat, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Applique aux articles existants d'un texte la différence avec la nouvelle extraction.
+
+    Les articles sont appariés par (numero_article, rang d'occurrence) : un
+    article ajouté au milieu du code ne provoque donc que son insertion et
+    la mise à jour des positions qui suivent. Renvoie le nombre d'articles.
+    """
+    cursor.execute(
+        "SELECT id, numero_article, titre_article, contenu_article, position_ordre "
+        "FROM articles WHERE texte_juridique_id = %s ORDER BY position_ordre",
+        (texte_id,)
+    )
+    existants = {}
+    occurrences = {}
+    for article_id, numero, titre_article, contenu, position in cursor.fetchall():
+        rang = occurrences.get(numero, 0)
+        occurrences[numero] = rang + 1
+        existants[(numero, rang)] = (article_id, titre_article, contenu, position)
+    
+    a_inserer = []
+    a_modifier = []
+    occurrences = {}
+    for position, (numero, titre_article, contenu) in enumerate(resultat["lignes"], 1):
+        rang = occurrences.get(numero, 0)
+        occurrences[numero] = rang + 1
+        ancien = existants.pop((numero, rang), None)
+        if ancien is None:
+            a_inserer.append((texte_id, numero, titre_article, contenu, position))
+        elif ancien[1:] != (titre_article, contenu, position):
+            a_modifier.append((titre_article, contenu, position, ancien[0]))
+    a_supprimer = [ancien[0] for ancien in existants.values()]
+    
+    update_article = """
+    UPDATE articles SET titre_article = %s, contenu_article = %s, position_ordre = %s
+    WHERE id = %s
+    """
+    for start in range(0, len(a_supprimer), batch_size):
+        ids = a_supprimer[start:start + batch_size]
+        placeholders = ", ".join(["%s"] * len(ids))
+        cursor.execute(f"DELETE FROM articles WHERE id IN ({placeholders})", ids)
+    for start in range(0, len(a_modifier), batch_size):
+        cursor.executemany(update_article, a_modifier[start:start + batch_size])
+    for start in range(0, len(a_inserer), batch_size):
+        cursor.executemany(INSERT_ARTICLE, a_inserer[start:start + batch_size])
+    
+    total = len(resultat["lignes"])
+    enregistrer_manifeste(db, cursor, texte_id, pdf, resultat, total)
+    db.commit()
+    logger.info(f"🔁 {pdf['titre']}: {len(a_inserer)} ajoutés, {len(a_modifier)} modifiés, "
+                f"{len(a_supprimer)} supprimés")
+    return total
+
+def inserer_lot(db, cursor, requete, batch, avant_commit=None):
+    """
+    Insère un lot de lignes en une seule requête multi-VALUES puis valide.
+
+    Si le lot échoue, il est annulé et rejoué ligne par ligne afin de
+    n'écarter que les articles fautifs. `avant_commit(cursor)` est exécuté
+    dans la transaction du lot (point de reprise).
+    """
+    try:
+        cursor.executemany(requete, batch)
+        if avant_commit:
+            avant_commit(cursor)
+        db.commit()
+        return len(batch)
+    except ERREURS_BASE as err:
+        logger.warning(f"Lot de {len(batch)} articles rejeté ({err}), insertion ligne par ligne")
+        db.rollback()
+    
+    inserted = 0
+    for values in batch:
+        try:
+            cursor.execute(requete, values)
+            inserted += 1
+        except ERREURS_BASE as e:
+            logger.error(f"Erreur lors de l'insertion de l'article {values[1]}: {e}")
+    if avant_commit:
+        avant_commit(cursor)
+    db.commit()
+    return inserted
+
+# ================================
+# Chargement en masse (LOAD DATA LOCAL INFILE)
+# ================================
+# Index reconstruits une seule fois après le chargement plutôt qu'à chaque
+# ligne. idx_texte_position est conservé : la clé étrangère articles_ibfk_1
+# a besoin d'un index sur texte_juridique_id.
+INDEX_DIFFERES = {
+    "idx_articles_recherche": "ADD KEY `idx_articles_recherche` (`texte_juridique_id`,`numero_article`)",
+    "idx_fulltext_articles": "ADD FULLTEXT KEY `idx_fulltext_articles` (`titre_article`,`contenu_article`)",
+}
+
+LOAD_ARTICLES = """
+    LOAD DATA LOCAL INFILE %s INTO TABLE articles
+    CHARACTER SET utf8mb4
+    FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'
+    LINES TERMINATED BY '\\n'
+    (texte_juridique_id, numero_article, titre_article, contenu_article, position_ordre)
+    """
+
+# Caractères interprétés par LOAD DATA avec ESCAPED BY '\\'
+ECHAPPEMENTS_TSV = str.maketrans({
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+    "\0": "\\0",
+})
+
+def champ_tsv(valeur):
+    """Échappe une valeur pour LOAD DATA ; None devient \\N (NULL)"""
+    if valeur is None:
+        return "\\N"
+    return str(valeur).translate(ECHAPPEMENTS_TSV)
+
+def ecrire_document_tsv(db, cursor, fichier, pdf, resultat):
+    """
+    Insère la ligne textes_juridiques d'un document et écrit ses articles
+    dans le fichier TSV ouvert `fichier` ; renvoie son point de reprise.
+
+    Le point de reprise reste à l'article 0 jusqu'au chargement : si
+    celui-ci échoue, le document est réimporté en entier avec --resume.
+    """
+    reprise = PointDeReprise(None, pdf, resultat["sha256"])
+    inserer_texte(db, cursor, pdf, reprise)
+    
+    position = 0
+    for position, (numero, titre_article, contenu) in enumerate(resultat["lignes"], 1):
+        valeurs = (reprise.texte_id, numero, titre_article, contenu, position)
+        fichier.write("\t".join(champ_tsv(valeur) for valeur in valeurs) + "\n")
+    logger.info(f"📝 {position} articles de {pdf['titre']} écrits pour le chargement en masse")
+    return reprise
+
+def suspendre_index(db, cursor):
+    """Supprime les index différés présents sur articles ; renvoie leurs noms"""
+    cursor.execute(
+        "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'articles'"
+    )
+    existants = {row[0] for row in cursor.fetchall()}
+    suspendus = [nom for nom in INDEX_DIFFERES if nom in existants]
+    for nom in suspendus:
+        cursor.execute(f"ALTER TABLE articles DROP INDEX `{nom}`")
+    db.commit()
+    return suspendus
+
+def retablir_index(db, cursor, noms):
+    """Reconstruit les index différés (un ALTER par index : InnoDB n'ajoute qu'un FULLTEXT à la fois)"""
+    for nom in noms:
+        started = time.perf_counter()
+        cursor.execute(f"ALTER TABLE articles {INDEX_DIFFERES[nom]}")
+        logger.info(f"🔨 Index {nom} reconstruit en {time.perf_counter() - started:.2f}s")
+    db.commit()
+
+def charger_articles_tsv(db, cursor, path):
+    """
+    Charge le fichier TSV dans articles avec les index secondaires et
+    FULLTEXT suspendus ; renvoie le nombre de lignes chargées.
+
+    Les index sont reconstruits même si le chargement échoue ; l'erreur
+    du chargement reste alors celle qui est propagée.
+    """
+    suspendus = suspendre_index(db, cursor)
+    try:
+        started = time.perf_counter()
+        cursor.execute(LOAD_ARTICLES, (path,))
+        charges = cursor.rowcount
+        db.commit()
+        logger.info(f"🚚 {charges} articles chargés par LOAD DATA en {time.perf_counter() - started:.2f}s")
+    except BaseException:
+        db.rollback()
+        try:
+            retablir_index(db, cursor, suspendus)
+        except Exception:
+            logger.exception(f"Index {', '.join(suspendus)} non reconstruits après l'échec du chargement")
+        raise
+    retablir_index(db, cursor, suspendus)
+    return charges
+
+# ================================
+# Manifeste des imports
+# ================================
+def enregistrer_manifeste(db, cursor, texte_id, pdf, resultat, nombre_articles):
+    """Enregistre l'empreinte, le nombre de pages et d'articles importés d'un PDF"""
+    cursor.execute(
+        """
+        REPLACE INTO import_manifest
+        (texte_juridique_id, fichier, sha256, nombre_pages, nombre_articles)
+        VALUES (%s, %s, %s, %s, %s)
+        """,
+        (texte_id, pdf["path"], resultat["sha256"], resultat["pages"], nombre_articles)
+    )
+    db.commit()
+
+# ================================
+# Points de reprise des imports
+# ================================
+class PointDeReprise:
+    """
+    Dernier article validé d'un import en cours : page (index à partir de
+    0) où il commence, nombre d'articles validés commençant sur cette page
+    et position_ordre. Enregistré dans la transaction de chaque lot.
+    """
+    
+    def __init__(self, texte_id, pdf, sha256, page=0, articles_page=0, position=0):
+        self.texte_id = texte_id
+        self.fichier = pdf["path"]
+        self.sha256 = sha256
+        self.page = page
+        self.articles_page = articles_page
+        self.position = position
+    
+    def avancer(self, page):
+        """Compte un article commençant à `page` ; renvoie sa position"""
+        if page != self.page:
+            self.page = page
+            self.articles_page = 0
+        self.articles_page += 1
+        self.position += 1
+        return self.position
+    
+    def enregistrer(self, cursor):
+        cursor.execute(
+            """
+            REPLACE INTO import_checkpoints
+            (texte_juridique_id, fichier, sha256, page, articles_page, position_ordre)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            """,
+            (self.texte_id, self.fichier, self.sha256, self.page, self.articles_page, self.position)
+        )
+    
+    def supprimer(self, cursor):
+        cursor.execute("DELETE FROM import_checkpoints WHERE texte_juridique_id = %s", (self.texte_id,))
+    
+    @classmethod
+    def lire(cls, cursor, texte_id, pdf):
+        """Point de reprise d'un texte, ou None si son import est terminé"""
+        cursor.execute(
+            "SELECT sha256, page, articles_page, position_ordre FROM import_checkpoints "
+            "WHERE texte_juridique_id = %s",
+            (texte_id,)
+        )
+        row = cursor.fetchone()
+        return cls(texte_id, pdf, *row) if row else None
+
+def documents_a_importer(cursor, incremental=False, resume=False):
+    """
+    Filtre la liste PDFS et renvoie les triplets (pdf, texte_id, reprise)
+    à traiter.
+
+    texte_id vaut None pour un document absent de la base. Un document dont
+    l'import a été interrompu a un point de reprise : il est repris avec
+    `resume`, signalé sinon. En mode incrémental, un document déjà présent
+    est retraité si l'empreinte de son PDF diffère de celle du manifeste.
+    """
+    a_importer = []
+    for pdf in PDFS:
+        # Vérification de l'existence du fichier
+        if not check_file_exists(pdf["path"]):
+            logger.warning(f"Fichier {pdf['path']} ignoré (non trouvé)")
+            continue
+        
+        # Vérification si le document existe déjà
+        cursor.execute("SELECT id FROM textes_juridiques WHERE titre = %s", (pdf["titre"],))
+        row = cursor.fetchone()
+        if not row:
+            a_importer.append((pdf, None, None))
+            continue
+        
+        texte_id = row[0]
+        reprise = PointDeReprise.lire(cursor, texte_id, pdf)
+        if reprise is not None:
+            if resume:
+                a_importer.append((pdf, texte_id, reprise))
+            else:
+                logger.warning(f"Import de '{pdf['titre']}' interrompu à l'article {reprise.position} : "
+                               f"relancer avec --resume")
+            continue
+        
+        if not incremental:
+            logger.warning(f"Document '{pdf['titre']}' déjà présent dans la base")
+            continue
+        
+        cursor.execute("SELECT sha256 FROM import_manifest WHERE texte_juridique_id = %s", (texte_id,))
+        manifeste = cursor.fetchone()
+        if manifeste and manifeste[0] == sha256_fichier(pdf["path"]):
+            logger.info(f"⏭️ Document '{pdf['titre']}' inchangé")
+            continue
+        
+        logger.info(f"🔁 Document '{pdf['titre']}' modifié, réimport incrémental")
+        a_importer.append((pdf, texte_id, None))
+    return a_importer
+
+def iter_extractions(pdfs, workers, cache_dir=DEFAULT_CACHE_DIR, cache_max_bytes=DEFAULT_MAX_BYTES,
+                     pages_par_plage=DEFAULT_PAGES_PAR_PLAGE):
+    """
+    Produit les triplets (pdf, resultat, erreur), dans l'ordre de `pdfs`.
+
+    Avec workers > 1, chaque PDF est découpé en plages de pages extraites
+    par un pool de processus : un gros code occupe tous les cœurs au lieu
+    d'un seul. Le processus principal donne ensuite les pages, dans
+    l'ordre, au découpeur en flux ; les articles à cheval sur deux plages
+    sont ainsi recollés et le résultat est identique à une exécution
+    séquentielle.
+    """
+    if workers <= 1:
+        for pdf in pdfs:
+            logger.info(f"📘 Traitement de {pdf['titre']}...")
+            try:
+                yield pdf, extraire_document(pdf, cache_dir, cache_max_bytes), None
+            except Exception as e:
+                yield pdf, None, e
+        return
+    
+    logger.info(f"⚙️ Extraction parallèle de {len(pdfs)} documents sur {workers} processus "
+                f"(plages de {pages_par_plage} pages)")
+    # Taille du cache mesurée une fois ici plutôt que dans chaque processus
+    taille_cache = PageTextCache(cache_dir, cache_max_bytes).disk_usage() if cache_dir else None
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Toutes les plages sont soumises d'emblée : le pool reste occupé
+        # pendant que le processus principal découpe les premiers documents
+        documents = []
+        for pdf in pdfs:
+            try:
+                sha256 = sha256_fichier(pdf["path"])
+                nombre_pages = len(PdfReader(pdf["path"]).pages)
+                futures = [
+                    executor.submit(extraire_plage, pdf["path"], sha256, debut, fin, cache_dir, cache_max_bytes,
+                                    taille_cache)
+                    for debut, fin in plages_de_pages(nombre_pages, pages_par_plage)
+                ]
+                documents.append((pdf, sha256, nombre_pages, futures, None))
+            except Exception as e:
+                documents.append((pdf, None, None, [], e))
+        
+        for pdf, sha256, nombre_pages, futures, erreur in documents:
+            if erreur is not None:
+                yield pdf, None, erreur
+                continue
+            logger.info(f"📘 Traitement de {pdf['titre']} ({len(futures)} plages)...")
+            try:
+                pages = (page for future in futures for page in future.result())
+                yield pdf, resultat_document(pages, nombre_pages, sha256), None
+            except Exception as e:
+                for future in futures:
+                    future.cancel()
+                yield pdf, None, e
+
 # ================================
 # Fonction principale d'import
 # ================================
-def import_legal_documents():
-    """Fonction principale d'importation des documents juridiques"""
-    db = connect_to_database()
+def import_legal_documents(workers=1, batch_size=DEFAULT_BATCH_SIZE,
+                           cache_dir=DEFAULT_CACHE_DIR, cache_max_bytes=DEFAULT_MAX_BYTES,
+                           incremental=False, pages_par_plage=DEFAULT_PAGES_PAR_PLAGE, resume=False,
+                           load_data=False, stockage=None):
+    """
+    Fonction principale d'importation des documents juridiques.
+
+    Avec `load_data`, les articles des nouveaux documents sont écrits dans
+    un fichier TSV chargé en une fois par LOAD DATA LOCAL INFILE, index
+    secondaires et FULLTEXT suspendus (reconstruction complète).
+    `stockage` choisit la base cible (MySQL de DB_CONFIG par défaut).
+    """
+    stockage = stockage or StockageMySQL(DB_CONFIG)
+    db = connect_to_database(allow_local_infile=load_data, stockage=stockage)
     cursor = db.cursor()
+    tsv = None
     
     try:
         total_articles = 0
         successful_imports = 0
+        # Écritures en base seules : l'extraction des PDF n'est pas comptée
+        chrono = Chronometre()
         
-        for pdf in PDFS:
+        stockage.creer_tables(cursor)
+        documents = documents_a_importer(cursor, incremental, resume)
+        texte_ids = {pdf["titre"]: texte_id for pdf, texte_id, _reprise in documents}
+        
+        # Les imports interrompus, et en séquentiel les nouveaux documents,
+        # sont importés page par page ; les autres passent par iter_extractions
+        par_pages = workers <= 1 and not load_data
+        en_flux = [(pdf, reprise) for pdf, texte_id, reprise in documents
+                   if reprise is not None or (par_pages and texte_id is None)]
+        pdfs = [pdf for pdf, texte_id, reprise in documents
+                if reprise is None and (not par_pages or texte_id is not None)]
+        
+        if load_data:
+            tsv = tempfile.NamedTemporaryFile("w", encoding="utf-8", newline="", prefix="articles_",
+                                              suffix=".tsv", delete=False)
+        en_attente = []
+        
+        # Un seul processus écrit en base, dans l'ordre des documents
+        for pdf, reprise in en_flux:
             logger.info(f"📘 Traitement de {pdf['titre']}...")
+            try:
+                articles = importer_document_en_flux(db, cursor, pdf, batch_size, cache_dir,
+                                                     cache_max_bytes, reprise, chrono)
+                total_articles += articles
+                if articles or reprise is not None:
+                    successful_imports += 1
+            except Exception as e:
+                logger.error(f"Erreur lors du traitement de {pdf['titre']}: {e}")
+                db.rollback()
+        
+        for pdf, resultat, erreur in iter_extractions(pdfs, workers, cache_dir, cache_max_bytes, pages_par_plage):
+            if erreur is not None:
+                logger.error(f"Erreur lors du traitement de {pdf['titre']}: {erreur}")
+                continue
             
-            # Vérification de l'existence du fichier
-            if not check_file_exists(pdf["path"]):
-                logger.warning(f"Fichier {pdf['path']} ignoré (non trouvé)")
+            if resultat is None:
+                logger.error(f"Aucun texte extrait de {pdf['path']}")
+                continue
+            
+            if not resultat["lignes"]:
+                logger.warning(f"Aucun article extrait de {pdf['titre']}")
                 continue
             
             try:
-                # Vérification si le document existe déjà
-                cursor.execute("SELECT id FROM textes_juridiques WHERE titre = %s", (pdf["titre"],))
-                if cursor.fetchone():
-                    logger.warning(f"Document '{pdf['titre']}' déjà présent dans la base")
-                    continue
-                
-                # Lecture du PDF
-                reader = PdfReader(pdf["path"])
-                full_text = ""
-                
-                for page_num, page in enumerate(reader.pages, 1):
-                    try:
-                        text = page.extract_text()
-                        if text:
-                            full_text += clean_text(text) + "\n"
-                    except Exception as e:
-                        logger.warning(f"Erreur lors de la lecture de la page {page_num}: {e}")
-                
-                if not full_text.strip():
-                    logger.error(f"Aucun texte extrait de {pdf['path']}")
-                    continue
-                
-                # Insertion du texte global
-                insert_texte = """
-                INSERT INTO textes_juridiques 
-                (titre, contenu, type_texte, date_promulgation, numero_officiel, 
-                 domaine_juridique, mots_cles, statut, autorite_emettrice)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-                
-                values = (
-                    pdf["titre"],
-                    f"Texte intégral de {pdf['titre']} (détails dans la table articles).",
-                    pdf["type"],
-                    pdf["date"],
-                    pdf["numero"],
-                    pdf["domaine"],
-                    pdf["mots_cles"],
-                    "ACTIVE",
-                    pdf["autorite"]
-                )
-                
-                cursor.execute(insert_texte, values)
-                db.commit()
-                texte_id = cursor.lastrowid
-                logger.info(f"✅ {pdf['titre']} inséré avec ID {texte_id}")
-                
-                # Extraction et insertion des articles
-                articles = extraire_articles(full_text)
-                logger.info(f"📖 {len(articles)} articles trouvés pour {pdf['titre']}")
-                
-                if articles:
-                    insert_article = """
-                    INSERT INTO articles 
-                    (texte_juridique_id, numero_article, titre_article, contenu_article, position_ordre)
-                    VALUES (%s, %s, %s, %s, %s)
-                    """
-                    
-                    position = 1
-                    articles_inserted = 0
-                    
-                    for match in articles:
-                        try:
-                            numero_complet = match[0].strip()
-                            contenu = clean_text(match[1])
-                            
-                            # Ignorer les articles trop courts (probablement des erreurs d'extraction)
-                            if len(contenu) < 10:
-                                continue
-                            
-                            numero, titre_article = extract_article_info(numero_complet)
-                            
-                            values = (
-                                texte_id, 
-                                numero, 
-                                titre_article, 
-                                contenu, 
-                                position
-                            )
-                            
-                            cursor.execute(insert_article, values)
-                            position += 1
-                            articles_inserted += 1
-                            
-                        except Exception as e:
-                            logger.error(f"Erreur lors de l'insertion de l'article {numero_complet}: {e}")
-                            continue
-                    
-                    db.commit()
-                    logger.info(f"✅ {articles_inserted} articles insérés pour {pdf['titre']}")
-                    total_articles += articles_inserted
-                    successful_imports += 1
-                
-                else:
-                    logger.warning(f"Aucun article extrait de {pdf['titre']}")
-                    
+                texte_id = texte_ids[pdf["titre"]]
+                with chrono.mesurer():
+                    if texte_id is None and tsv is not None:
+                        en_attente.append((pdf, resultat, ecrire_document_tsv(db, cursor, tsv, pdf, resultat)))
+                        continue
+                    if texte_id is None:
+                        total_articles += inserer_document(db, cursor, pdf, resultat, batch_size)
+                    else:
+                        total_articles += mettre_a_jour_document(db, cursor, texte_id, pdf, resultat, batch_size)
+                successful_imports += 1
             except Exception as e:
                 logger.error(f"Erreur lors du traitement de {pdf['titre']}: {e}")
                 db.rollback()
                 continue
         
+        if en_attente:
+            tsv.close()
+            with chrono.mesurer():
+                total_articles += charger_articles_tsv(db, cursor, tsv.name)
+                for pdf, resultat, reprise in en_attente:
+                    terminer_import(db, cursor, reprise, pdf, resultat)
+            successful_imports += len(en_attente)
+        
         logger.info(f"🎉 Import terminé: {successful_imports} documents traités, {total_articles} articles au total")
+        if chrono.secondes > 0:
+            logger.info(f"⏱️ Insertion: {total_articles / chrono.secondes:.0f} lignes/s "
+                        f"({chrono.secondes:.2f} s hors extraction, "
+                        f"{'LOAD DATA' if load_data else f'lots de {batch_size}'})")
         
     except Exception as e:
         logger.error(f"Erreur générale: {e}")
         db.rollback()
         raise
     finally:
+        if tsv is not None:
+            tsv.close()
+            os.remove(tsv.name)
         cursor.close()
         db.close()
         logger.info("Connexion à la base de données fermée")
@@ -313,11 +962,83 @@ def import_legal_documents():
 # ================================
 # Point d'entrée
 # ================================
+def parse_arguments():
+    """Analyse les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Import des codes juridiques PDF dans la base")
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Nombre de processus d'extraction (0 = nombre de cœurs, 1 = séquentiel)"
+    )
+    parser.add_argument(
+        "--pages-per-chunk", type=int, default=DEFAULT_PAGES_PAR_PLAGE,
+        help="Pages extraites par tâche en mode parallèle"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="Nombre d'articles par requête INSERT multi-lignes (validée à chaque lot)"
+    )
+    parser.add_argument(
+        "--cache-dir", default=DEFAULT_CACHE_DIR,
+        help="Répertoire du cache des pages extraites"
+    )
+    parser.add_argument(
+        "--cache-max-mb", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Taille maximale du cache des pages en Mo"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Ré-extraire toutes les pages sans utiliser le cache"
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Retraiter les documents déjà importés dont le PDF a changé"
+    )
+    parser.add_argument(
+        "--resume", action="store_true",
+        help="Reprendre les imports interrompus à leur dernier lot validé"
+    )
+    parser.add_argument(
+        "--backend", choices=sorted(STOCKAGES), default=StockageMySQL.nom,
+        help="Base cible : MySQL (DB_CONFIG) ou fichier SQLite de même schéma"
+    )
+    parser.add_argument(
+        "--sqlite-path", default=DEFAULT_SQLITE_PATH,
+        help="Fichier de la base SQLite (:memory: pour une base éphémère)"
+    )
+    parser.add_argument(
+        "--load-data", action="store_true",
+        help="Charger les articles des nouveaux documents par LOAD DATA LOCAL INFILE "
+             "(index reconstruits à la fin ; local_infile doit être activé sur le serveur)"
+    )
+    args = parser.parse_args()
+    if args.no_cache:
+        args.cache_dir = None
+    if args.batch_size < 1:
+        parser.error("--batch-size doit être supérieur ou égal à 1")
+    if args.pages_per_chunk < 1:
+        parser.error("--pages-per-chunk doit être supérieur ou égal à 1")
+    if args.load_data and not STOCKAGES[args.backend].chargement_en_masse:
+        parser.error(f"--load-data n'est pas disponible avec --backend {args.backend}")
+    if args.workers == 0:
+        args.workers = os.cpu_count() or 1
+    return args
+
 if __name__ == "__main__":
+    args = parse_arguments()
     try:
-        import_legal_documents()
+        import_legal_documents(
+            workers=args.workers,
+            batch_size=args.batch_size,
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+            incremental=args.incremental,
+            pages_par_plage=args.pages_per_chunk,
+            resume=args.resume,
+            load_data=args.load_data,
+            stockage=creer_stockage(args.backend, DB_CONFIG, args.sqlite_path),
+        )
     except KeyboardInterrupt:
         logger.info("Import interrompu par l'utilisateur")
     except Exception as e:
         logger.error(f"Échec de l'import: {e}")
-        exit(1)
\ No newline at end of file
+        exit(1)
@@ -0,0 +1,134 @@
+"""
+Cache disque du texte nettoyé des pages PDF.
+
+Chaque entrée est identifiée par l'empreinte SHA-256 du PDF et l'index de
+la page : un PDF modifié produit une nouvelle empreinte et n'utilise donc
+jamais d'anciennes entrées. La taille totale du cache est bornée ; les
+entrées les moins récemment utilisées sont supprimées en premier.
+"""
+
+import hashlib
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# À incrémenter si clean_text change de comportement
+CACHE_VERSION = "v1"
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "pages")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Taille connue du cache, par répertoire, dans ce processus : l'arborescence
+# n'est parcourue qu'une fois, les instances suivantes (une par document ou
+# par plage de pages) reprennent et tiennent à jour ce total
+_TAILLES = {}
+
+
+def sha256_fichier(path, block_size=1024 * 1024):
+    """Calcule l'empreinte SHA-256 d'un fichier en le lisant par blocs"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class PageTextCache:
+    """Cache (empreinte PDF, index de page) → texte nettoyé"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, size=None):
+        """
+        `size` : taille du cache déjà mesurée par le processus parent ; les
+        processus de travail évitent ainsi de parcourir l'arborescence.
+        Chacun ajoute ensuite ses propres écritures : la limite peut être
+        dépassée au plus du texte extrait par les autres processus pendant
+        l'exécution, jusqu'à la prochaine éviction.
+        """
+        self.directory = os.path.join(directory, CACHE_VERSION)
+        self.max_bytes = max_bytes
+        if size is not None:
+            _TAILLES.setdefault(self.directory, size)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, sha256, page_index):
+        return os.path.join(self.directory, sha256[:2], sha256, f"{page_index:05d}.txt")
+
+    def get(self, sha256, page_index):
+        """Renvoie le texte en cache ou None si la page n'y figure pas"""
+        path = self._path(sha256, page_index)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            # Marque l'entrée comme récemment utilisée pour l'éviction
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return text
+
+    def put(self, sha256, page_index, text):
+        """Enregistre le texte d'une page puis applique la limite de taille"""
+        path = self._path(sha256, page_index)
+        size = self.disk_usage()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = text.encode("utf-8")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        try:
+            # Une entrée remplacée (nouvelle extraction) ne compte plus
+            size -= os.stat(path).st_size
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+
+        _TAILLES[self.directory] = size + len(data)
+        if _TAILLES[self.directory] > self.max_bytes:
+            self._evict()
+
+    def disk_usage(self):
+        """Taille totale des entrées, mesurée une seule fois par processus"""
+        if self.directory not in _TAILLES:
+            _TAILLES[self.directory] = self._walk_usage()
+        return _TAILLES[self.directory]
+
+    def _iter_entries(self):
+        for root, _dirs, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".txt"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _walk_usage(self):
+        return sum(size for _path, size, _mtime in self._iter_entries())
+
+    def _evict(self):
+        """Supprime les entrées les plus anciennes jusqu'à 90 % de la limite"""
+        entries = sorted(self._iter_entries(), key=lambda entry: entry[2])
+        size = sum(entry[1] for entry in entries)
+        target = self.max_bytes * 0.9
+        removed = 0
+        for path, entry_size, _mtime in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                # Déjà supprimée par un autre processus
+                pass
+            size -= entry_size
+        _TAILLES[self.directory] = size
+        if removed:
+            logger.debug(f"🧹 Cache des pages: {removed} entrées supprimées")
@@ -0,0 +1,93 @@
+"""
+Chargement du graphe des renvois entre articles dans references_croisees.
+
+Les articles et les textes sont lus en une requête chacun, les renvois
+résolus en mémoire (legal_references) puis insérés par lots multi-lignes
+dans une seule transaction : les renvois générés précédemment sont
+remplacés, ceux saisis à la main (sans article) sont conservés.
+
+Mise en place : exécuter references_croisees.sql (colonnes article_source_id
+et article_reference_id, index des articles citants).
+"""
+
+import argparse
+import logging
+import time
+from collections import Counter
+
+from loiv2 import DEFAULT_BATCH_SIZE, connect_to_database
+from legal_references import construire_references
+
+logger = logging.getLogger(__name__)
+
+INSERT_REFERENCE = """
+INSERT IGNORE INTO references_croisees
+  (article_source_id, article_reference_id, texte_source_id, texte_reference_id,
+   type_reference, article_source, article_reference)
+VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+
+
+def lire_articles(cursor):
+    """Articles et textes nécessaires à la résolution des renvois"""
+    cursor.execute(
+        "SELECT id, texte_juridique_id, numero_article, contenu_article "
+        "FROM articles ORDER BY texte_juridique_id, position_ordre"
+    )
+    articles = cursor.fetchall()
+    cursor.execute("SELECT id, titre FROM textes_juridiques")
+    return articles, cursor.fetchall()
+
+
+def charger_references(db, cursor, references, batch_size=DEFAULT_BATCH_SIZE):
+    """Remplace les renvois entre articles en une transaction"""
+    db.start_transaction()
+    try:
+        cursor.execute("DELETE FROM references_croisees WHERE article_source_id IS NOT NULL")
+        for debut in range(0, len(references), batch_size):
+            cursor.executemany(INSERT_REFERENCE, references[debut:debut + batch_size])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+
+def importer_references(batch_size=DEFAULT_BATCH_SIZE):
+    """Extrait et charge les renvois ; renvoie les statistiques d'extraction"""
+    db = connect_to_database()
+    cursor = db.cursor(dictionary=True)
+    statistiques = Counter()
+    try:
+        articles, textes = lire_articles(cursor)
+        references = construire_references(articles, textes, statistiques)
+        charger_references(db, cursor, [tuple(reference) for reference in references], batch_size)
+    finally:
+        cursor.close()
+        db.close()
+    return statistiques
+
+
+def parse_arguments():
+    """Analyse les options de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Chargement des renvois entre articles")
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="Nombre de renvois par requête INSERT multi-lignes"
+    )
+    args = parser.parse_args()
+    if args.batch_size < 1:
+        parser.error("--batch-size doit être supérieur ou égal à 1")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    try:
+        debut = time.time()
+        statistiques = importer_references(args.batch_size)
+        logger.info(f"🔗 {statistiques['citations']} citations, {statistiques['references']} renvois chargés, "
+                    f"{statistiques['non_resolus']} numéros introuvables")
+        logger.info(f"✅ Renvois chargés en {time.time() - debut:.2f}s")
+    except Exception as e:
+        logger.error(f"Échec du chargement des renvois: {e}")
+        exit(1)
@@ -0,0 +1,15 @@
+-- Renvois article → article dans references_croisees (references_croisees.py).
+-- À exécuter une fois sur senegal_juridique.
+
+-- Les renvois relient désormais deux articles ; l'unicité par couple de
+-- textes et type n'autorisait qu'un seul renvoi entre deux codes
+ALTER TABLE `references_croisees`
+  ADD COLUMN `article_source_id` bigint(20) DEFAULT NULL AFTER `texte_reference_id`,
+  ADD COLUMN `article_reference_id` bigint(20) DEFAULT NULL AFTER `article_source_id`,
+  DROP INDEX `unique_reference`,
+  ADD UNIQUE KEY `unique_reference` (`texte_source_id`, `texte_reference_id`, `type_reference`, `article_source_id`, `article_reference_id`),
+  -- « Articles citant celui-ci » et « articles cités par celui-ci »
+  ADD KEY `idx_article_reference` (`article_reference_id`, `article_source_id`),
+  ADD KEY `idx_article_source` (`article_source_id`, `article_reference_id`),
+  ADD CONSTRAINT `references_croisees_ibfk_3` FOREIGN KEY (`article_source_id`) REFERENCES `articles` (`id`) ON DELETE CASCADE,
+  ADD CONSTRAINT `references_croisees_ibfk_4` FOREIGN KEY (`article_reference_id`) REFERENCES `articles` (`id`) ON DELETE CASCADE;
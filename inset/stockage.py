@@ -0,0 +1,238 @@
+"""
+Bases de données cibles de l'import des codes juridiques (loiv2).
+
+Deux implémentations du même schéma (textes_juridiques, articles et les
+tables de suivi import_manifest / import_checkpoints) :
+    - StockageMySQL : la base MariaDB/MySQL senegal_juridique, dont les
+      tables textes_juridiques et articles proviennent du dump ;
+    - StockageSQLite : un fichier SQLite (ou ":memory:") créé à la volée,
+      sans serveur, pour mesurer le débit d'import en local ou en
+      intégration continue.
+
+Les requêtes de loiv2 sont écrites avec les marqueurs %s de
+mysql.connector ; la connexion SQLite les convertit en marqueurs ?.
+Le chargement LOAD DATA et l'index FULLTEXT n'existent qu'avec MySQL.
+"""
+
+import logging
+import sqlite3
+
+import mysql.connector
+
+logger = logging.getLogger(__name__)
+
+# Erreurs de base de données des deux implémentations
+ERREURS_BASE = (mysql.connector.Error, sqlite3.Error)
+
+DEFAULT_SQLITE_PATH = "senegal_juridique.sqlite3"
+
+# ================================
+# MySQL / MariaDB
+# ================================
+CREATE_MANIFEST_TABLE = """
+CREATE TABLE IF NOT EXISTS import_manifest (
+  texte_juridique_id bigint(20) NOT NULL PRIMARY KEY,
+  fichier varchar(500) NOT NULL,
+  sha256 char(64) NOT NULL,
+  nombre_pages int(11) NOT NULL,
+  nombre_articles int(11) NOT NULL,
+  date_import timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp(),
+  CONSTRAINT import_manifest_ibfk_1 FOREIGN KEY (texte_juridique_id)
+    REFERENCES textes_juridiques (id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+CREATE_CHECKPOINT_TABLE = """
+CREATE TABLE IF NOT EXISTS import_checkpoints (
+  texte_juridique_id bigint(20) NOT NULL PRIMARY KEY,
+  fichier varchar(500) NOT NULL,
+  sha256 char(64) NOT NULL,
+  page int(11) NOT NULL,
+  articles_page int(11) NOT NULL,
+  position_ordre int(11) NOT NULL,
+  date_maj timestamp NOT NULL DEFAULT current_timestamp() ON UPDATE current_timestamp(),
+  CONSTRAINT import_checkpoints_ibfk_1 FOREIGN KEY (texte_juridique_id)
+    REFERENCES textes_juridiques (id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+"""
+
+
+class StockageMySQL:
+    """Base MariaDB/MySQL décrite par une configuration mysql.connector"""
+
+    nom = "mysql"
+    chargement_en_masse = True
+
+    def __init__(self, config):
+        self.config = config
+
+    def connecter(self, allow_local_infile=False):
+        return mysql.connector.connect(**self.config, allow_local_infile=allow_local_infile)
+
+    def creer_tables(self, cursor):
+        """Crée les tables de suivi ; textes_juridiques et articles viennent du dump"""
+        cursor.execute(CREATE_MANIFEST_TABLE)
+        cursor.execute(CREATE_CHECKPOINT_TABLE)
+
+    def __str__(self):
+        return f"MySQL {self.config.get('database')}@{self.config.get('host')}"
+
+
+# ================================
+# SQLite
+# ================================
+# Schéma du dump senegal_juridique.sql transposé en SQLite (types, ENUM en
+# CHECK) ; l'index FULLTEXT n'a pas d'équivalent direct et n'est pas créé
+SCHEMA_SQLITE = [
+    """
+    CREATE TABLE IF NOT EXISTS textes_juridiques (
+      id INTEGER PRIMARY KEY AUTOINCREMENT,
+      titre TEXT NOT NULL,
+      contenu TEXT NOT NULL,
+      type_texte TEXT NOT NULL CHECK (type_texte IN
+        ('CONSTITUTION','LOI_ORGANIQUE','LOI_ORDINAIRE','DECRET','ARRETE','CIRCULAIRE')),
+      date_promulgation TEXT NOT NULL,
+      numero_officiel TEXT DEFAULT NULL,
+      domaine_juridique TEXT DEFAULT NULL,
+      mots_cles TEXT DEFAULT NULL,
+      statut TEXT DEFAULT 'ACTIVE' CHECK (statut IN ('ACTIVE','ABROGEE','SUSPENDUE','MODIFIEE')),
+      autorite_emettrice TEXT DEFAULT NULL,
+      date_creation TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+      date_modification TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS articles (
+      id INTEGER PRIMARY KEY AUTOINCREMENT,
+      texte_juridique_id INTEGER NOT NULL REFERENCES textes_juridiques (id) ON DELETE CASCADE,
+      numero_article TEXT NOT NULL,
+      titre_article TEXT DEFAULT NULL,
+      contenu_article TEXT NOT NULL,
+      position_ordre INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_texte_position ON articles (texte_juridique_id, position_ordre)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_recherche ON articles (texte_juridique_id, numero_article)",
+    """
+    CREATE TABLE IF NOT EXISTS import_manifest (
+      texte_juridique_id INTEGER NOT NULL PRIMARY KEY
+        REFERENCES textes_juridiques (id) ON DELETE CASCADE,
+      fichier TEXT NOT NULL,
+      sha256 TEXT NOT NULL,
+      nombre_pages INTEGER NOT NULL,
+      nombre_articles INTEGER NOT NULL,
+      date_import TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS import_checkpoints (
+      texte_juridique_id INTEGER NOT NULL PRIMARY KEY
+        REFERENCES textes_juridiques (id) ON DELETE CASCADE,
+      fichier TEXT NOT NULL,
+      sha256 TEXT NOT NULL,
+      page INTEGER NOT NULL,
+      articles_page INTEGER NOT NULL,
+      position_ordre INTEGER NOT NULL,
+      date_maj TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+]
+
+
+def _ligne_dictionnaire(cursor, row):
+    return {colonne[0]: valeur for colonne, valeur in zip(cursor.description, row)}
+
+
+class CurseurSQLite:
+    """Curseur sqlite3 acceptant les requêtes écrites pour mysql.connector"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def execute(self, requete, valeurs=()):
+        self._cursor.execute(requete.replace("%s", "?"), valeurs or ())
+
+    def executemany(self, requete, lignes):
+        self._cursor.executemany(requete.replace("%s", "?"), lignes)
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    def close(self):
+        self._cursor.close()
+
+
+class ConnexionSQLite:
+    """Connexion sqlite3 présentant l'interface utilisée par loiv2"""
+
+    def __init__(self, path):
+        self._db = sqlite3.connect(path)
+        # Les ON DELETE CASCADE du schéma ne s'appliquent qu'avec cette option
+        self._db.execute("PRAGMA foreign_keys = ON")
+
+    def cursor(self, dictionary=False):
+        cursor = self._db.cursor()
+        if dictionary:
+            cursor.row_factory = _ligne_dictionnaire
+        return CurseurSQLite(cursor)
+
+    def commit(self):
+        self._db.commit()
+
+    def rollback(self):
+        self._db.rollback()
+
+    def close(self):
+        self._db.close()
+
+
+class StockageSQLite:
+    """Fichier SQLite (":memory:" pour une base éphémère) au schéma de senegal_juridique"""
+
+    nom = "sqlite"
+    chargement_en_masse = False
+
+    def __init__(self, path=DEFAULT_SQLITE_PATH):
+        self.path = path
+
+    def connecter(self, allow_local_infile=False):
+        if allow_local_infile:
+            raise ValueError("LOAD DATA LOCAL INFILE n'est disponible qu'avec MySQL")
+        return ConnexionSQLite(self.path)
+
+    def creer_tables(self, cursor):
+        """Crée le schéma complet s'il n'existe pas encore"""
+        for ddl in SCHEMA_SQLITE:
+            cursor.execute(ddl)
+
+    def __str__(self):
+        return f"SQLite {self.path}"
+
+
+STOCKAGES = {
+    StockageMySQL.nom: StockageMySQL,
+    StockageSQLite.nom: StockageSQLite,
+}
+
+
+def creer_stockage(nom, config=None, sqlite_path=DEFAULT_SQLITE_PATH):
+    """Instancie le stockage `nom` ("mysql" ou "sqlite")"""
+    if nom == StockageMySQL.nom:
+        return StockageMySQL(config)
+    if nom == StockageSQLite.nom:
+        return StockageSQLite(sqlite_path)
+    raise ValueError(f"Stockage inconnu: {nom} (choix: {', '.join(STOCKAGES)})")
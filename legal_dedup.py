@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Dédoublonnage des articles avant sérialisation
+
+Deux empreintes sont calculées sur la clé de recherche du contenu
+(normalisation.cle_recherche) :
+    - une empreinte exacte (BLAKE2b) : même texte à la casse, aux accents,
+      aux espaces et à la ponctuation près ;
+    - une signature MinHash des 5-grammes de mots, indexée par bandes (LSH) :
+      deux articles dont la similarité de Jaccard estimée dépasse le seuil
+      et portent le même titre sont des quasi-doublons (fragment recopié
+      avec un bout de ligne SQL, césure ou numéro de page en plus...).
+
+Les deux comparaisons se limitent à un même code (texte_juridique_id, à
+défaut catégorie) : deux codes peuvent reprendre mot pour mot la même
+disposition, et chacun doit la conserver. Le titre est en outre exigé pour
+les quasi-doublons : deux articles distincts d'un même code diffèrent
+parfois de quelques mots seulement (« La menace... » / « L'insulte commise
+par le biais d'un système informatique... »).
+
+Le dédoublonnage se fait en flux : le premier article d'un groupe est
+conservé, les suivants sont écartés. Le rapport indique le nombre d'octets
+JSON économisés.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from legal_writers import article_record
+from normalisation import cle_recherche
+
+# Taille des n-grammes de mots comparés
+TAILLE_SHINGLE = 5
+
+# Signature MinHash : BANDES × LIGNES_PAR_BANDE valeurs
+BANDES = 16
+LIGNES_PAR_BANDE = 4
+
+# Similarité de Jaccard estimée à partir de laquelle deux articles sont
+# considérés comme des quasi-doublons
+SEUIL_SIMILARITE = 0.85
+
+# Les contenus plus courts (« Abrogé », « du présent Code. ») se répètent
+# légitimement d'un article à l'autre et ne sont jamais écartés
+MOTS_MIN = 20
+
+
+def _hash64(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def shingles(cle: str, taille: int = TAILLE_SHINGLE) -> set:
+    """Empreintes des n-grammes de mots d'une clé de recherche"""
+    mots = cle.split()
+    if len(mots) <= taille:
+        return {_hash64(' '.join(mots))} if mots else set()
+    return {_hash64(' '.join(mots[i:i + taille])) for i in range(len(mots) - taille + 1)}
+
+
+class MinHash:
+    """
+    Signature MinHash à une seule permutation (one permutation hashing) :
+    chaque empreinte de 64 bits est rangée dans l'une des `num_perm` cases
+    selon ses bits de poids faible et chaque case garde la plus petite
+    valeur reçue. Un seul passage sur les n-grammes, au lieu d'un par
+    permutation ; une case vide reprend la valeur de la case non vide
+    suivante (densification).
+    """
+
+    def __init__(self, num_perm: int = BANDES * LIGNES_PAR_BANDE):
+        self.num_perm = num_perm
+
+    def signature(self, empreintes: set) -> Tuple[int, ...]:
+        if not empreintes:
+            return ()
+        k = self.num_perm
+        minimums: List[Optional[int]] = [None] * k
+        for empreinte in empreintes:
+            case, valeur = empreinte % k, empreinte // k
+            courant = minimums[case]
+            if courant is None or valeur < courant:
+                minimums[case] = valeur
+
+        # Densification circulaire : partir d'une case remplie et remonter
+        depart = next(i for i, valeur in enumerate(minimums) if valeur is not None)
+        suivant = minimums[depart]
+        for decalage in range(k, 0, -1):
+            i = (depart + decalage) % k
+            if minimums[i] is None:
+                minimums[i] = suivant
+            else:
+                suivant = minimums[i]
+        return tuple(minimums)
+
+
+def similarite(signature_a: Tuple[int, ...], signature_b: Tuple[int, ...]) -> float:
+    """Similarité de Jaccard estimée de deux signatures"""
+    if not signature_a or len(signature_a) != len(signature_b):
+        return 0.0
+    return sum(1 for a, b in zip(signature_a, signature_b) if a == b) / len(signature_a)
+
+
+def portee(article: Dict[str, Any]) -> Any:
+    """Code dans lequel les doublons d'un article sont recherchés"""
+    texte_id = article.get('texte_juridique_id')
+    return texte_id if texte_id is not None else article.get('category')
+
+
+def taille_json(article: Dict[str, Any]) -> int:
+    """Octets occupés par l'article dans la sortie JSON"""
+    return len(json.dumps(article_record(article), ensure_ascii=False).encode('utf-8'))
+
+
+class Deduplicateur:
+    """
+    Filtre de doublons alimenté article par article.
+
+    `ajouter` renvoie None si l'article est conservé, sinon l'identifiant
+    de l'article déjà conservé dont il est le doublon.
+    """
+
+    def __init__(self, seuil: float = SEUIL_SIMILARITE, bandes: int = BANDES,
+                 lignes_par_bande: int = LIGNES_PAR_BANDE):
+        self.seuil = seuil
+        self.bandes = bandes
+        self.lignes_par_bande = lignes_par_bande
+        self.minhash = MinHash(bandes * lignes_par_bande)
+        self._exactes: Dict[Tuple[Any, bytes], Any] = {}
+        self._buckets: Dict[Tuple[Any, int, Tuple[int, ...]], List[int]] = {}
+        self._signatures: List[Tuple[Any, str, Tuple[int, ...]]] = []
+        self.rapport = {
+            'articles': 0,
+            'conserves': 0,
+            'doublons_exacts': 0,
+            'quasi_doublons': 0,
+            'octets_avant': 0,
+            'octets_apres': 0,
+        }
+
+    def _bandes(self, code: Any, signature: Tuple[int, ...]):
+        for bande in range(self.bandes):
+            debut = bande * self.lignes_par_bande
+            yield code, bande, signature[debut:debut + self.lignes_par_bande]
+
+    def _quasi_doublon(self, code: Any, titre: str, signature: Tuple[int, ...]) -> Optional[Any]:
+        vus = set()
+        for cle in self._bandes(code, signature):
+            for candidat in self._buckets.get(cle, ()):
+                if candidat in vus:
+                    continue
+                vus.add(candidat)
+                article_id, titre_candidat, signature_candidat = self._signatures[candidat]
+                if titre_candidat == titre and similarite(signature, signature_candidat) >= self.seuil:
+                    return article_id
+        return None
+
+    def ajouter(self, article: Dict[str, Any]) -> Optional[Any]:
+        octets = taille_json(article)
+        self.rapport['articles'] += 1
+        self.rapport['octets_avant'] += octets
+
+        # Le contenu seul : la clé de recherche inclut titre et mots-clés,
+        # propres à chaque copie
+        cle = cle_recherche(article.get('content', ''))
+        if len(cle.split()) < MOTS_MIN:
+            return self._conserver(octets)
+
+        code = portee(article)
+        empreinte = (code, hashlib.blake2b(cle.encode('utf-8'), digest_size=16).digest())
+        original = self._exactes.get(empreinte)
+        if original is not None:
+            self.rapport['doublons_exacts'] += 1
+            return original
+
+        titre = cle_recherche(article.get('title', ''))
+        signature = self.minhash.signature(shingles(cle))
+        original = self._quasi_doublon(code, titre, signature) if signature else None
+        if original is not None:
+            self.rapport['quasi_doublons'] += 1
+            return original
+
+        self._exactes[empreinte] = article['id']
+        if signature:
+            position = len(self._signatures)
+            self._signatures.append((article['id'], titre, signature))
+            for cle_bande in self._bandes(code, signature):
+                self._buckets.setdefault(cle_bande, []).append(position)
+        return self._conserver(octets)
+
+    def _conserver(self, octets: int) -> None:
+        self.rapport['conserves'] += 1
+        self.rapport['octets_apres'] += octets
+        return None
+
+    def filtrer(self, articles: Iterable[Dict[str, Any]]):
+        """Articles conservés, dans l'ordre d'arrivée"""
+        for article in articles:
+            if self.ajouter(article) is None:
+                yield article
+
+    def resume(self) -> str:
+        """Résumé du rapport sur une ligne"""
+        r = self.rapport
+        economie = r['octets_avant'] - r['octets_apres']
+        pourcentage = 100 * economie / r['octets_avant'] if r['octets_avant'] else 0.0
+        return (f"{r['conserves']}/{r['articles']} articles conservés "
+                f"({r['doublons_exacts']} doublons exacts, {r['quasi_doublons']} quasi-doublons), "
+                f"{economie / 1024:.0f} Ko économisés ({pourcentage:.1f} %)")
+
+
+def dedupliquer(articles: Iterable[Dict[str, Any]],
+                seuil: float = SEUIL_SIMILARITE) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Dédoublonner une liste d'articles ; renvoie les articles conservés et le rapport"""
+    deduplicateur = Deduplicateur(seuil)
+    conserves = list(deduplicateur.filtrer(articles))
+    return conserves, deduplicateur.rapport
+
+
+def main():
+    """Rapport de dédoublonnage d'un fichier JSON d'articles"""
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "public/legal_articles.json"
+    with open(path, encoding='utf-8') as f:
+        articles = json.load(f)['articles']
+
+    deduplicateur = Deduplicateur()
+    for article in articles:
+        original = deduplicateur.ajouter(article)
+        if original is not None:
+            print(f"   - {article['id']} ~ {original} : {article.get('title', '')}")
+    print(f"🧹 {path} : {deduplicateur.resume()}")
+
+
+if __name__ == "__main__":
+    main()
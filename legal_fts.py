@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Export SQLite du corpus juridique avec index plein texte FTS5
+
+La base produite est autonome et destinée à être embarquée dans
+l'application (Capacitor android/ios) :
+    articles              : articles de l'application
+    articles_fts          : index FTS5 (contenu externe) sur titre, contenu, mots-clés
+    textes_juridiques     : métadonnées des codes (sans le texte intégral)
+    mots_cles_juridiques  : termes, fréquence d'utilisation et synonymes
+    mots_cles_synonymes   : synonymes supplémentaires des mots-clés
+
+Le tokenizer unicode61 avec remove_diacritics 2 rend la recherche
+insensible à la casse et aux accents (« regime » trouve « régime ») et
+coupe sur les apostrophes (« l'article » → « l », « article »).
+"""
+
+import json
+import os
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from search_index import tokenize
+
+DEFAULT_SQLITE_PATH = "public/legal_articles.sqlite"
+
+FTS_TOKENIZER = "unicode61 remove_diacritics 2"
+
+# Tables annexes reprises du dump et colonnes exportées
+ANNEX_COLUMNS = {
+    'textes_juridiques': (
+        'id', 'titre', 'type_texte', 'date_promulgation', 'numero_officiel',
+        'domaine_juridique', 'mots_cles', 'statut', 'autorite_emettrice',
+    ),
+    'mots_cles_juridiques': ('id', 'terme', 'frequence_utilisation', 'synonymes', 'categorie'),
+    'mots_cles_synonymes': ('id', 'mot_cle_id', 'synonyme'),
+}
+
+SCHEMA = f"""
+CREATE TABLE articles (
+    id TEXT PRIMARY KEY,
+    texte_juridique_id INTEGER,
+    position_ordre INTEGER,
+    title TEXT NOT NULL,
+    category TEXT NOT NULL,
+    content TEXT NOT NULL,
+    summary TEXT,
+    tags TEXT
+);
+CREATE TABLE textes_juridiques (
+    id INTEGER PRIMARY KEY,
+    titre TEXT NOT NULL,
+    type_texte TEXT,
+    date_promulgation TEXT,
+    numero_officiel TEXT,
+    domaine_juridique TEXT,
+    mots_cles TEXT,
+    statut TEXT,
+    autorite_emettrice TEXT
+);
+CREATE TABLE mots_cles_juridiques (
+    id INTEGER PRIMARY KEY,
+    terme TEXT NOT NULL,
+    frequence_utilisation INTEGER DEFAULT 0,
+    synonymes TEXT,
+    categorie TEXT
+);
+CREATE TABLE mots_cles_synonymes (
+    id INTEGER PRIMARY KEY,
+    mot_cle_id INTEGER NOT NULL REFERENCES mots_cles_juridiques (id) ON DELETE CASCADE,
+    synonyme TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE articles_fts USING fts5(
+    title, content, tags,
+    content='articles', content_rowid='rowid',
+    tokenize='{FTS_TOKENIZER}'
+);
+"""
+
+
+class SqliteFtsWriter:
+    """
+    Écrivain de la base SQLite, alimenté article par article.
+
+    Les articles sont insérés par lots ; l'index FTS5 est construit en une
+    fois à la fermeture, ce qui est plus rapide que de le tenir à jour
+    ligne par ligne.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, output_path: str = DEFAULT_SQLITE_PATH):
+        self.output_path = output_path
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        self.db = sqlite3.connect(output_path)
+        self.db.executescript(SCHEMA)
+        self.count = 0
+        self._batch = []
+
+    def write(self, article: Dict[str, Any]):
+        self._batch.append((
+            str(article['id']), article.get('texte_juridique_id'), article.get('position_ordre'),
+            article['title'], article['category'], article['content'], article.get('summary'),
+            # Liste JSON : la ponctuation est ignorée par le tokenizer FTS5
+            json.dumps(article.get('tags') or [], ensure_ascii=False),
+        ))
+        self.count += 1
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self):
+        self.db.executemany("INSERT OR REPLACE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?, ?)", self._batch)
+        self._batch = []
+
+    def write_annex(self, table: str, rows: Iterable[Dict[str, Any]]):
+        """Copier les lignes d'une table annexe (voir ANNEX_COLUMNS)"""
+        columns = ANNEX_COLUMNS[table]
+        self.db.executemany(
+            f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            ([row.get(column) for column in columns] for row in rows),
+        )
+
+    def close(self) -> str:
+        """Construire l'index plein texte et compacter la base ; renvoie son chemin"""
+        self._flush()
+        self.db.execute("CREATE INDEX idx_articles_texte ON articles (texte_juridique_id, position_ordre)")
+        self.db.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+        self.db.execute("INSERT INTO articles_fts(articles_fts) VALUES ('optimize')")
+        self.db.commit()
+        self.db.execute("VACUUM")
+        self.db.close()
+        return self.output_path
+
+
+def requete_fts(query: str, prefix: bool = True) -> Optional[str]:
+    """
+    Traduire une saisie utilisateur en expression MATCH.
+
+    Chaque terme est mis entre guillemets (aucune syntaxe FTS5 n'est donc
+    interprétée) et tous doivent être présents ; le dernier est cherché
+    comme préfixe pour la recherche pendant la frappe.
+    """
+    terms = tokenize(query)
+    if not terms:
+        return None
+    expression = ' '.join(f'"{term}"' for term in terms)
+    return expression + '*' if prefix else expression
+
+
+def rechercher_fts(db: sqlite3.Connection, query: str, limit: int = 20,
+                   prefix: bool = True) -> List[Tuple[str, str]]:
+    """Rechercher des articles ; renvoie les couples (id, titre) classés par BM25"""
+    expression = requete_fts(query, prefix)
+    if expression is None:
+        return []
+    return db.execute(
+        "SELECT a.id, a.title FROM articles_fts f JOIN articles a ON a.rowid = f.rowid "
+        "WHERE articles_fts MATCH ? ORDER BY bm25(articles_fts, 5.0, 1.0, 2.0) LIMIT ?",
+        (expression, limit),
+    ).fetchall()
+
+
+def rechercher_sous_chaine(articles: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+    """
+    Recherche actuelle de l'application (realLegalService) : sous-chaîne en
+    minuscules dans le titre, le résumé, le contenu ou les mots-clés.
+    """
+    term = query.strip().lower()
+    return [
+        article for article in articles
+        if term in article['title'].lower()
+        or term in (article.get('summary') or '').lower()
+        or term in article['content'].lower()
+        or any(term in tag.lower() for tag in article.get('tags') or [])
+    ]
+
+
+def charger_articles(db: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """Relire les articles de la base, comme l'application les garde en mémoire"""
+    rows = db.execute("SELECT id, title, summary, content, tags FROM articles").fetchall()
+    return [
+        {'id': row[0], 'title': row[1], 'summary': row[2], 'content': row[3], 'tags': json.loads(row[4] or '[]')}
+        for row in rows
+    ]
+
+
+def main():
+    """Effectuer une recherche dans une base exportée"""
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage : python3 legal_fts.py <requête> [base.sqlite]")
+        sys.exit(1)
+
+    path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_SQLITE_PATH
+    db = sqlite3.connect(path)
+    results = rechercher_fts(db, sys.argv[1])
+    print(f"🔎 {len(results)} résultats pour « {sys.argv[1]} » :")
+    for article_id, title in results:
+        print(f"   - [{article_id}] {title}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
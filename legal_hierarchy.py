@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Index hiérarchique des codes juridiques (Livre / Titre / Chapitre / Section)
+
+Pour chaque texte juridique, l'index est un arbre compact : chaque nœud
+porte son identifiant, celui de son parent, son intitulé et l'intervalle
+des positions d'articles qu'il couvre. Les nœuds d'un texte sont rangés
+par première position, ce qui permet de retrouver la section d'un article
+(ou de sauter à « Titre II ») par recherche dichotomique, sans charger le
+texte des sections.
+
+Les positions sont les position_ordre de la table articles : un nœud du
+texte N renvoie aux articles du fragment texte-N (extract_legal_data_final)
+dont position_ordre est comprise entre premier_article et dernier_article.
+"""
+
+import bisect
+import json
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from article_splitter import NIVEAUX, iter_intitules
+
+
+def chemins_depuis_contenus(rows: Iterable[Tuple[int, int, str]]) -> Iterator[Tuple[int, int, Tuple[str, ...]]]:
+    """
+    Reconstituer le chemin structurel des articles du dump.
+
+    `rows` contient des triplets (texte_juridique_id, position, contenu)
+    triés par texte puis par position. Dans le dump, l'intitulé d'une
+    division figure à la fin du contenu de l'article qui la précède : il
+    s'applique donc à partir de l'article suivant.
+    """
+    chemin: List[Tuple[int, str]] = []
+    texte_courant = None
+
+    for texte_id, position, contenu in rows:
+        if texte_id != texte_courant:
+            chemin = []
+            texte_courant = texte_id
+
+        yield texte_id, position, tuple(intitule for _niveau, intitule in chemin)
+
+        for niveau, intitule in iter_intitules(contenu or ''):
+            chemin = [entree for entree in chemin if entree[0] < niveau]
+            chemin.append((niveau, intitule))
+
+
+def _niveau(intitule: str) -> str:
+    niveau = intitule.split(' ', 1)[0]
+    return niveau if niveau in NIVEAUX else 'SECTION'
+
+
+def construire_hierarchie(articles: Iterable[Tuple[int, Tuple[str, ...]]]) -> List[Dict[str, Any]]:
+    """
+    Construire l'arbre d'un texte à partir de couples (position, chemin).
+
+    Les positions doivent être croissantes. Deux divisions homonymes
+    séparées par une autre division (« CHAPITRE PREMIER » de deux titres
+    différents) donnent deux nœuds distincts.
+    """
+    noeuds: List[Dict[str, Any]] = []
+    ouverts: List[Dict[str, Any]] = []
+
+    for position, chemin in articles:
+        # Longueur du préfixe commun avec les nœuds actuellement ouverts
+        commun = 0
+        while (commun < len(ouverts) and commun < len(chemin)
+               and ouverts[commun]['intitule'] == chemin[commun]):
+            commun += 1
+        del ouverts[commun:]
+
+        for intitule in chemin[commun:]:
+            noeud = {
+                'id': len(noeuds) + 1,
+                'parent_id': ouverts[-1]['id'] if ouverts else None,
+                'niveau': _niveau(intitule),
+                'intitule': intitule,
+                'premier_article': position,
+                'dernier_article': position,
+            }
+            noeuds.append(noeud)
+            ouverts.append(noeud)
+
+        for noeud in ouverts:
+            noeud['dernier_article'] = position
+
+    return noeuds
+
+
+def construire_index_hierarchique(rows: Iterable[Tuple[int, int, str]]) -> Dict[int, List[Dict[str, Any]]]:
+    """Construire l'arbre de chaque texte à partir des lignes (texte, position, contenu)"""
+    par_texte: Dict[int, List[Tuple[int, Tuple[str, ...]]]] = {}
+    for texte_id, position, chemin in chemins_depuis_contenus(rows):
+        par_texte.setdefault(texte_id, []).append((position, chemin))
+
+    return {texte_id: construire_hierarchie(articles) for texte_id, articles in par_texte.items()}
+
+
+def trouver_noeud(noeuds: List[Dict[str, Any]], position: int,
+                  premiers: Optional[List[int]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Renvoyer la division la plus fine contenant l'article à `position`.
+
+    Le dernier nœud ouvert avant `position` est trouvé par dichotomie ;
+    s'il est déjà refermé, la division cherchée est l'un de ses ancêtres,
+    atteints par parent_id (l'identifiant d'un nœud est son rang + 1). La
+    remontée est bornée par la profondeur de l'arbre (len(NIVEAUX)), pas
+    par le nombre de nœuds. `premiers` (liste des `premier_article` des
+    nœuds) peut être calculé une fois pour toutes.
+    """
+    if premiers is None:
+        premiers = [noeud['premier_article'] for noeud in noeuds]
+    index = bisect.bisect_right(premiers, position) - 1
+    noeud = noeuds[index] if index >= 0 else None
+    while noeud is not None and noeud['dernier_article'] < position:
+        parent_id = noeud['parent_id']
+        noeud = noeuds[parent_id - 1] if parent_id is not None else None
+    return noeud
+
+
+def save_hierarchy(index: Dict[int, List[Dict[str, Any]]], output_path: str = "public/legal_hierarchy.json") -> str:
+    """Sauvegarder l'index hiérarchique en JSON compact"""
+    output_data = {
+        "metadata": {
+            "total_textes": len(index),
+            "total_noeuds": sum(len(noeuds) for noeuds in index.values()),
+            "source": "senegal_juridique.sql",
+        },
+        "textes": {str(texte_id): noeuds for texte_id, noeuds in sorted(index.items())},
+    }
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(output_data, f, ensure_ascii=False, separators=(',', ':'))
+
+    return output_path
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Classement BM25 des articles juridiques
+
+Les statistiques BM25 (IDF de chaque terme, normalisation de longueur de
+chaque article) sont calculées une fois à l'extraction et livrées avec
+l'index inversé. Le score d'un article pour un terme se réduit alors à :
+
+    idf[terme] * tf * (k1 + 1) / (tf + norms[doc])
+
+soit quelques accès à des tableaux par terme de la requête.
+"""
+
+import json
+import math
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from legal_synonyms import etendre_requete
+from search_index import load_index, termes, tokenize
+
+K1 = 1.2
+B = 0.75
+
+REFERENCE_QUERIES_PATH = "bm25_reference_queries.json"
+
+
+def calculer_statistiques_bm25(index: Dict[str, Any], k1: float = K1, b: float = B) -> Dict[str, Any]:
+    """Calculer IDF et normalisations de longueur à partir de l'index inversé"""
+    total_docs = len(index['docs'])
+    lengths = [0] * total_docs
+    for postings in index['postings'].values():
+        for doc, tf in postings:
+            lengths[doc] += tf
+
+    avgdl = sum(lengths) / total_docs if total_docs else 0.0
+    idf = {}
+    for term, postings in index['postings'].items():
+        df = len(postings)
+        idf[term] = round(math.log(1 + (total_docs - df + 0.5) / (df + 0.5)), 4)
+
+    norms = [
+        round(k1 * (1 - b + b * length / avgdl), 4) if avgdl else k1
+        for length in lengths
+    ]
+
+    return {'k1': k1, 'b': b, 'avgdl': round(avgdl, 4), 'idf': idf, 'norms': norms}
+
+
+def ponderer_termes(query: str, expansions: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
+    """Termes de la requête (poids 1) complétés par ceux de leurs expansions pondérées"""
+    poids = {term: 1.0 for term in tokenize(query)}
+    if expansions:
+        for cle, poids_expansion in etendre_requete(expansions, query):
+            for term in termes(cle):
+                poids[term] = max(poids.get(term, 0.0), poids_expansion)
+    return poids
+
+
+def classer(index: Dict[str, Any], stats: Dict[str, Any], query: str, limit: int = 10,
+            expansions: Optional[Dict[str, Any]] = None) -> List[Tuple[str, float]]:
+    """
+    Implémentation de référence du classement : renvoie les couples
+    (identifiant d'article, score) les mieux classés pour la requête.
+
+    Avec `expansions`, les synonymes des mots-clés reconnus dans la requête
+    contribuent au score en proportion de leur poids.
+    """
+    k1 = stats['k1']
+    norms = stats['norms']
+    scores: Dict[int, float] = {}
+
+    for term, poids in ponderer_termes(query, expansions).items():
+        idf = stats['idf'].get(term)
+        if idf is None:
+            continue
+        for doc, tf in index['postings'][term]:
+            scores[doc] = scores.get(doc, 0.0) + poids * idf * tf * (k1 + 1) / (tf + norms[doc])
+
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [(index['docs'][doc], round(score, 4)) for doc, score in ranked]
+
+
+def verifier_requetes_reference(index: Dict[str, Any], stats: Dict[str, Any],
+                                path: str = REFERENCE_QUERIES_PATH) -> bool:
+    """
+    Rejouer le corpus de requêtes de référence.
+
+    Chaque requête indique des articles attendus parmi les `top` premiers
+    résultats ; renvoie False si l'un d'eux est absent.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        queries = json.load(f)['queries']
+
+    ok = True
+    for entry in queries:
+        top = [doc_id for doc_id, _score in classer(index, stats, entry['query'], entry['top'])]
+        missing = [doc_id for doc_id in entry['expected'] if doc_id not in top]
+        status = "✅" if not missing else "❌"
+        print(f"{status} « {entry['query']} » → {', '.join(top)}")
+        if missing:
+            print(f"   attendus absents du top {entry['top']} : {', '.join(missing)}")
+            ok = False
+    return ok
+
+
+def main():
+    """Vérifier le classement sur l'index généré"""
+    index_path = sys.argv[1] if len(sys.argv) > 1 else "public/legal_index.json"
+    index = load_index(index_path)
+    stats = index.get('bm25') or calculer_statistiques_bm25(index)
+
+    if not verifier_requetes_reference(index, stats):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
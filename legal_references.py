@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Graphe des renvois entre articles (table references_croisees)
+
+Les renvois sont repérés dans le contenu de chaque article découpé
+(« articles 85, 86 et 87 du présent Code », « article L.70 »,
+« articles 329-7 à 329-9 du Code des assurances ») puis résolus vers des
+identifiants d'articles grâce à un index en mémoire :
+
+    (texte_juridique_id, clé du numéro d'article) → identifiant d'article
+
+Un renvoi sans code nommé (ou vers « le présent code / la présente loi »)
+vise le texte de l'article source ; un code nommé est rapproché des titres
+de textes_juridiques ; les renvois vers des textes absents de la base
+(code de procédure pénale, décrets, Constitution...) sont ignorés.
+
+Le graphe est livré sous forme de listes d'adjacence dans les deux sens :
+« articles cités par celui-ci » et « articles citant celui-ci » sont
+alors de simples accès au dictionnaire.
+"""
+
+import json
+import os
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from normalisation import cle_recherche, fold, recoller_cesures, unifier_apostrophes
+from sql_dump_reader import iter_insert_statements
+
+DEFAULT_REFERENCES_PATH = "public/legal_references.json"
+
+TYPES_REFERENCE = ('MODIFIE', 'ABROGE', 'COMPLETE', 'APPLIQUE')
+
+# Un numéro d'article : préfixe L/R/D éventuel, nombre, sous-numéro (329-7)
+# et suffixe latin (12 bis)
+_NUMERO = r"(?:[lrd]\s?\.?\s?)?\d+(?:\s?-\s?\d+)?(?:\s?(?:bis|ter|quater|quinquies))?(?![\d])"
+
+# « article(s) » ou « art. » suivi d'une liste de numéros séparés par des
+# virgules, « et », « ou » ou « à » (intervalle). Le texte est déjà sans
+# accents ; les PDF collent souvent les mots (« 590à 592 », « et91 »).
+_CITATION = re.compile(
+    rf"\bart(?:icles?|\.)\s*(?P<liste>{_NUMERO}(?:\s*(?:,|\bet\b|et|\bou\b|a\b|a(?=\s?\d))\s*{_NUMERO})*)"
+)
+_ELEMENT = re.compile(rf"(?P<numero>{_NUMERO})|(?P<separateur>,|et|ou|a)")
+
+# Cible du renvoi, cherchée juste après la liste de numéros
+_FENETRE_CIBLE = 80
+_MEME_TEXTE = re.compile(
+    r"^\W*(?:(?:alinea|al\.|paragraphe|§)\s*\d+\W*)?"
+    r"(?:du\s?present\s?(?:code|texte)|de\s?la\s?presente\s?(?:loi|ordonnance)|du\s?present\s?decret|ci-?dessus|ci-?apres)"
+)
+# Intitulé d'article recopié dans le contenu (« Art.606. - Mentions »,
+# « Article L 89 : ») : ce n'est pas un renvoi
+_INTITULE = re.compile(r"^\s?(?:\.\s?-(?!\s?\d)|:)")
+
+_CODE_NOMME = re.compile(r"^\W*(?:(?:alinea|al\.|paragraphe|§)\s*\d+\W*)?d[ue']\s?(?:la\s?|l')?(?P<type>code|loi|decret|ordonnance|acte|traite|reglement|constitution|arrete)")
+
+# Verbe qualifiant le renvoi, cherché juste avant la citation
+_FENETRE_TYPE = 40
+_VERBES_TYPE = (
+    ('ABROGE', re.compile(r"abrog")),
+    ('MODIFIE', re.compile(r"modifi")),
+    ('COMPLETE', re.compile(r"complet")),
+)
+
+# Un intervalle plus large est une erreur de découpage, pas un renvoi
+MAX_INTERVALLE = 50
+
+_NOMBRES_ORDINAUX = {'premier': '1', '1er': '1', 'unique': '1'}
+
+_MOTS_OUTILS = {'de', 'des', 'du', 'la', 'le', 'les', 'l', 'et', 'd'}
+
+
+class Reference(NamedTuple):
+    article_source_id: Any
+    article_reference_id: Any
+    texte_source_id: int
+    texte_reference_id: int
+    type_reference: str
+    article_source: str
+    article_reference: str
+
+
+def texte_recherche(text: str) -> str:
+    """Texte sans accents ni césures, ponctuation conservée"""
+    return fold(recoller_cesures(unifier_apostrophes(text or "")))
+
+
+def cle_numero(numero: str) -> Optional[str]:
+    """
+    Clé d'un numéro d'article : « Article L.70 » → « l70 »,
+    « article 329 -7 » → « 329-7 », « Article premier » → « 1 ».
+    """
+    numero = texte_recherche(numero).strip()
+    numero = re.sub(r"^(?:article|art\.?)\s*", "", numero)
+    for mot, valeur in _NOMBRES_ORDINAUX.items():
+        if numero == mot or numero.startswith(mot + " "):
+            return valeur
+    match = re.match(_NUMERO, numero)
+    if not match:
+        return None
+    return re.sub(r"[\s.]", "", match.group(0))
+
+
+def sans_prefixe(cle: str) -> str:
+    """Clé sans préfixe de partie (L, R, D) : « l70 » → « 70 »"""
+    return cle.lstrip("lrd")
+
+
+def construire_index_numeros(articles: Iterable[Dict[str, Any]]) -> Dict[Tuple[int, str], Dict[str, Any]]:
+    """Index (texte, clé du numéro) → article ; le premier article l'emporte"""
+    index: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    for article in articles:
+        cle = cle_numero(article['numero_article'])
+        if cle is None or article['texte_juridique_id'] is None:
+            continue
+        index.setdefault((article['texte_juridique_id'], cle), article)
+    return index
+
+
+def sigles_codes(textes: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Sigles des codes d'au moins quatre lettres (« COCC » → 17)"""
+    sigles = {}
+    for texte in textes:
+        mots = [mot for mot in cle_recherche(texte['titre']).split() if mot not in _MOTS_OUTILS]
+        if mots and mots[0] == "code" and "senegal" in mots:
+            mots.remove("senegal")
+        sigle = ''.join(mot[0] for mot in mots if mot.isalpha())
+        if len(sigle) >= 4:
+            sigles[sigle] = texte['id']
+    return sigles
+
+
+def alias_codes(textes: Iterable[Dict[str, Any]]) -> List[Tuple[str, int]]:
+    """
+    Désignations des codes telles qu'on les trouve après « du Code » :
+    « Code pénal du Sénégal » → « penal », « Code CIMA des Assurances » →
+    « cimadesassurances » et « desassurances ». Les espaces sont retirées,
+    les PDF en perdant ou en ajoutant au hasard. Les plus longues d'abord.
+    """
+    alias = []
+    for texte in textes:
+        cle = cle_recherche(texte['titre'])
+        if not cle.startswith("code "):
+            continue
+        cle = re.sub(r"\b(?:du senegal|\d{4})\b", " ", cle[len("code "):])
+        variantes = {cle, cle.replace("cima ", "")}
+        for variante in variantes:
+            variante = re.sub(r"[^a-z]", "", variante)
+            if variante:
+                alias.append((variante, texte['id']))
+    return sorted(alias, key=lambda a: -len(a[0]))
+
+
+def developper_liste(liste: str) -> List[str]:
+    """Numéros cités par une liste : « 238 a 240 » → 238, 239, 240"""
+    numeros: List[str] = []
+    intervalle = False
+    for match in _ELEMENT.finditer(liste):
+        if match.group('separateur'):
+            intervalle = match.group('separateur') == 'a'
+            continue
+        cle = re.sub(r"[\s.]", "", match.group('numero'))
+        if intervalle and numeros:
+            debut, fin = numeros[-1], cle
+            prefixe = re.match(r"[lrd]?", debut).group(0)
+            if (debut[len(prefixe):].isdigit() and fin.lstrip("lrd").isdigit()
+                    and 0 < int(fin.lstrip("lrd")) - int(debut[len(prefixe):]) <= MAX_INTERVALLE):
+                numeros.extend(f"{prefixe}{n}" for n in range(int(debut[len(prefixe):]) + 1,
+                                                              int(fin.lstrip("lrd")) + 1))
+                intervalle = False
+                continue
+        numeros.append(cle)
+        intervalle = False
+    return numeros
+
+
+def type_reference(avant: str) -> str:
+    """Type du renvoi d'après le verbe qui précède la citation"""
+    for type_ref, verbe in _VERBES_TYPE:
+        if verbe.search(avant):
+            return type_ref
+    return 'APPLIQUE'
+
+
+def texte_cible(apres: str, texte_source_id: int, alias: List[Tuple[str, int]],
+                sigles: Optional[Dict[str, int]] = None) -> Optional[int]:
+    """Texte visé par une citation ; None si c'est un texte absent de la base"""
+    if _MEME_TEXTE.match(apres):
+        return texte_source_id
+    sigle = re.match(r"\W*([a-z]+)", apres)
+    if sigle and sigles and sigle.group(1) in sigles:
+        return sigles[sigle.group(1)]
+    match = _CODE_NOMME.match(apres)
+    if not match:
+        return texte_source_id
+    if match.group('type') != 'code':
+        return None
+    designation = re.sub(r"[^a-z]", "", apres[match.end():])
+    for variante, texte_id in alias:
+        if designation.startswith(variante):
+            return texte_id
+    return None
+
+
+def extraire_references(article: Dict[str, Any],
+                        index: Dict[Tuple[int, str], Dict[str, Any]],
+                        alias: List[Tuple[str, int]],
+                        sigles: Optional[Dict[str, int]] = None,
+                        statistiques: Optional[Counter] = None) -> List[Reference]:
+    """Renvois d'un article résolus vers les articles cités"""
+    statistiques = statistiques if statistiques is not None else Counter()
+    texte = texte_recherche(article['contenu_article'])
+    references: Dict[Tuple[Any, str], Reference] = {}
+
+    for citation in _CITATION.finditer(texte):
+        apres = texte[citation.end():citation.end() + _FENETRE_CIBLE]
+        if _INTITULE.match(apres):
+            continue
+        statistiques['citations'] += 1
+        cible = texte_cible(apres, article['texte_juridique_id'], alias, sigles)
+        if cible is None:
+            statistiques['textes_externes'] += 1
+            continue
+        type_ref = type_reference(texte[max(0, citation.start() - _FENETRE_TYPE):citation.start()])
+
+        for cle in developper_liste(citation.group('liste')):
+            cite = index.get((cible, cle)) or index.get((cible, sans_prefixe(cle)))
+            if cite is None:
+                statistiques['non_resolus'] += 1
+                continue
+            if cite['id'] == article['id']:
+                continue
+            references.setdefault((cite['id'], type_ref), Reference(
+                article['id'], cite['id'], article['texte_juridique_id'], cible, type_ref,
+                article['numero_article'][:100], cite['numero_article'][:100],
+            ))
+
+    statistiques['references'] += len(references)
+    return list(references.values())
+
+
+def construire_references(articles: List[Dict[str, Any]], textes: Iterable[Dict[str, Any]],
+                          statistiques: Optional[Counter] = None) -> List[Reference]:
+    """Renvois de tous les articles (lignes de la table articles)"""
+    index = construire_index_numeros(articles)
+    textes = list(textes)
+    alias = alias_codes(textes)
+    sigles = sigles_codes(textes)
+    references: List[Reference] = []
+    for article in articles:
+        references.extend(extraire_references(article, index, alias, sigles, statistiques))
+    return references
+
+
+def graphe_references(references: Iterable[Reference]) -> Dict[str, Dict[str, List[Any]]]:
+    """Listes d'adjacence : articles cités et articles citants, par identifiant"""
+    cites: Dict[str, List[Any]] = {}
+    cite_par: Dict[str, List[Any]] = {}
+    for reference in references:
+        source, cible = reference.article_source_id, reference.article_reference_id
+        if cible not in cites.setdefault(str(source), []):
+            cites[str(source)].append(cible)
+        if source not in cite_par.setdefault(str(cible), []):
+            cite_par[str(cible)].append(source)
+    return {'cites': cites, 'cited_by': cite_par}
+
+
+def lire_articles_et_textes(sql_file_path: str = "senegal_juridique.sql") -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Lire les tables articles et textes_juridiques du dump en une seule passe"""
+    tables: Dict[str, List[Dict[str, Any]]] = {'articles': [], 'textes_juridiques': []}
+    for table, columns, rows in iter_insert_statements(sql_file_path, tuple(tables)):
+        tables[table].extend(dict(zip(columns, row)) for row in rows)
+    return tables['articles'], tables['textes_juridiques']
+
+
+def save_references(references: List[Reference], output_path: str = DEFAULT_REFERENCES_PATH) -> str:
+    """Écrire le graphe des renvois au format JSON"""
+    graphe = graphe_references(references)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'metadata': {
+                'references': len(references),
+                'types': dict(Counter(r.type_reference for r in references)),
+            },
+            **graphe,
+        }, f, ensure_ascii=False)
+    return output_path
+
+
+def main():
+    """Extraire le graphe des renvois du dump SQL"""
+    import sys
+
+    sql_file_path = sys.argv[1] if len(sys.argv) > 1 else "senegal_juridique.sql"
+    output_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_REFERENCES_PATH
+
+    articles, textes = lire_articles_et_textes(sql_file_path)
+    statistiques = Counter()
+    references = construire_references(articles, textes, statistiques)
+    save_references(references, output_path)
+
+    print(f"🔗 {statistiques['citations']} citations dans {len(articles)} articles")
+    print(f"   - {len(references)} renvois résolus")
+    print(f"   - {statistiques['non_resolus']} numéros introuvables")
+    print(f"   - {statistiques['textes_externes']} citations de textes absents de la base")
+    print(f"✅ Graphe écrit dans {output_path}")
+
+
+if __name__ == "__main__":
+    main()
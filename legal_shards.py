@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Découpage des articles en fragments (shards) chargés à la demande
+
+Au lieu d'un unique module legalArticles.ts analysé au démarrage, chaque
+code (texte juridique, ou à défaut catégorie) est écrit dans son propre
+fichier JSON. Un petit manifeste décrit les fragments : l'application ne
+charge que celui du code consulté.
+
+Format produit (public/legal_shards/) :
+    manifest.json   : liste des fragments avec fichier, nombre d'articles,
+                      taille, et pour chaque article son identifiant, son
+                      décalage et sa longueur en octets dans le fragment
+    <clé>.json      : tableau JSON des articles, un article par ligne
+"""
+
+import json
+import os
+from typing import Any, Dict, List
+
+from legal_writers import public_article
+
+DEFAULT_SHARDS_DIR = "public/legal_shards"
+MANIFEST_NAME = "manifest.json"
+
+
+def cle_shard(article: Dict[str, Any]) -> str:
+    """Clé du fragment d'un article : son texte juridique, sinon sa catégorie"""
+    texte_id = article.get('texte_juridique_id')
+    if texte_id is not None:
+        return f"texte-{texte_id}"
+    return article.get('category') or 'divers'
+
+
+def grouper_par_shard(articles: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Regrouper les articles par fragment en conservant leur ordre"""
+    groupes: Dict[str, List[Dict[str, Any]]] = {}
+    for article in articles:
+        groupes.setdefault(cle_shard(article), []).append(article)
+    return groupes
+
+
+def ecrire_shard(articles: List[Dict[str, Any]], path: str) -> Dict[str, Any]:
+    """
+    Écrire un fragment article par article.
+
+    Renvoie les identifiants, décalages et longueurs en octets de chaque
+    article, qui permettent d'en relire un seul sans analyser le fichier.
+    """
+    ids, offsets, lengths = [], [], []
+    with open(path, 'wb') as f:
+        f.write(b'[\n')
+        for i, article in enumerate(articles):
+            if i:
+                f.write(b',\n')
+            data = json.dumps(public_article(article), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            ids.append(str(article.get('id', '')))
+            offsets.append(f.tell())
+            lengths.append(len(data))
+            f.write(data)
+        f.write(b'\n]\n')
+        size = f.tell()
+
+    return {'ids': ids, 'offsets': offsets, 'lengths': lengths, 'bytes': size}
+
+
+def save_shards(articles: List[Dict[str, Any]], output_dir: str = DEFAULT_SHARDS_DIR,
+                version: str = "1.0") -> str:
+    """Écrire les fragments et leur manifeste ; renvoie le chemin du manifeste"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    shards = []
+    for cle, groupe in grouper_par_shard(articles).items():
+        fichier = f"{cle}.json"
+        positions = ecrire_shard(groupe, os.path.join(output_dir, fichier))
+        premier = groupe[0]
+        shards.append({
+            'key': cle,
+            'file': fichier,
+            'texte_juridique_id': premier.get('texte_juridique_id'),
+            'category': premier.get('category'),
+            'count': len(groupe),
+            **positions,
+        })
+
+    manifest = {
+        'metadata': {
+            'total_articles': len(articles),
+            'total_shards': len(shards),
+            'source': 'senegal_juridique.sql',
+            'version': version,
+        },
+        'shards': shards,
+    }
+
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+
+    return manifest_path
+
+
+def load_shard_article(output_dir: str, shard: Dict[str, Any], index: int) -> Dict[str, Any]:
+    """Relire un seul article d'un fragment à partir de son décalage"""
+    with open(os.path.join(output_dir, shard['file']), 'rb') as f:
+        f.seek(shard['offsets'][index])
+        return json.loads(f.read(shard['lengths'][index]).decode('utf-8'))
+
+
+def main():
+    """Afficher le contenu du manifeste"""
+    import sys
+
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SHARDS_DIR
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    print(f"🧩 {manifest['metadata']['total_shards']} fragments, "
+          f"{manifest['metadata']['total_articles']} articles :")
+    for shard in manifest['shards']:
+        print(f"   - {shard['file']}: {shard['count']} articles, {shard['bytes'] / 1024:.0f} Ko")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Table d'expansion des requêtes compilée depuis les mots-clés juridiques
+
+Les tables mots_cles_juridiques (terme, frequence_utilisation, synonymes
+séparés par des virgules) et mots_cles_synonymes sont compilées à
+l'extraction en un dictionnaire livré avec l'index de recherche :
+
+    clé de recherche d'un terme → [[clé d'expansion, poids], ...]
+
+Le poids est la fréquence d'utilisation du mot-clé ramenée entre 0 et 1 ;
+un synonyme renvoie aussi vers son terme principal. L'expansion d'une
+requête se résume alors à quelques accès au dictionnaire.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Tuple
+
+from normalisation import cle_recherche
+from sql_dump_reader import iter_insert_statements
+
+KEYWORD_TABLES = ('mots_cles_juridiques', 'mots_cles_synonymes')
+
+_SEPARATEURS_SYNONYMES = re.compile(r"[,;|\n]")
+
+# Longueur maximale (en mots) d'un terme recherché dans une requête
+MAX_MOTS = 4
+
+
+def lire_mots_cles(sql_file_path: str = "senegal_juridique.sql") -> Dict[str, List[Dict[str, Any]]]:
+    """Lire les deux tables de mots-clés du dump en une seule passe"""
+    tables: Dict[str, List[Dict[str, Any]]] = {table: [] for table in KEYWORD_TABLES}
+    for table, columns, rows in iter_insert_statements(sql_file_path, KEYWORD_TABLES):
+        tables[table].extend(dict(zip(columns, row)) for row in rows)
+    return tables
+
+
+def compiler_expansions(mots_cles: Iterable[Dict[str, Any]],
+                        synonymes: Iterable[Dict[str, Any]] = ()) -> Dict[str, List[List[Any]]]:
+    """Construire la table terme → expansions pondérées"""
+    mots_cles = list(mots_cles)
+    groupes: Dict[int, List[str]] = {}
+    frequences: Dict[int, int] = {}
+
+    for mot_cle in mots_cles:
+        variantes = [mot_cle['terme']]
+        if mot_cle.get('synonymes'):
+            variantes += _SEPARATEURS_SYNONYMES.split(mot_cle['synonymes'])
+        groupes[mot_cle['id']] = variantes
+        frequences[mot_cle['id']] = mot_cle.get('frequence_utilisation') or 0
+
+    for synonyme in synonymes:
+        if synonyme['mot_cle_id'] in groupes:
+            groupes[synonyme['mot_cle_id']].append(synonyme['synonyme'])
+
+    maximum = max(frequences.values(), default=0) or 1
+    expansions: Dict[str, Dict[str, float]] = {}
+
+    for mot_cle_id, variantes in groupes.items():
+        poids = round(frequences[mot_cle_id] / maximum, 3)
+        cles = []
+        for variante in variantes:
+            cle = cle_recherche(variante)
+            if cle and cle not in cles:
+                cles.append(cle)
+        # Chaque variante (terme ou synonyme) s'étend vers toutes les autres
+        for cle in cles:
+            cibles = expansions.setdefault(cle, {})
+            for autre in cles:
+                if autre != cle:
+                    cibles[autre] = max(cibles.get(autre, 0.0), poids)
+            # Un terme sans synonyme garde son poids pour le classement
+            cibles.setdefault(cle, poids)
+
+    return {
+        cle: sorted(([autre, poids] for autre, poids in cibles.items()), key=lambda e: (-e[1], e[0]))
+        for cle, cibles in sorted(expansions.items())
+    }
+
+
+def etendre_requete(expansions: Dict[str, List[List[Any]]], query: str,
+                    max_mots: int = MAX_MOTS) -> List[Tuple[str, float]]:
+    """
+    Implémentation de référence de l'expansion : renvoie les couples
+    (clé d'expansion, poids) des termes connus présents dans la requête.
+
+    Les suites de 1 à `max_mots` mots de la requête sont cherchées dans la
+    table, les plus longues d'abord ; un mot déjà couvert n'est plus étendu.
+    """
+    mots = cle_recherche(query).split()
+    couverts = [False] * len(mots)
+    resultat: Dict[str, float] = {}
+
+    for taille in range(min(max_mots, len(mots)), 0, -1):
+        for debut in range(len(mots) - taille + 1):
+            if any(couverts[debut:debut + taille]):
+                continue
+            cibles = expansions.get(' '.join(mots[debut:debut + taille]))
+            if cibles is None:
+                continue
+            couverts[debut:debut + taille] = [True] * taille
+            for cle, poids in cibles:
+                resultat[cle] = max(resultat.get(cle, 0.0), poids)
+
+    return sorted(resultat.items(), key=lambda e: (-e[1], e[0]))
+
+
+def main():
+    """Afficher la table compilée depuis le dump, ou l'expansion d'une requête"""
+    import sys
+
+    tables = lire_mots_cles()
+    expansions = compiler_expansions(tables['mots_cles_juridiques'], tables['mots_cles_synonymes'])
+    if len(sys.argv) > 1:
+        query = ' '.join(sys.argv[1:])
+        print(f"🔁 Expansion de « {query} » :")
+        for cle, poids in etendre_requete(expansions, query):
+            print(f"   - {cle} ({poids})")
+        return
+
+    print(f"🔁 {len(expansions)} termes dans la table d'expansion :")
+    for cle, cibles in expansions.items():
+        print(f"   - {cle}: {', '.join(f'{autre} ({poids})' for autre, poids in cibles)}")
+
+
+if __name__ == "__main__":
+    main()
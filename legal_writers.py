@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Écriture en flux des articles juridiques (TypeScript et JSON)
+
+Les articles sont écrits dans le fichier au fur et à mesure qu'ils sont
+produits, sans construire la sortie complète en mémoire : les générateurs
+peuvent passer un itérateur (par exemple issu de sql_dump_reader) et la
+génération reste linéaire quelle que soit la taille du corpus.
+
+Chaque champ texte est échappé une seule fois, ici, au moment de
+l'écriture : les extracteurs manipulent du texte brut.
+
+La clé de recherche normalisée (search_key) n'est pas publiée : elle
+doublerait presque la taille des fichiers chargés par l'application, qui
+normalise les requêtes avec les mêmes règles. Elle reste dans l'index
+inversé et le magasin binaire.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, Optional
+
+# Champs de l'interface LegalContent, dans l'ordre d'écriture
+ARTICLE_FIELDS = (
+    'id', 'title', 'category', 'content', 'summary', 'language', 'tags',
+    'published_by', 'is_published', 'views_count', 'created_at', 'updated_at',
+)
+
+# Champs calculés pour les index, jamais écrits dans les fichiers publiés
+INTERNAL_FIELDS = frozenset({'search_key'})
+
+DEFAULT_ARTICLE = {
+    'category': 'droit_civil',
+    'language': 'fr',
+    'tags': [],
+    'published_by': None,
+    'is_published': True,
+    'views_count': 0,
+    'created_at': '2024-01-01T00:00:00Z',
+    'updated_at': '2024-01-01T00:00:00Z',
+}
+
+TS_INTERFACE = '''export interface LegalContent {
+  id: string;
+  title: string;
+  category: string;
+  content: string;
+  summary?: string;
+  language: string;
+  tags?: string[];
+  published_by?: string | null;
+  is_published: boolean;
+  views_count: number;
+  created_at: string;
+  updated_at: string;
+}
+'''
+
+
+def ts_literal(value: Any) -> str:
+    """
+    Littéral TypeScript d'une valeur.
+
+    Le JSON est un sous-ensemble de JavaScript : json.dumps échappe
+    guillemets, antislashs et caractères de contrôle en une seule passe.
+    """
+    return json.dumps(value, ensure_ascii=False)
+
+
+def article_record(article: Dict[str, Any]) -> Dict[str, Any]:
+    """Ramener un article aux champs de LegalContent, valeurs par défaut comprises"""
+    record = {}
+    for field in ARTICLE_FIELDS:
+        value = article.get(field, DEFAULT_ARTICLE.get(field, ''))
+        if field == 'id':
+            value = str(value)
+        record[field] = value
+    return record
+
+
+def public_article(article: Dict[str, Any]) -> Dict[str, Any]:
+    """Article sans ses champs internes, tel qu'il est publié (JSON, fragments)"""
+    if INTERNAL_FIELDS.isdisjoint(article):
+        return article
+    return {field: value for field, value in article.items() if field not in INTERNAL_FIELDS}
+
+
+def _ts_article(article: Dict[str, Any]) -> str:
+    record = article_record(article)
+    lines = ',\n'.join(f"    {field}: {ts_literal(value)}" for field, value in record.items())
+    return f"  {{\n{lines}\n  }}"
+
+
+class TypeScriptArticlesWriter:
+    """
+    Écrivain du module TypeScript LEGAL_ARTICLES, alimenté article par article.
+
+    `header` est le commentaire placé en tête du fichier ; `metadata`
+    complète LEGAL_ARTICLES_METADATA, dont total_articles est calculé.
+    """
+
+    def __init__(self, output_path: str, header: str, metadata: Optional[Dict[str, Any]] = None):
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        self.output_path = output_path
+        self.metadata = metadata or {}
+        self.count = 0
+        self._file = open(output_path, 'w', encoding='utf-8')
+        for line in header.strip().splitlines():
+            self._file.write(f"// {line}\n")
+        self._file.write(f"\n{TS_INTERFACE}\nexport const LEGAL_ARTICLES: LegalContent[] = [\n")
+
+    def write(self, article: Dict[str, Any]):
+        if self.count:
+            self._file.write(',\n')
+        self._file.write(_ts_article(article))
+        self.count += 1
+
+    def close(self) -> int:
+        """Terminer le module ; renvoie le nombre d'articles écrits"""
+        self._file.write('\n];\n\nexport const LEGAL_ARTICLES_METADATA = {\n')
+        fields = {'total_articles': self.count, **self.metadata}
+        self._file.write(',\n'.join(f"  {key}: {ts_literal(value)}" for key, value in fields.items()))
+        self._file.write('\n};\n')
+        self._file.close()
+        return self.count
+
+
+class JsonArticlesWriter:
+    """
+    Écrivain d'un fichier JSON {"articles": [...], "metadata": {...}}.
+
+    Les métadonnées sont écrites après les articles pour pouvoir y
+    inclure leur nombre.
+    """
+
+    def __init__(self, output_path: str, metadata: Optional[Dict[str, Any]] = None):
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        self.output_path = output_path
+        self.metadata = metadata or {}
+        self.count = 0
+        self._file = open(output_path, 'w', encoding='utf-8')
+        self._file.write('{\n  "articles": [\n')
+
+    def write(self, article: Dict[str, Any]):
+        if self.count:
+            self._file.write(',\n')
+        self._file.write('    ')
+        self._file.write(json.dumps(public_article(article), ensure_ascii=False))
+        self.count += 1
+
+    def close(self) -> int:
+        """Terminer le fichier ; renvoie le nombre d'articles écrits"""
+        self._file.write('\n  ],\n  "metadata": ')
+        json.dump({'total_articles': self.count, **self.metadata}, self._file, ensure_ascii=False)
+        self._file.write('\n}\n')
+        self._file.close()
+        return self.count
+
+
+def write_typescript_articles(articles: Iterable[Dict[str, Any]], output_path: str,
+                              header: str, metadata: Optional[Dict[str, Any]] = None) -> int:
+    """Écrire le module TypeScript d'une suite d'articles ; renvoie leur nombre"""
+    writer = TypeScriptArticlesWriter(output_path, header, metadata)
+    for article in articles:
+        writer.write(article)
+    return writer.close()
+
+
+def write_json_articles(articles: Iterable[Dict[str, Any]], output_path: str,
+                        metadata: Optional[Dict[str, Any]] = None) -> int:
+    """Écrire le fichier JSON d'une suite d'articles ; renvoie leur nombre"""
+    writer = JsonArticlesWriter(output_path, metadata)
+    for article in articles:
+        writer.write(article)
+    return writer.close()
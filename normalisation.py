@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Normalisation des textes juridiques pour la recherche
+
+Le texte affiché reste tel quel ; une clé de recherche en est dérivée une
+fois pour toutes à l'extraction :
+    - espaces insécables et espaces typographiques ramenés à l'espace simple
+    - apostrophes typographiques (’ ‘ ʼ ′) unifiées en '
+    - césures de fin de ligne des PDF recollées (« contra- vention » → « contravention »)
+    - ligatures développées (œ → oe), décomposition NFKD et suppression des accents
+    - minuscules, ponctuation remplacée par des espaces
+
+Ainsi « securite sociale » correspond à « sécurité sociale » par simple
+recherche de sous-chaîne dans la clé, sans normalisation à l'exécution.
+"""
+
+import re
+import unicodedata
+
+_APOSTROPHES = str.maketrans({'’': "'", '‘': "'", 'ʼ': "'", '′': "'", '`': "'", '´': "'"})
+_LIGATURES = str.maketrans({'œ': 'oe', 'Œ': 'OE', 'æ': 'ae', 'Æ': 'AE'})
+
+# Césure de fin de ligne : tiret collé à une lettre minuscule puis espace(s)
+# avant une autre minuscule (« matri- moniaux », « consente- ment »)
+_CESURE = re.compile(r"(?<=[a-zà-ÿ])-\s+(?=[a-zà-ÿ])")
+
+# Tout ce qui n'est ni lettre, ni chiffre, ni apostrophe sépare les mots
+_SEPARATEURS = re.compile(r"[^a-z0-9']+")
+
+
+def unifier_apostrophes(text: str) -> str:
+    """Remplacer les apostrophes typographiques par l'apostrophe droite"""
+    return text.translate(_APOSTROPHES)
+
+
+def recoller_cesures(text: str) -> str:
+    """Supprimer les césures de fin de ligne laissées par l'extraction PDF"""
+    return _CESURE.sub("", text)
+
+
+def fold(text: str) -> str:
+    """Passer en minuscules et retirer les accents (é → e, œ → oe)"""
+    text = unicodedata.normalize('NFKD', text.translate(_LIGATURES))
+    return ''.join(char for char in text if not unicodedata.combining(char)).lower()
+
+
+def cle_recherche(text: str) -> str:
+    """Clé de recherche d'un texte : mots sans accents ni casse, séparés par une espace"""
+    if not text:
+        return ""
+    # NFKD ramène aussi les espaces insécables à l'espace simple
+    text = fold(recoller_cesures(unifier_apostrophes(text)))
+    return _SEPARATEURS.sub(" ", text).strip()
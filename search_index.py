@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Index inversé des articles juridiques, construit à l'extraction
+
+Les textes sont ramenés à leur clé de recherche (voir normalisation) puis
+découpés en mots ;
+chaque terme pointe vers la liste des articles qui le contiennent avec sa
+fréquence. L'application n'a plus qu'à intersecter quelques listes au
+lieu de parcourir le texte de tous les articles à chaque frappe.
+
+Format JSON produit (public/legal_index.json) :
+    docs      : identifiants d'articles, l'indice dans cette liste sert de numéro
+    postings  : terme → [écart_doc, tf, écart_doc, tf, ...]
+                (numéros de documents croissants, codés par différence)
+    bm25      : statistiques de classement (voir legal_ranking), si calculées
+    expansions: table d'expansion des requêtes (voir legal_synonyms), si compilée
+"""
+
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from normalisation import cle_recherche
+
+# Champs indexés d'un article
+INDEXED_FIELDS = ('title', 'summary', 'content', 'tags')
+
+# Sections facultatives livrées telles quelles avec l'index
+EXTRA_SECTIONS = ('bm25', 'expansions')
+
+# Mots vides français ignorés à l'indexation comme à la recherche
+STOPWORDS = frozenset("""
+    a au aux avec ce ces cet cette d dans de des du elle en est et il ils l la le les leur leurs
+    lui ma mais me meme mes n ne ni nos notre nous on ont ou par pas pour qu que qui s sa se ses
+    si son sont sur ta te tes toi ton tu un une vos votre vous y
+""".split())
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def termes(cle: str) -> List[str]:
+    """Découper une clé de recherche déjà normalisée en termes indexables"""
+    return [token for token in _TOKEN_PATTERN.findall(cle) if token not in STOPWORDS]
+
+
+def tokenize(text: str) -> List[str]:
+    """Découper un texte en termes indexables"""
+    return termes(cle_recherche(text))
+
+
+def article_text(article: Dict[str, Any]) -> str:
+    """Concaténer les champs indexés d'un article"""
+    parts = []
+    for field in INDEXED_FIELDS:
+        value = article.get(field)
+        if isinstance(value, list):
+            parts.extend(str(item) for item in value)
+        elif value:
+            parts.append(str(value))
+    return ' '.join(parts)
+
+
+def construire_index_inverse(articles: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Construire l'index inversé d'une suite d'articles"""
+    docs: List[str] = []
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+
+    for doc, article in enumerate(articles):
+        docs.append(str(article['id']))
+        frequencies: Dict[str, int] = {}
+        # La clé calculée à l'extraction évite de renormaliser le texte
+        cle = article.get('search_key') or cle_recherche(article_text(article))
+        for term in termes(cle):
+            frequencies[term] = frequencies.get(term, 0) + 1
+        for term, tf in frequencies.items():
+            postings.setdefault(term, []).append((doc, tf))
+
+    return {'docs': docs, 'postings': postings}
+
+
+def encode_postings(postings: List[Tuple[int, int]]) -> List[int]:
+    """Aplatir une liste (doc, tf) en écarts de documents alternés avec les fréquences"""
+    encoded = []
+    previous = 0
+    for doc, tf in postings:
+        encoded.append(doc - previous)
+        encoded.append(tf)
+        previous = doc
+    return encoded
+
+
+def decode_postings(encoded: List[int]) -> Iterator[Tuple[int, int]]:
+    """Inverse de encode_postings"""
+    doc = 0
+    for i in range(0, len(encoded), 2):
+        doc += encoded[i]
+        yield doc, encoded[i + 1]
+
+
+def save_index(index: Dict[str, Any], output_path: str = "public/legal_index.json") -> str:
+    """Sauvegarder l'index inversé en JSON compact"""
+    output_data = {
+        'metadata': {
+            'total_articles': len(index['docs']),
+            'total_terms': len(index['postings']),
+            'source': 'senegal_juridique.sql',
+            'format': 'postings: terme -> [ecart_doc, tf, ...]',
+        },
+        'docs': index['docs'],
+        'postings': {term: encode_postings(postings) for term, postings in sorted(index['postings'].items())},
+    }
+    for section in EXTRA_SECTIONS:
+        if section in index:
+            output_data[section] = index[section]
+
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(output_data, f, ensure_ascii=False, separators=(',', ':'))
+
+    return output_path
+
+
+def load_index(path: str = "public/legal_index.json") -> Dict[str, Any]:
+    """Relire un index sauvegardé par save_index"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    index = {
+        'docs': data['docs'],
+        'postings': {term: list(decode_postings(encoded)) for term, encoded in data['postings'].items()},
+    }
+    for section in EXTRA_SECTIONS:
+        if section in data:
+            index[section] = data[section]
+    return index
+
+
+def rechercher(index: Dict[str, Any], query: str) -> List[str]:
+    """
+    Implémentation de référence de la recherche : intersection des listes.
+
+    Renvoie les identifiants des articles contenant tous les termes de la
+    requête, en commençant par la liste la plus courte.
+    """
+    terms = set(tokenize(query))
+    if not terms:
+        return []
+
+    lists = sorted((index['postings'].get(term, []) for term in terms), key=len)
+    docs = {doc for doc, _tf in lists[0]}
+    for postings in lists[1:]:
+        if not docs:
+            break
+        docs &= {doc for doc, _tf in postings}
+
+    return [index['docs'][doc] for doc in sorted(docs)]
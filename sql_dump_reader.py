@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Lecteur incrémental des dumps phpMyAdmin (senegal_juridique.sql)
+
+Le fichier est lu par blocs et découpé en jetons en une seule passe linéaire :
+la mémoire utilisée est bornée par la taille du plus grand champ, et non par
+celle du dump. Seules les instructions INSERT sont interprétées ; chaque ligne
+de VALUES est produite sous forme de tuple typé (int, float, str ou None).
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Séquences d'échappement MySQL reconnues dans les chaînes
+_MYSQL_ESCAPES = {
+    '0': '\x00',
+    'b': '\b',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+    'Z': '\x1a',
+}
+
+_TOKEN_PATTERN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<comment>(?:--|\#)[^\n]*(?:\n|$))
+  | (?P<block>/\*.*?\*/)
+  | (?P<delimiter>DELIMITER[ \t]+(?P<delim>\S+)[^\n]*(?:\n|$))
+  | (?P<string>'(?:[^'\\]|\\.|'')*')
+  | (?P<dqstring>"(?:[^"\\]|\\.|"")*")
+  | (?P<ident>`(?:[^`]|``)*`)
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<word>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<punct>[(),;])
+  | (?P<other>[^\s\w'"`(),;]+)
+""", re.VERBOSE | re.DOTALL | re.IGNORECASE)
+
+# Séquence d'échappement, ou délimiteur doublé de la chaîne ('' ou "")
+_ESCAPE_PATTERNS = {
+    "'": re.compile(r"\\(.)|''", re.DOTALL),
+    '"': re.compile(r'\\(.)|""', re.DOTALL),
+}
+
+# Préfixes qui, en fin de tampon, peuvent encore devenir un jeton plus long
+_OPENERS = ("'", '"', '`', '/*', '--', '#')
+
+# Jetons délimités : suivis de leur délimiteur, ils se prolongent ('l''a')
+_QUOTED = ('string', 'dqstring', 'ident')
+
+# Caractères à connaître après un nombre pour le savoir complet
+# (1 → 1.5 → 1.5e+3)
+_NUMBER_LOOKAHEAD = 3
+
+
+def _unescape(body: str, quote: str) -> str:
+    """Décoder une chaîne MySQL (sans ses délimiteurs)"""
+    if '\\' not in body and quote * 2 not in body:
+        return body
+
+    def replace(match):
+        char = match.group(1)
+        if char is None:
+            return quote
+        return _MYSQL_ESCAPES.get(char, char)
+
+    return _ESCAPE_PATTERNS[quote].sub(replace, body)
+
+
+def iter_tokens(stream, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, str]]:
+    """Produire les jetons (type, texte) d'un flux SQL lu par blocs"""
+    buffer = ''
+    pos = 0
+    eof = False
+
+    while True:
+        if not eof and len(buffer) - pos < chunk_size:
+            chunk = stream.read(chunk_size)
+            if chunk:
+                buffer = buffer[pos:] + chunk
+                pos = 0
+            else:
+                eof = True
+
+        if pos >= len(buffer):
+            if eof:
+                return
+            continue
+
+        match = _TOKEN_PATTERN.match(buffer, pos)
+        incomplete = (
+            match is None
+            or match.end() == len(buffer)
+            or (match.lastgroup == 'number' and len(buffer) - match.end() < _NUMBER_LOOKAHEAD)
+            or (match.lastgroup in _QUOTED and buffer[match.end()] == buffer[pos])
+            or (match.lastgroup == 'other' and buffer.startswith(_OPENERS, pos))
+            # DELIMITER n'est reconnu qu'avec sa ligne entière
+            or (match.lastgroup == 'word' and match.group().upper() == 'DELIMITER'
+                and '\n' not in buffer[match.end():])
+        )
+        if incomplete and not eof:
+            # Le jeton peut se prolonger dans le bloc suivant : doubler la
+            # lecture pour que les longs champs restent en temps linéaire
+            chunk = stream.read(max(chunk_size, len(buffer) - pos))
+            if chunk:
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            eof = True
+            continue
+
+        if match is None:
+            # Chaîne ou commentaire non terminé en fin de fichier
+            yield 'other', buffer[pos:]
+            return
+
+        kind = match.lastgroup
+        if kind == 'delimiter':
+            yield kind, match.group('delim')
+        elif kind not in ('space', 'comment', 'block'):
+            yield kind, match.group(kind)
+        pos = match.end()
+
+
+def _convert(kind: str, text: str) -> Any:
+    """Convertir un jeton de valeur en objet Python"""
+    if kind == 'string':
+        return _unescape(text[1:-1], "'")
+    if kind == 'dqstring':
+        return _unescape(text[1:-1], '"')
+    if kind == 'number':
+        if '.' in text or 'e' in text or 'E' in text:
+            return float(text)
+        return int(text)
+    if kind == 'word' and text.upper() == 'NULL':
+        return None
+    return text
+
+
+def _identifier(text: str) -> str:
+    if text.startswith('`'):
+        return text[1:-1].replace('``', '`')
+    return text
+
+
+def iter_insert_statements(path: str, tables: Optional[Iterable[str]] = None,
+                           chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Parcourir les instructions INSERT du dump.
+
+    Produit des triplets (table, colonnes, lignes) où `lignes` est un
+    itérateur paresseux de tuples ; il doit être consommé avant de passer
+    à l'instruction suivante.
+    """
+    wanted = set(tables) if tables is not None else None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        tokens = iter_tokens(f, chunk_size)
+        delimiter = ';'
+        at_statement_start = True
+
+        for kind, text in tokens:
+            if kind == 'delimiter':
+                delimiter = text
+                at_statement_start = True
+                continue
+
+            if delimiter != ';':
+                # Corps de trigger/procédure : ignorer jusqu'au délimiteur
+                if text == delimiter:
+                    at_statement_start = True
+                continue
+
+            if text == ';':
+                at_statement_start = True
+                continue
+
+            if not (at_statement_start and kind == 'word' and text.upper() == 'INSERT'):
+                at_statement_start = False
+                continue
+
+            at_statement_start = False
+            table, columns, kind, text = _read_insert_header(tokens)
+            if table is None:
+                continue
+
+            rows = _iter_rows(tokens, kind, text)
+            if wanted is None or table in wanted:
+                yield table, columns, rows
+            # Consommer les lignes restantes pour garder le flux aligné
+            for _ in rows:
+                pass
+            at_statement_start = True
+
+
+def _read_insert_header(tokens):
+    """Lire `INTO table (colonnes) VALUES` ; renvoie aussi le jeton suivant"""
+    table = None
+    columns = []
+    for kind, text in tokens:
+        if kind in ('ident', 'word') and text.upper() not in ('INTO', 'IGNORE'):
+            table = _identifier(text)
+            break
+        if text == ';':
+            return None, [], kind, text
+
+    kind, text = next(tokens, ('', ''))
+    if text == '(':
+        for kind, text in tokens:
+            if text == ')':
+                break
+            if kind in ('ident', 'word'):
+                columns.append(_identifier(text))
+        kind, text = next(tokens, ('', ''))
+
+    if kind == 'word' and text.upper() in ('VALUES', 'VALUE'):
+        kind, text = next(tokens, ('', ''))
+    return table, columns, kind, text
+
+
+def _iter_rows(tokens, kind, text):
+    """Produire les tuples de valeurs jusqu'à la fin de l'instruction"""
+    while text == '(':
+        row = []
+        for kind, text in tokens:
+            if text == ')':
+                break
+            if text == ',':
+                continue
+            row.append(_convert(kind, text))
+        yield tuple(row)
+
+        kind, text = next(tokens, ('', ''))
+        if text == ',':
+            kind, text = next(tokens, ('', ''))
+        else:
+            break
+    # Clause éventuelle (ON DUPLICATE KEY ...) jusqu'au point-virgule
+    while text and text != ';':
+        kind, text = next(tokens, ('', ''))
+
+
+def iter_dump_rows(path: str, tables: Optional[Iterable[str]] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, tuple]]:
+    """Produire les enregistrements (table, ligne) du dump, un par un"""
+    for table, _columns, rows in iter_insert_statements(path, tables, chunk_size):
+        for row in rows:
+            yield table, row
+
+
+def iter_table_records(path: str, table: str,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Produire les lignes d'une table sous forme de dictionnaires colonne → valeur"""
+    for _table, columns, rows in iter_insert_statements(path, [table], chunk_size):
+        for row in rows:
+            yield dict(zip(columns, row))
+
+
+def main():
+    """Afficher le nombre de lignes par table du dump"""
+    import sys
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "senegal_juridique.sql"
+    counts = {}
+    for table, _row in iter_dump_rows(path):
+        counts[table] = counts.get(table, 0) + 1
+
+    print(f"📊 Lignes par table dans {path} :")
+    for table, count in counts.items():
+        print(f"   - {table}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""
+Configuration commune des tests : les modules du dépôt sont des scripts à
+la racine et dans inset/, importés directement.
+"""
+
+import os
+import sys
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INSET = os.path.join(RACINE, "inset")
+SQL_PATH = os.path.join(RACINE, "senegal_juridique.sql")
+
+for chemin in (RACINE, INSET):
+    if chemin not in sys.path:
+        sys.path.insert(0, chemin)
@@ -0,0 +1,76 @@
+import os
+
+import pytest
+
+from article_splitter import ArticleSplitter, decouper_articles
+from conftest import INSET
+
+TEXTE = """LIVRE PREMIER DES PERSONNES
+TITRE I DISPOSITIONS GÉNÉRALES
+Article premier La loi s'applique à tous. Voir l'article 12 du présent code.
+Article 2 Nul n'est censé ignorer la loi.
+Art. 3-1 Les dispositions de l'Article 3, alinéa 2 demeurent.
+CHAPITRE II DU DOMICILE
+Article 4 bis Le domicile est le lieu du principal établissement.
+ARTICLE L 5 Texte de la partie législative.
+Section 1 Des absents
+Article 6 Fin du texte.
+"""
+
+# Codes dont l'extraction est rapide ; les autres ne changent pas la couverture
+PDFS = ["codepenal.pdf", "CODE-DE-LA-FAMILLE.pdf", "codedutravail.pdf",
+        "Senegal-Code-2001-environnement.pdf"]
+
+
+def sans_page(articles):
+    return [{cle: valeur for cle, valeur in article.items() if cle != 'page'} for article in articles]
+
+
+def decouper_par_pages(pages):
+    splitter = ArticleSplitter()
+    articles = []
+    for index, text in pages:
+        articles += splitter.feed(text, page=index)
+    return articles + splitter.close()
+
+
+def test_toutes_les_coupures_du_texte():
+    reference = decouper_articles(TEXTE)
+    assert [a['numero'] for a in reference] == [
+        "Article premier", "Article 2", "Art. 3-1", "Article 4 bis", "ARTICLE L 5", "Article 6"]
+    for coupure in range(len(TEXTE) + 1):
+        pages = [(0, TEXTE[:coupure]), (1, TEXTE[coupure:])]
+        assert sans_page(decouper_par_pages(pages)) == sans_page(reference), coupure
+
+
+def test_page_de_l_en_tete():
+    debut = TEXTE.index("Article 4 bis") + len("Art")
+    articles = decouper_par_pages([(0, TEXTE[:debut]), (1, TEXTE[debut:])])
+    assert [(a['numero'], a['page']) for a in articles][2:4] == [("Art. 3-1", 0), ("Article 4 bis", 0)]
+    assert [a['page'] for a in articles[4:]] == [1, 1]
+
+
+@pytest.fixture(scope="module")
+def pages_pdf():
+    from loiv2 import lire_pages
+    from page_cache import sha256_fichier
+
+    pages = {}
+    for nom in PDFS:
+        path = os.path.join(INSET, nom)
+        pages[nom] = list(lire_pages(path, sha256_fichier(path)))
+    return pages
+
+
+@pytest.mark.parametrize("nom", PDFS)
+def test_pages_d_un_code_identiques_au_texte_complet(pages_pdf, nom):
+    # Comme loiv2.iter_lignes_articles : chaque page est suivie d'un saut de ligne
+    pages = [(index, text + "\n") for index, text in pages_pdf[nom] if text]
+    articles = decouper_par_pages(pages)
+    assert articles
+    assert sans_page(articles) == sans_page(decouper_articles("".join(text for _index, text in pages)))
+
+    # Chaque article porte la page où figure son en-tête
+    textes = dict(pages)
+    for article in articles:
+        assert article['numero'] in textes[article['page']]
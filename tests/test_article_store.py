@@ -0,0 +1,63 @@
+import json
+import os
+
+import pytest
+
+from article_store import ArticleStore, save_article_store
+from conftest import RACINE
+
+
+def complet(article):
+    """Article tel que relu : champs absents à leur valeur par défaut"""
+    return {
+        'id': str(article['id']),
+        'title': article.get('title', ''),
+        'category': article.get('category', ''),
+        'content': article.get('content', ''),
+        'summary': article.get('summary', ''),
+        'language': article.get('language', 'fr'),
+        'tags': list(article.get('tags') or []),
+        'published_by': article.get('published_by'),
+        'is_published': article.get('is_published', True),
+        'views_count': article.get('views_count', 0),
+        'created_at': article.get('created_at', ''),
+        'updated_at': article.get('updated_at', ''),
+        'texte_juridique_id': article.get('texte_juridique_id'),
+        'position_ordre': article.get('position_ordre') or 0,
+        'search_key': article.get('search_key', ''),
+    }
+
+
+ARTICLES = [
+    {'id': '10', 'title': 'Code pénal - Article 1', 'category': 'penal', 'content': "L'infraction…\nsuite",
+     'summary': 'Résumé', 'tags': ['pénal', 'infraction'], 'published_by': 'admin', 'is_published': False,
+     'views_count': 42, 'created_at': '2024-01-01T00:00:00Z', 'updated_at': '2024-02-01T00:00:00Z',
+     'texte_juridique_id': 3, 'position_ordre': 7, 'search_key': 'l infraction suite'},
+    # Titre sans préfixe, aucun mot-clé, champs variables vides
+    {'id': '2', 'title': 'Préambule', 'content': '', 'tags': []},
+    # Deux articles partagent le préfixe du titre et la catégorie
+    {'id': '100', 'title': 'Code pénal - Article 2', 'category': 'penal', 'content': 'Texte',
+     'texte_juridique_id': 0, 'position_ordre': 8},
+]
+
+
+def test_aller_retour_sans_perte(tmp_path):
+    path = save_article_store(ARTICLES, str(tmp_path / "articles.bin"))
+    with ArticleStore(path) as store:
+        assert len(store) == len(ARTICLES)
+        assert list(store) == [complet(a) for a in ARTICLES]
+        assert store.get('100') == complet(ARTICLES[2])
+        assert store.get('3') is None
+        with pytest.raises(IndexError):
+            store.article(len(ARTICLES))
+
+
+def test_aller_retour_corpus_public(tmp_path):
+    with open(os.path.join(RACINE, "public", "legal_articles.json"), encoding="utf-8") as f:
+        articles = json.load(f)['articles']
+
+    path = save_article_store(articles, str(tmp_path / "articles.bin"))
+    with ArticleStore(path) as store:
+        assert list(store) == [complet(a) for a in articles]
+        for article in articles[::37]:
+            assert store.get(article['id']) == complet(article)
@@ -0,0 +1,70 @@
+import json
+import os
+
+from conftest import RACINE
+from legal_dedup import Deduplicateur, dedupliquer
+
+MOTS = ("le contrat est formé par l'échange des consentements des parties qui s'obligent "
+        "envers une ou plusieurs autres à donner à faire ou à ne pas faire quelque chose "
+        "selon les conditions prévues par la loi et les usages du commerce").split()
+CONTENU = " ".join(MOTS * 3)
+
+
+def article(identifiant, contenu=CONTENU, titre="Article 1", texte_id=17, **champs):
+    return {'id': identifiant, 'title': titre, 'content': contenu, 'texte_juridique_id': texte_id, **champs}
+
+
+def test_doublon_exact_dans_un_meme_code():
+    conserves, rapport = dedupliquer([
+        article('1'),
+        # Casse, accents et ponctuation ne comptent pas
+        article('2', CONTENU.upper().replace("é", "e") + " !", titre="Article 2"),
+    ])
+    assert [a['id'] for a in conserves] == ['1']
+    assert rapport['doublons_exacts'] == 1
+
+
+def test_meme_disposition_dans_deux_codes_conservee():
+    conserves, rapport = dedupliquer([article('1', texte_id=17), article('2', texte_id=18)])
+    assert [a['id'] for a in conserves] == ['1', '2']
+    assert rapport['doublons_exacts'] == 0
+
+
+def test_portee_par_categorie_sans_texte():
+    conserves, _ = dedupliquer([
+        article('1', texte_id=None, category='droit_civil'),
+        article('2', texte_id=None, category='droit_civil'),
+        article('3', texte_id=None, category='commerce'),
+    ])
+    assert [a['id'] for a in conserves] == ['1', '3']
+
+
+def test_quasi_doublon_de_meme_titre():
+    deduplicateur = Deduplicateur()
+    assert deduplicateur.ajouter(article('1')) is None
+    assert deduplicateur.ajouter(article('2', CONTENU + " Page 12 INSERT INTO")) == '1'
+    assert deduplicateur.rapport['quasi_doublons'] == 1
+
+
+def test_quasi_doublon_de_titre_different_conserve():
+    conserves, rapport = dedupliquer([
+        article('1'),
+        article('2', CONTENU + " Page 12 INSERT INTO", titre="Article 2"),
+    ])
+    assert len(conserves) == 2
+    assert rapport['quasi_doublons'] == 0
+
+
+def test_contenus_courts_jamais_ecartes():
+    conserves, _ = dedupliquer([article('1', "Abrogé."), article('2', "Abrogé.")])
+    assert len(conserves) == 2
+
+
+def test_doublons_du_jeu_de_donnees_public():
+    with open(os.path.join(RACINE, "public", "legal_articles.json"), encoding='utf-8') as f:
+        articles = json.load(f)['articles']
+    conserves, rapport = dedupliquer(articles)
+    assert rapport['articles'] == 333
+    assert rapport['doublons_exacts'] == 45
+    assert len(conserves) == 288
+    assert rapport['octets_apres'] < rapport['octets_avant']
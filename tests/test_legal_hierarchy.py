@@ -0,0 +1,37 @@
+from conftest import SQL_PATH
+from legal_hierarchy import construire_hierarchie, construire_index_hierarchique, trouver_noeud
+from sql_dump_reader import iter_table_records
+
+
+def noeud_attendu(noeuds, position):
+    """Recherche exhaustive : la division contenant `position` la plus tardive, donc la plus fine"""
+    trouves = [n for n in noeuds if n['premier_article'] <= position <= n['dernier_article']]
+    return trouves[-1] if trouves else None
+
+
+def test_remontee_vers_l_ancetre():
+    noeuds = construire_hierarchie([
+        (1, ()),
+        (2, ("TITRE I", "CHAPITRE 1")),
+        *((position, ("TITRE I", "CHAPITRE 1", f"SECTION {position}")) for position in range(3, 500)),
+        (500, ("TITRE I",)),
+        (501, ("TITRE II",)),
+    ])
+    assert trouver_noeud(noeuds, 1) is None
+    assert trouver_noeud(noeuds, 2)['intitule'] == "CHAPITRE 1"
+    assert trouver_noeud(noeuds, 250)['intitule'] == "SECTION 250"
+    # Dernier nœud ouvert refermé : la réponse est un ancêtre
+    assert trouver_noeud(noeuds, 500)['intitule'] == "TITRE I"
+    assert trouver_noeud(noeuds, 501)['intitule'] == "TITRE II"
+    assert trouver_noeud(noeuds, 502) is None
+
+
+def test_identique_a_la_recherche_exhaustive_sur_le_dump():
+    rows = sorted((row['texte_juridique_id'], row['position_ordre'], row['contenu_article'])
+                  for row in iter_table_records(SQL_PATH, 'articles'))
+    index = construire_index_hierarchique(rows)
+    assert sum(len(noeuds) for noeuds in index.values()) > 0
+    for noeuds in index.values():
+        premiers = [noeud['premier_article'] for noeud in noeuds]
+        for position in range(max((n['dernier_article'] for n in noeuds), default=0) + 2):
+            assert trouver_noeud(noeuds, position, premiers) is noeud_attendu(noeuds, position)
@@ -0,0 +1,21 @@
+import json
+
+from legal_shards import save_shards
+from legal_writers import write_json_articles, write_typescript_articles
+
+ARTICLE = {'id': 7, 'title': 'Code pénal - Article 1', 'content': "L'infraction", 'texte_juridique_id': 3,
+           'search_key': "l infraction"}
+
+
+def test_cle_de_recherche_absente_des_fichiers_publies(tmp_path):
+    write_typescript_articles([ARTICLE], str(tmp_path / "articles.ts"), header="Test")
+    write_json_articles([ARTICLE], str(tmp_path / "articles.json"))
+    manifeste = save_shards([ARTICLE], str(tmp_path / "shards"))
+
+    for path in (tmp_path / "articles.ts", tmp_path / "articles.json", tmp_path / "shards" / "texte-3.json"):
+        assert "search_key" not in path.read_text(encoding="utf-8")
+    articles = json.loads((tmp_path / "articles.json").read_text(encoding="utf-8"))['articles']
+    assert articles == [{key: value for key, value in ARTICLE.items() if key != 'search_key'}]
+    assert json.load(open(manifeste, encoding="utf-8"))['shards'][0]['count'] == 1
+    # L'article source n'est pas modifié : les index en ont encore besoin
+    assert ARTICLE['search_key'] == "l infraction"
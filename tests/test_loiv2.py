@@ -0,0 +1,156 @@
+import sqlite3
+
+import pytest
+
+import loiv2
+from conftest import INSET
+from stockage import StockageSQLite
+
+# Codes dont l'extraction est rapide ; les autres ne changent pas la couverture
+FICHIERS = {"codepenal.pdf", "CODE-DE-LA-FAMILLE.pdf", "codedutravail.pdf",
+            "Senegal-Code-2001-environnement.pdf"}
+
+
+@pytest.fixture
+def pdfs(monkeypatch):
+    # Les chemins de PDFS sont relatifs au répertoire inset/
+    monkeypatch.chdir(INSET)
+    selection = [pdf for pdf in loiv2.PDFS if pdf["path"] in FICHIERS]
+    monkeypatch.setattr(loiv2, "PDFS", selection)
+    return selection
+
+
+def importer(path, **options):
+    loiv2.import_legal_documents(cache_dir=None, stockage=StockageSQLite(str(path)), **options)
+
+
+def lignes(path):
+    """Contenu importé, indépendant des identifiants attribués"""
+    db = sqlite3.connect(str(path))
+    try:
+        assert db.execute("SELECT COUNT(*) FROM import_checkpoints").fetchone() == (0,)
+        return {
+            "articles": db.execute(
+                "SELECT t.titre, a.numero_article, a.titre_article, a.contenu_article, a.position_ordre "
+                "FROM articles a JOIN textes_juridiques t ON t.id = a.texte_juridique_id "
+                "ORDER BY t.titre, a.position_ordre").fetchall(),
+            "manifeste": db.execute(
+                "SELECT t.titre, m.sha256, m.nombre_pages, m.nombre_articles "
+                "FROM import_manifest m JOIN textes_juridiques t ON t.id = m.texte_juridique_id "
+                "ORDER BY t.titre").fetchall(),
+        }
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def reference(pdfs, tmp_path):
+    path = tmp_path / "reference.sqlite3"
+    importer(path)
+    resultat = lignes(path)
+    assert len(resultat["manifeste"]) == len(pdfs)
+    return resultat
+
+
+def test_articles_valides_a_la_fin_de_chaque_page(pdfs, tmp_path, monkeypatch):
+    pdf = pdfs[0]
+    pages_lues = []
+    lots = []
+    lire_pages = loiv2.lire_pages
+    inserer_lot = loiv2.inserer_lot
+
+    def lire_pages_suivies(*args, **kwargs):
+        for index, text in lire_pages(*args, **kwargs):
+            pages_lues.append(index)
+            yield index, text
+
+    def inserer_lot_suivi(db, cursor, requete, batch, avant_commit=None):
+        lots.append((pages_lues[-1], len(batch)))
+        return inserer_lot(db, cursor, requete, batch, avant_commit)
+
+    monkeypatch.setattr(loiv2, "lire_pages", lire_pages_suivies)
+    monkeypatch.setattr(loiv2, "inserer_lot", inserer_lot_suivi)
+
+    stockage = StockageSQLite(str(tmp_path / "flux.sqlite3"))
+    db = stockage.connecter()
+    cursor = db.cursor()
+    stockage.creer_tables(cursor)
+    articles = loiv2.importer_document_en_flux(db, cursor, pdf, batch_size=10_000, cache_dir=None)
+    db.close()
+
+    # Un lot par page (et non un seul lot de batch_size articles), validé
+    # avant la lecture de la page suivante ; le dernier article est validé
+    # à la fermeture du découpeur
+    pages = [page for page, _taille in lots[:-1]]
+    assert len(lots) > 1
+    assert pages == sorted(set(pages))
+    assert lots[-1][0] == pages_lues[-1]
+    assert pages[0] < pages_lues[-1]
+    assert sum(taille for _page, taille in lots) == articles
+
+
+def test_import_parallele_identique_au_sequentiel(reference, tmp_path):
+    path = tmp_path / "parallele.sqlite3"
+    importer(path, workers=2, pages_par_plage=16)
+    assert lignes(path) == reference
+
+
+@pytest.mark.parametrize("lot_fatal", [1, 25, 150])
+def test_reprise_apres_interruption_identique_a_un_import_complet(reference, tmp_path, monkeypatch, lot_fatal):
+    path = tmp_path / "reprise.sqlite3"
+    lots = []
+    inserer_lot = loiv2.inserer_lot
+
+    def inserer_lot_interrompu(db, cursor, requete, batch, avant_commit=None):
+        lots.append(len(batch))
+        if len(lots) == lot_fatal:
+            # Arrêt brutal entre l'écriture du lot et sa validation
+            cursor.executemany(requete, batch)
+            raise KeyboardInterrupt
+        return inserer_lot(db, cursor, requete, batch, avant_commit)
+
+    monkeypatch.setattr(loiv2, "inserer_lot", inserer_lot_interrompu)
+    with pytest.raises(KeyboardInterrupt):
+        importer(path)
+    monkeypatch.setattr(loiv2, "inserer_lot", inserer_lot)
+
+    # Sans --resume, le document interrompu garde son point de reprise
+    importer(path)
+    db = sqlite3.connect(str(path))
+    assert db.execute("SELECT COUNT(*) FROM import_checkpoints").fetchone() == (1,)
+    db.close()
+
+    importer(path, resume=True)
+    assert lignes(path) == reference
+
+
+class CurseurEnPanne:
+    """Curseur MySQL simulé : LOAD DATA et reconstruction des index échouent"""
+
+    def __init__(self):
+        self.requetes = []
+
+    def execute(self, requete, valeurs=()):
+        requete = requete.strip()
+        self.requetes.append(requete)
+        if requete.startswith("LOAD DATA") or " ADD " in requete:
+            raise sqlite3.OperationalError(requete.split()[0])
+
+    def fetchall(self):
+        return [("idx_articles_recherche",), ("idx_fulltext_articles",)]
+
+
+class ConnexionSimulee:
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def test_erreur_du_chargement_conservee_si_la_reconstruction_echoue(caplog):
+    cursor = CurseurEnPanne()
+    with pytest.raises(sqlite3.OperationalError, match="LOAD"):
+        loiv2.charger_articles_tsv(ConnexionSimulee(), cursor, "articles.tsv")
+    assert any(requete.startswith("ALTER TABLE articles ADD") for requete in cursor.requetes)
+    assert "non reconstruits" in caplog.text
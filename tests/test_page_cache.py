@@ -0,0 +1,44 @@
+import page_cache
+from page_cache import PageTextCache
+
+
+def test_arborescence_parcourue_une_fois_par_processus(tmp_path, monkeypatch):
+    parcours = []
+    walk_usage = PageTextCache._walk_usage
+    monkeypatch.setattr(PageTextCache, "_walk_usage", lambda self: parcours.append(1) or walk_usage(self))
+    monkeypatch.setattr(page_cache, "_TAILLES", {})
+
+    for plage in range(4):
+        cache = PageTextCache(str(tmp_path), 10_000)
+        for page in range(3):
+            cache.put("ab" * 32, plage * 3 + page, "texte")
+    assert len(parcours) == 1
+    assert PageTextCache(str(tmp_path), 10_000).disk_usage() == 12 * len("texte")
+
+
+def test_taille_transmise_par_le_parent(tmp_path, monkeypatch):
+    monkeypatch.setattr(page_cache, "_TAILLES", {})
+    monkeypatch.setattr(PageTextCache, "_walk_usage", lambda self: 1 / 0)
+    cache = PageTextCache(str(tmp_path), 10_000, size=100)
+    cache.put("cd" * 32, 0, "abc")
+    assert cache.disk_usage() == 103
+    assert cache.get("cd" * 32, 0) == "abc"
+
+
+def test_eviction_des_entrees_les_plus_anciennes(tmp_path, monkeypatch):
+    monkeypatch.setattr(page_cache, "_TAILLES", {})
+    cache = PageTextCache(str(tmp_path), 100)
+    for page in range(30):
+        cache.put("ef" * 32, page, "0123456789")
+    assert cache.disk_usage() <= 100
+    assert cache.disk_usage() == cache._walk_usage()
+
+
+def test_entree_remplacee_comptee_une_fois(tmp_path, monkeypatch):
+    monkeypatch.setattr(page_cache, "_TAILLES", {})
+    cache = PageTextCache(str(tmp_path), 10_000)
+    cache.put("ab" * 32, 0, "texte")
+    cache.put("ab" * 32, 1, "autre")
+    cache.put("ab" * 32, 0, "texte plus long")
+    assert cache.disk_usage() == len("texte plus long") + len("autre")
+    assert cache.disk_usage() == cache._walk_usage()
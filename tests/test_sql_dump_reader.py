@@ -0,0 +1,67 @@
+import io
+
+import pytest
+
+from conftest import SQL_PATH
+from sql_dump_reader import _unescape, iter_table_records, iter_tokens
+
+DUMP = """-- Commentaire ; avec 'apostrophe'
+/* bloc ; "guillemets" */
+CREATE TABLE `t` (`id` int, `texte` text);
+INSERT INTO `t` (`id`, `texte`, `autre`) VALUES
+(1, 'l''article', "dit \\"oui\\""),
+(2, 'a\\\\b\\nc ; (x)', NULL),
+(3, 'deux '''' apostrophes', "a''b"),
+(-4, '', "c""d");
+DELIMITER $$
+CREATE TRIGGER trg BEFORE INSERT ON t FOR EACH ROW BEGIN INSERT INTO t VALUES (9, 'x', 'y'); END$$
+DELIMITER ;
+INSERT INTO `t` (`id`, `texte`, `autre`) VALUES (5, 'fin', 1.5);
+"""
+
+ATTENDU = [
+    {'id': 1, 'texte': "l'article", 'autre': 'dit "oui"'},
+    {'id': 2, 'texte': 'a\\b\nc ; (x)', 'autre': None},
+    {'id': 3, 'texte': "deux '' apostrophes", 'autre': "a''b"},
+    {'id': -4, 'texte': '', 'autre': 'c"d'},
+    {'id': 5, 'texte': 'fin', 'autre': 1.5},
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 16, 64, 4096])
+def test_lignes_identiques_quelle_que_soit_la_taille_des_blocs(tmp_path, chunk_size):
+    path = tmp_path / "dump.sql"
+    path.write_text(DUMP, encoding='utf-8')
+    assert list(iter_table_records(str(path), 't', chunk_size)) == ATTENDU
+
+
+def test_jetons_identiques_quelle_que_soit_la_taille_des_blocs():
+    reference = list(iter_tokens(io.StringIO(DUMP), 4096))
+    for chunk_size in (1, 5, 13):
+        assert list(iter_tokens(io.StringIO(DUMP), chunk_size)) == reference
+
+
+def test_apostrophes_doublees_seulement_entre_apostrophes():
+    assert _unescape("l''a", "'") == "l'a"
+    assert _unescape("l''a", '"') == "l''a"
+    assert _unescape('c""d', '"') == 'c"d'
+    assert _unescape('c""d', "'") == 'c""d'
+
+
+def test_dump_du_depot_independant_de_la_taille_des_blocs():
+    reference = list(iter_table_records(SQL_PATH, 'articles'))
+    assert len(reference) == 4590
+    assert list(iter_table_records(SQL_PATH, 'articles', chunk_size=997)) == reference
+
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+@pytest.mark.parametrize("fin, attendu", [
+    ("-- commentaire final", []),
+    ("# commentaire final", []),
+    ("DELIMITER ;", [('delimiter', ';')]),
+])
+def test_dump_termine_sans_saut_de_ligne(chunk_size, fin, attendu):
+    insert = "INSERT INTO `t` (`id`) VALUES (1);\n"
+    reference = list(iter_tokens(io.StringIO(insert), 4096))
+    assert list(iter_tokens(io.StringIO(insert + fin), chunk_size)) == reference + attendu
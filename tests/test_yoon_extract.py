@@ -0,0 +1,29 @@
+import os
+import shutil
+
+from conftest import INSET, RACINE, SQL_PATH
+from yoon_extract import identifiants_textes, iter_articles
+
+ENVIRONNEMENT = "Senegal-Code-2001-environnement.pdf"
+
+
+def test_identifiants_du_dump_puis_a_la_suite():
+    pdfs = [
+        {"path": "a.pdf", "titre": "Code de l'Environnement du Sénégal (2001)"},
+        {"path": "b.pdf", "titre": "Code inconnu"},
+        {"path": "c.pdf", "titre": "Code pénal du Sénégal"},
+        {"path": "d.pdf", "titre": "Autre code"},
+    ]
+    assert identifiants_textes(pdfs, SQL_PATH) == {"a.pdf": 23, "b.pdf": 24, "c.pdf": 16, "d.pdf": 25}
+    assert identifiants_textes(pdfs, "absent.sql") == {"a.pdf": 1, "b.pdf": 2, "c.pdf": 3, "d.pdf": 4}
+
+
+def test_source_pdf_rattachee_au_texte_du_dump(tmp_path, monkeypatch):
+    monkeypatch.chdir(RACINE)
+    shutil.copy(os.path.join(INSET, ENVIRONNEMENT), tmp_path / ENVIRONNEMENT)
+
+    articles = list(iter_articles('pdf', str(tmp_path)))
+    assert articles
+    assert {article['texte_juridique_id'] for article in articles} == {23}
+    assert {article['category'] for article in articles} == {'environnement'}
+    assert [article['position_ordre'] for article in articles] == list(range(1, len(articles) + 1))
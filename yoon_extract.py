@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+yoon-extract : extraction unifiée des articles juridiques
+
+Une source (dump SQL, base MySQL, dossier de PDF) produit les lignes de la
+table articles ; chaque ligne est convertie une seule fois en article de
+l'application puis transmise à toutes les sorties demandées. Le dump n'est
+donc lu qu'une fois, quel que soit le nombre de sorties.
+
+Les petites tables annexes (textes_juridiques, mots-clés et synonymes) sont
+relevées pendant la même lecture et transmises aux sorties qui les
+utilisent (méthode `annexes`).
+
+Exemples :
+    python3 yoon_extract.py --sink json --sink ts
+    python3 yoon_extract.py --source pdf --input inset --workers 0 --sink shards --sink index
+    python3 yoon_extract.py --sink sqlite=/tmp/articles.sqlite
+    python3 yoon_extract.py --source pdf --dedup --sink json
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from article_store import DEFAULT_STORE_PATH, ArticleStoreWriter
+from extract_legal_data_final import construire_article, extract_text_mapping
+from legal_dedup import Deduplicateur
+from legal_fts import ANNEX_COLUMNS, DEFAULT_SQLITE_PATH, SqliteFtsWriter
+from legal_ranking import calculer_statistiques_bm25
+from legal_synonyms import compiler_expansions
+from legal_shards import DEFAULT_SHARDS_DIR, save_shards
+from legal_writers import JsonArticlesWriter, TypeScriptArticlesWriter
+from search_index import construire_index_inverse, save_index
+from sql_dump_reader import iter_insert_statements, iter_table_records
+
+INSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "inset")
+
+# Catégorie de l'application pour chaque domaine des PDF importés par loiv2
+DOMAINE_CATEGORIES = {
+    "Droit pénal": "loi_penale",
+    "Droit civil": "droit_civil",
+    "Droit des assurances": "assurances",
+    "Droit de la famille": "code_famille",
+    "Droit du travail": "droit_travail",
+    "Droit foncier": "foncier",
+    "Droit fiscal": "impots",
+    "Droit de l'environnement": "environnement",
+}
+
+DEFAULT_DUMP = "senegal_juridique.sql"
+
+METADATA = {
+    'extracted_at': "2024-01-01T00:00:00Z",
+    'source': "senegal_juridique.sql",
+    'version': "yoon-extract",
+}
+
+
+def _charger_loiv2():
+    """Importer inset/loiv2.py (dépendances PDF et MySQL chargées à la demande)"""
+    if INSET_DIR not in sys.path:
+        sys.path.insert(0, INSET_DIR)
+    import loiv2
+    return loiv2
+
+
+def texte_de(titre: str, domaine: Optional[str]) -> Dict[str, str]:
+    """Nom et catégorie d'un texte juridique d'après son titre et son domaine"""
+    return {'name': titre, 'category': DOMAINE_CATEGORIES.get(domaine or "", 'droit_civil')}
+
+
+# ================================
+# Sources : produisent des lignes de la table articles
+# ================================
+def source_sql(entree: Optional[str] = None, annexes: Optional[Dict[str, list]] = None,
+               **_options) -> Iterator[Dict[str, Any]]:
+    """Lignes de la table articles du dump phpMyAdmin, lu en flux"""
+    tables = ['articles'] + (list(ANNEX_COLUMNS) if annexes is not None else [])
+    for table, columns, rows in iter_insert_statements(entree or DEFAULT_DUMP, tables):
+        for row in rows:
+            record = dict(zip(columns, row))
+            if table == 'articles':
+                yield record
+            else:
+                annexes.setdefault(table, []).append(record)
+
+
+def source_mysql(entree: Optional[str] = None, annexes: Optional[Dict[str, list]] = None,
+                 **_options) -> Iterator[Dict[str, Any]]:
+    """
+    Lignes de la table articles d'une base MySQL (configuration de loiv2).
+
+    Le nom et la catégorie de chaque texte sont lus dans la table
+    textes_juridiques de la même base : les identifiants attribués par
+    loiv2 ne correspondent pas forcément à ceux du dump.
+    """
+    loiv2 = _charger_loiv2()
+    config = dict(loiv2.DB_CONFIG)
+    if entree:
+        config["database"] = entree
+
+    db = loiv2.StockageMySQL(config).connecter()
+    try:
+        cursor = db.cursor(dictionary=True)
+        cursor.execute("SELECT id, titre, domaine_juridique FROM textes_juridiques")
+        textes = {row['id']: texte_de(row['titre'], row['domaine_juridique']) for row in cursor.fetchall()}
+        # Curseur non tamponné : les articles sont lus au fil de l'itération
+        cursor.execute(
+            "SELECT id, texte_juridique_id, numero_article, titre_article, contenu_article, position_ordre "
+            "FROM articles ORDER BY texte_juridique_id, position_ordre"
+        )
+        for row in cursor:
+            texte_id = row['texte_juridique_id']
+            row['texte'] = textes.get(texte_id) or texte_de(f"Texte {texte_id}", None)
+            yield row
+        if annexes is not None:
+            for table, columns in ANNEX_COLUMNS.items():
+                cursor.execute(f"SELECT {', '.join(columns)} FROM {table}")
+                annexes[table] = cursor.fetchall()
+        cursor.close()
+    finally:
+        db.close()
+
+
+def identifiants_textes(pdfs: List[Dict[str, Any]], dump: str = DEFAULT_DUMP) -> Dict[str, int]:
+    """
+    texte_juridique_id de chaque PDF (par chemin), comme loiv2 l'attribue.
+
+    loiv2 insère une ligne textes_juridiques par PDF, désignée ensuite par
+    son identifiant dans import_manifest. Un PDF dont le titre figure dans
+    textes_juridiques du dump reprend donc cet identifiant ; les autres
+    sont numérotés à la suite, dans l'ordre de `pdfs`. Les fragments et
+    positions d'une extraction PDF sont ainsi ceux de l'extraction SQL.
+    """
+    connus = {}
+    if os.path.exists(dump):
+        connus = {row['titre']: int(row['id']) for row in iter_table_records(dump, 'textes_juridiques')}
+    suivant = max(connus.values(), default=0) + 1
+    identifiants = {}
+    for pdf in pdfs:
+        identifiant = connus.get(pdf["titre"])
+        if identifiant is None:
+            identifiant, suivant = suivant, suivant + 1
+        identifiants[pdf["path"]] = identifiant
+    return identifiants
+
+
+def source_pdf(entree: Optional[str] = None, workers: int = 1, **_options) -> Iterator[Dict[str, Any]]:
+    """Lignes d'articles extraites des PDF d'un dossier (découpage de loiv2)"""
+    loiv2 = _charger_loiv2()
+    dossier = entree or INSET_DIR
+    rangs = {pdf["path"]: rang for rang, pdf in enumerate(loiv2.PDFS)}
+    connus = {pdf["path"]: pdf for pdf in loiv2.PDFS}
+
+    # Ordre d'import de loiv2, puis les PDF qu'il ne connaît pas par nom
+    noms = sorted((nom for nom in os.listdir(dossier) if nom.lower().endswith(".pdf")),
+                  key=lambda nom: (rangs.get(nom, len(rangs)), nom))
+    pdfs = []
+    for nom in noms:
+        pdf = dict(connus.get(nom, {"titre": os.path.splitext(nom)[0], "domaine": ""}))
+        pdf["path"] = os.path.join(dossier, nom)
+        pdfs.append(pdf)
+    texte_ids = identifiants_textes(pdfs)
+
+    for pdf, resultat, erreur in loiv2.iter_extractions(pdfs, workers):
+        if erreur is not None or resultat is None:
+            print(f"⚠️ {pdf['path']} ignoré : {erreur or 'aucun texte extrait'}")
+            continue
+        texte = texte_de(pdf["titre"], pdf["domaine"])
+        identifiant = os.path.splitext(os.path.basename(pdf["path"]))[0]
+        for position, (numero, titre_article, contenu) in enumerate(resultat["lignes"], 1):
+            yield {
+                'id': f"{identifiant}-{position}",
+                'texte_juridique_id': texte_ids[pdf["path"]],
+                'numero_article': numero,
+                'titre_article': titre_article,
+                'contenu_article': contenu,
+                'position_ordre': position,
+                'texte': texte,
+            }
+
+
+SOURCES = {
+    'sql': source_sql,
+    'mysql': source_mysql,
+    'pdf': source_pdf,
+}
+
+
+# ================================
+# Sorties : reçoivent les articles un par un
+# ================================
+class JsonSink:
+    """Fichier JSON {"articles": [...], "metadata": {...}}"""
+    DEFAULT_PATH = "public/legal_articles.json"
+
+    def __init__(self, path: Optional[str] = None):
+        self.writer = JsonArticlesWriter(path or self.DEFAULT_PATH, METADATA)
+
+    def ajouter(self, article: Dict[str, Any]):
+        self.writer.write(article)
+
+    def terminer(self) -> str:
+        self.writer.close()
+        return self.writer.output_path
+
+
+class TypeScriptSink:
+    """Module TypeScript LEGAL_ARTICLES"""
+    DEFAULT_PATH = "src/data/legalArticles.ts"
+
+    def __init__(self, path: Optional[str] = None):
+        self.writer = TypeScriptArticlesWriter(
+            path or self.DEFAULT_PATH,
+            header="Articles juridiques individuels extraits de senegal_juridique.sql\nGénéré par yoon-extract",
+            metadata=METADATA,
+        )
+
+    def ajouter(self, article: Dict[str, Any]):
+        self.writer.write(article)
+
+    def terminer(self) -> str:
+        self.writer.close()
+        return self.writer.output_path
+
+
+class SqliteSink:
+    """Base SQLite avec index plein texte FTS5 et tables annexes (voir legal_fts)"""
+    DEFAULT_PATH = DEFAULT_SQLITE_PATH
+
+    def __init__(self, path: Optional[str] = None):
+        self.writer = SqliteFtsWriter(path or self.DEFAULT_PATH)
+
+    def ajouter(self, article: Dict[str, Any]):
+        self.writer.write(article)
+
+    def annexes(self, tables: Dict[str, list]):
+        for table, rows in tables.items():
+            self.writer.write_annex(table, rows)
+
+    def terminer(self) -> str:
+        return self.writer.close()
+
+
+class ShardsSink:
+    """Un fragment JSON par code et son manifeste (voir legal_shards)"""
+    DEFAULT_PATH = DEFAULT_SHARDS_DIR
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or self.DEFAULT_PATH
+        self.articles = []
+
+    def ajouter(self, article: Dict[str, Any]):
+        self.articles.append(article)
+
+    def terminer(self) -> str:
+        return save_shards(self.articles, self.path, version=METADATA['version'])
+
+
+class IndexSink:
+    """Index inversé de recherche avec statistiques BM25 et table d'expansion"""
+    DEFAULT_PATH = "public/legal_index.json"
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or self.DEFAULT_PATH
+        self.articles = []
+        self.tables = {}
+
+    def ajouter(self, article: Dict[str, Any]):
+        # Seuls l'identifiant et la clé de recherche sont conservés
+        self.articles.append({'id': article['id'], 'search_key': article.get('search_key')})
+
+    def annexes(self, tables: Dict[str, list]):
+        self.tables = tables
+
+    def terminer(self) -> str:
+        index = construire_index_inverse(self.articles)
+        index['bm25'] = calculer_statistiques_bm25(index)
+        if self.tables.get('mots_cles_juridiques'):
+            index['expansions'] = compiler_expansions(
+                self.tables['mots_cles_juridiques'], self.tables.get('mots_cles_synonymes', []))
+        return save_index(index, self.path)
+
+
+class StoreSink:
+    """Magasin binaire compact lu par mmap (voir article_store)"""
+    DEFAULT_PATH = DEFAULT_STORE_PATH
+
+    def __init__(self, path: Optional[str] = None):
+        self.writer = ArticleStoreWriter(path or self.DEFAULT_PATH)
+
+    def ajouter(self, article: Dict[str, Any]):
+        self.writer.write(article)
+
+    def terminer(self) -> str:
+        return self.writer.close()
+
+
+SINKS = {
+    'json': JsonSink,
+    'ts': TypeScriptSink,
+    'sqlite': SqliteSink,
+    'shards': ShardsSink,
+    'index': IndexSink,
+    'store': StoreSink,
+}
+
+
+# ================================
+# Pipeline
+# ================================
+def iter_articles(source: str, entree: Optional[str] = None, **options) -> Iterator[Dict[str, Any]]:
+    """Convertir les lignes d'une source en articles de l'application"""
+    text_mapping = extract_text_mapping()
+    for row in SOURCES[source](entree, **options):
+        try:
+            yield construire_article(row, text_mapping)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"⚠️ Erreur lors du parsing d'un article: {e}")
+
+
+def executer(source: str, sinks: List[Any], entree: Optional[str] = None,
+             deduplicateur: Optional[Deduplicateur] = None, **options):
+    """Lire la source une seule fois et transmettre chaque article à toutes les sorties"""
+    # Les tables annexes ne sont relevées que si une sortie les utilise
+    annexes = {} if any(hasattr(sink, 'annexes') for sink in sinks) else None
+    articles = iter_articles(source, entree, annexes=annexes, **options)
+    if deduplicateur is not None:
+        articles = deduplicateur.filtrer(articles)
+    total = 0
+    for article in articles:
+        for sink in sinks:
+            sink.ajouter(article)
+        total += 1
+    for sink in sinks:
+        if annexes and hasattr(sink, 'annexes'):
+            sink.annexes(annexes)
+    return total, [sink.terminer() for sink in sinks]
+
+
+def parse_sink(spec: str):
+    """Interpréter `nom` ou `nom=chemin`"""
+    nom, _, chemin = spec.partition('=')
+    if nom not in SINKS:
+        raise argparse.ArgumentTypeError(f"sortie inconnue : {nom} (choix : {', '.join(SINKS)})")
+    return nom, chemin or None
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="yoon-extract",
+        description="Extraire les articles juridiques d'une source vers une ou plusieurs sorties",
+    )
+    parser.add_argument("--source", choices=sorted(SOURCES), default="sql",
+                        help="Source des articles (défaut : sql)")
+    parser.add_argument("--input", dest="entree",
+                        help="Dump SQL, nom de la base MySQL ou dossier de PDF selon la source")
+    parser.add_argument("--sink", dest="sinks", action="append", type=parse_sink,
+                        help=f"Sortie à produire, répétable : {', '.join(SINKS)} (éventuellement nom=chemin)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Processus d'extraction pour la source pdf (0 = nombre de CPU)")
+    parser.add_argument("--dedup", action="store_true",
+                        help="Écarter les doublons exacts et quasi-doublons avant les sorties")
+    args = parser.parse_args(argv)
+    if not args.sinks:
+        args.sinks = [('json', None), ('ts', None)]
+    if args.workers == 0:
+        args.workers = os.cpu_count() or 1
+    return args
+
+
+def main(argv=None):
+    args = parse_arguments(argv)
+    print(f"🚀 Extraction depuis la source « {args.source} » vers : {', '.join(nom for nom, _ in args.sinks)}")
+
+    debut = time.time()
+    sinks = [SINKS[nom](chemin) for nom, chemin in args.sinks]
+    deduplicateur = Deduplicateur() if args.dedup else None
+    total, fichiers = executer(args.source, sinks, args.entree, deduplicateur, workers=args.workers)
+    duree = time.time() - debut
+
+    print(f"📊 {total} articles traités en {duree:.1f}s")
+    if deduplicateur is not None:
+        print(f"🧹 {deduplicateur.resume()}")
+    for (nom, _chemin), fichier in zip(args.sinks, fichiers):
+        print(f"📁 {nom} : {fichier}")
+
+
+if __name__ == "__main__":
+    main()